@@ -15,6 +15,7 @@ from pathlib import Path
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+import json
 import os
 from dotenv import load_dotenv
 load_dotenv()
@@ -139,11 +140,89 @@ MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
 AUTH_USER_MODEL = 'users.User'
 
+# Trained career prediction models are stored here as versioned artifacts
+ML_MODEL_DIR = os.getenv('ML_MODEL_DIR', os.path.join(BASE_DIR, 'ml', 'models'))
+# Model versions kept on disk, counting the active one. Older artifacts are
+# deleted whenever a new model is activated.
+ML_KEEP_ARTIFACTS = int(os.getenv('ML_KEEP_ARTIFACTS', 3))
+
+# Estimator backend for career prediction (see users/estimators.py):
+# random_forest, logistic_regression, naive_bayes, nearest_neighbors or
+# skill_similarity (inverted-index weighted Jaccard matching).
+# ML_ESTIMATOR_PARAMS is a JSON object of constructor overrides.
+ML_ESTIMATOR = os.getenv('ML_ESTIMATOR', 'random_forest')
+ML_ESTIMATOR_PARAMS = json.loads(os.getenv('ML_ESTIMATOR_PARAMS', '{}'))
+# Also train on degree and CGPA (career_data.csv columns / the user's latest Education).
+# skill_similarity ignores it: it only compares skill sets
+ML_EDUCATION_FEATURES = os.getenv('ML_EDUCATION_FEATURES', 'False').lower() in ('1', 'true', 'yes')
+# Cores used to fit the model (-1 = all). Training runs inside the web
+# process, so leave some for serving requests.
+ML_TRAINING_JOBS = int(os.getenv('ML_TRAINING_JOBS', 1))
+# A queued or running training job whose process stopped heartbeating for this
+# long (e.g. the worker was restarted mid-fit) is marked failed, so it no
+# longer blocks uploading the same dataset again.
+ML_TRAINING_JOB_STALE_SECONDS = int(os.getenv('ML_TRAINING_JOB_STALE_SECONDS', 300))
+# Encoded training features are cached here by dataset content hash, so a
+# retrain with new hyperparameters skips parsing and encoding. Keeps the most
+# recent ML_FEATURE_CACHE_SIZE datasets; 0 disables the cache.
+ML_FEATURE_CACHE_DIR = os.getenv('ML_FEATURE_CACHE_DIR', os.path.join(ML_MODEL_DIR, 'features'))
+ML_FEATURE_CACHE_SIZE = int(os.getenv('ML_FEATURE_CACHE_SIZE', 3))
+# Load the active model and run a few dummy predictions when the app starts.
+# With gunicorn --preload this happens once in the master before workers fork.
+ML_WARMUP_ON_STARTUP = os.getenv('ML_WARMUP_ON_STARTUP', 'False').lower() in ('1', 'true', 'yes')
+# Warmup only runs in processes recognised as servers (gunicorn, uvicorn,
+# daphne, hypercorn, uwsgi, runserver). Set this for other servers, e.g. mod_wsgi.
+ML_SERVES_REQUESTS = os.getenv('ML_SERVES_REQUESTS', 'False').lower() in ('1', 'true', 'yes')
+
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    # predict_roles output keyed by model version + skill-set fingerprint.
+    # LocMemCache evicts least recently used entries once MAX_ENTRIES is hit.
+    'predictions': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'career-predictions',
+        'TIMEOUT': int(os.getenv('PREDICTION_CACHE_TTL', 60 * 60)),
+        'OPTIONS': {
+            'MAX_ENTRIES': int(os.getenv('PREDICTION_CACHE_SIZE', 10000)),
+        },
+    },
+    # Serialized GET /api/profile/ snapshots keyed by user + profile_version;
+    # a write bumps the version, so stale entries are never read again and
+    # just age out.
+    'profiles': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'user-profiles',
+        'TIMEOUT': int(os.getenv('PROFILE_CACHE_TTL', 24 * 60 * 60)),
+        'OPTIONS': {
+            'MAX_ENTRIES': int(os.getenv('PROFILE_CACHE_SIZE', 5000)),
+        },
+    },
+}
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'rest_framework_simplejwt.authentication.JWTAuthentication',
-    )
+    ),
 }
+# Default page size and upper bound for ?page_size= on the cursor-paginated
+# lists (users/pagination.py)
+API_PAGE_SIZE = int(os.getenv('API_PAGE_SIZE', 50))
+API_MAX_PAGE_SIZE = int(os.getenv('API_MAX_PAGE_SIZE', 200))
+
+# Live support ticket streams (Server-Sent Events, served over ASGI only).
+# The broadcaster fans new messages out to open streams; the in-process one
+# only reaches streams in the same worker process.
+SUPPORT_BROADCASTER = os.getenv('SUPPORT_BROADCASTER', 'users.broadcast.InProcessBroadcaster')
+SSE_HEARTBEAT_SECONDS = int(os.getenv('SSE_HEARTBEAT_SECONDS', 15))
+# Streams end after this long; EventSource reconnects with Last-Event-ID
+SSE_MAX_STREAM_SECONDS = int(os.getenv('SSE_MAX_STREAM_SECONDS', 300))
+# Lifetime of the stream tokens EventSource puts in the URL (support/stream-token/)
+SSE_TOKEN_MAX_AGE = int(os.getenv('SSE_TOKEN_MAX_AGE', 60))
 
 
 
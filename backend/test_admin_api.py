@@ -28,17 +28,21 @@ def test_admin_api():
         print(f"Login error: {e}")
         return
 
-    # 2. Fetch Users
+    # 2. Fetch Users (cursor-paginated: follow `next` until every page is read)
     print("Fetching users...")
     users_url = f"{BASE_URL}/users/"
-    req = urllib.request.Request(users_url, headers={'Authorization': f'Bearer {access_token}'})
+    users = []
     
     try:
-        with urllib.request.urlopen(req) as response:
-            resp_body = response.read().decode('utf-8')
-            users = json.loads(resp_body)
-            print(f"Success! Found {len(users)} users.")
-            print(json.dumps(users, indent=2))
+        while users_url:
+            req = urllib.request.Request(users_url, headers={'Authorization': f'Bearer {access_token}'})
+            with urllib.request.urlopen(req) as response:
+                resp_body = response.read().decode('utf-8')
+                page = json.loads(resp_body)
+            users.extend(page['results'])
+            users_url = page['next']
+        print(f"Success! Found {len(users)} users.")
+        print(json.dumps(users, indent=2))
     except urllib.error.HTTPError as e:
         print(f"Fetch failed: {e.code} {e.read().decode()}")
     except Exception as e:
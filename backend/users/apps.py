@@ -1,5 +1,64 @@
+import os
+import sys
+
 from django.apps import AppConfig
+from django.conf import settings
+from django.core.signals import request_started
+
+
+# Executables that only ever run a web server
+SERVER_ENTRYPOINTS = ('gunicorn', 'uvicorn', 'daphne', 'hypercorn', 'uwsgi')
+
+
+def serves_requests():
+    """
+    True only for processes known to handle requests: the servers above,
+    runserver's serving child, or any process when ML_SERVES_REQUESTS is set
+    (for servers that can't be told apart by argv, such as mod_wsgi).
+    Management commands, shells, test runners and unknown scripts get False.
+    """
+    if settings.ML_SERVES_REQUESTS:
+        return True
+    program = os.path.basename(sys.argv[0])
+    if program == '__main__.py':
+        # python -m gunicorn and friends
+        program = os.path.basename(os.path.dirname(sys.argv[0]))
+    if program in SERVER_ENTRYPOINTS:
+        return True
+    if sys.argv[1:2] != ['runserver']:
+        return False
+    # Skip runserver's autoreloader parent, which never handles a request
+    return os.environ.get('RUN_MAIN') == 'true' or '--noreload' in sys.argv
+
+
+def fail_orphaned_training_jobs(**kwargs):
+    """
+    Runs once, on the first request this process handles: jobs left queued or
+    running by a process that died are marked failed. Done here rather than in
+    ready() because Django discourages queries during app initialization.
+    """
+    request_started.disconnect(dispatch_uid='fail_orphaned_training_jobs')
+    from .training import fail_stale_jobs
+    try:
+        fail_stale_jobs()
+    except Exception as e:
+        print(f"Could not check for orphaned training jobs: {e}")
 
 
 class UsersConfig(AppConfig):
     name = 'users'
+
+    def ready(self):
+        # Keeps the dashboard counters current
+        from . import signals  # noqa: F401
+
+        request_started.connect(fail_orphaned_training_jobs, dispatch_uid='fail_orphaned_training_jobs')
+
+        if settings.ML_WARMUP_ON_STARTUP and serves_requests():
+            from .model_registry import registry
+            try:
+                predictor = registry.warmup()
+                print(f"Model warmup finished: version {predictor.version} in {registry.warmup_seconds:.2f}s")
+            except Exception as e:
+                # Stay up; the readiness endpoint reports the model as not loaded
+                print(f"Model warmup failed: {e}")
@@ -0,0 +1,113 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+
+def time_calls(fn, args_list):
+    """
+    Call `fn(*args)` for each entry of `args_list` and return per-call seconds.
+    """
+    samples = []
+    for args in args_list:
+        started = time.perf_counter()
+        fn(*args)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def batch_timings(score_fns, X, repeats=3):
+    """
+    Best-of-`repeats` seconds for each {name: fn} to score every row of `X` in
+    one call, as the bulk recompute does.
+    """
+    timings = {}
+    for name, fn in score_fns.items():
+        timings[name] = min(time_calls(fn, [(X,)] * repeats))
+    return timings
+
+
+def latency_summary(samples):
+    """
+    p50/p99/mean of a list of durations, in milliseconds.
+    """
+    samples_ms = np.asarray(samples) * 1000.0
+    return {
+        'p50_ms': round(float(np.percentile(samples_ms, 50)), 4),
+        'p99_ms': round(float(np.percentile(samples_ms, 99)), 4),
+        'mean_ms': round(float(samples_ms.mean()), 4),
+    }
+
+
+def random_skill_rows(n_features, n_rows, max_skills, seed=0):
+    """
+    Random sorted column lists, 1..max_skills active columns per row.
+    """
+    rng = np.random.default_rng(seed)
+    max_skills = max(1, min(max_skills, n_features))
+    return [
+        np.sort(rng.choice(n_features, size=rng.integers(1, max_skills + 1), replace=False)).astype(np.int32)
+        for _ in range(n_rows)
+    ]
+
+
+def current_rss_mb():
+    """
+    Resident set size of this process in MB (Linux only, None elsewhere).
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+
+
+def peak_rss_mb():
+    """
+    High-water RSS of this process in MB, or None where `resource` is unavailable.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def path_size_bytes(path):
+    """
+    Size of a file, or of every file under a directory.
+    """
+    if not os.path.isdir(path):
+        return os.path.getsize(path)
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, files in os.walk(path)
+        for name in files
+    )
+
+
+def process_memory_mb(pid='self'):
+    """
+    RSS, PSS and private memory of a process in MB from /proc/<pid>/smaps_rollup
+    (Linux only, None elsewhere). PSS splits shared pages between the processes
+    mapping them, so summing it over workers gives their real combined footprint.
+    """
+    try:
+        with open(f'/proc/{pid}/smaps_rollup') as f:
+            fields = {}
+            for line in f:
+                parts = line.split()
+                if len(parts) >= 2 and parts[0].endswith(':') and parts[1].isdigit():
+                    fields[parts[0][:-1]] = int(parts[1]) / 1024
+    except OSError:
+        return None
+    return {
+        'rss_mb': round(fields.get('Rss', 0.0), 1),
+        'pss_mb': round(fields.get('Pss', 0.0), 1),
+        'shared_mb': round(fields.get('Shared_Clean', 0.0) + fields.get('Shared_Dirty', 0.0), 1),
+        'private_mb': round(fields.get('Private_Clean', 0.0) + fields.get('Private_Dirty', 0.0), 1),
+    }
@@ -0,0 +1,93 @@
+import asyncio
+import threading
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+# Per-subscriber backlog; a subscriber that falls further behind just gets
+# a wake-up, the stream re-reads new rows from the database anyway
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+class InProcessBroadcaster:
+    """
+    Fan-out of small events to asyncio subscribers in this process.
+
+    publish() may be called from any thread (sync views run in worker
+    threads under ASGI); each event is handed to the subscriber's own event
+    loop. Only reaches streams served by the same process: with several
+    workers, swap in a shared implementation with the same subscribe /
+    unsubscribe / publish methods via settings.SUPPORT_BROADCASTER.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = {}  # channel -> {queue: loop}
+
+    def subscribe(self, channel):
+        """
+        New asyncio.Queue receiving the channel's events. Call from the
+        consuming event loop and unsubscribe when done.
+        """
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        with self._lock:
+            self._subscribers.setdefault(channel, {})[queue] = asyncio.get_running_loop()
+        return queue
+
+    def unsubscribe(self, channel, queue):
+        with self._lock:
+            subscribers = self._subscribers.get(channel, {})
+            subscribers.pop(queue, None)
+            if not subscribers:
+                self._subscribers.pop(channel, None)
+
+    def publish(self, channel, event):
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, {}).items())
+        for queue, loop in subscribers:
+            try:
+                loop.call_soon_threadsafe(self._deliver, queue, event)
+            except RuntimeError:
+                # Loop already closed; its stream is gone
+                self.unsubscribe(channel, queue)
+
+    @staticmethod
+    def _deliver(queue, event):
+        if queue.full():
+            return
+        queue.put_nowait(event)
+
+
+_broadcaster = None
+_broadcaster_lock = threading.Lock()
+
+
+def get_broadcaster():
+    """
+    Process-wide broadcaster, the class named by settings.SUPPORT_BROADCASTER.
+    """
+    global _broadcaster
+    if _broadcaster is None:
+        with _broadcaster_lock:
+            if _broadcaster is None:
+                _broadcaster = import_string(settings.SUPPORT_BROADCASTER)()
+    return _broadcaster
+
+
+# Channels for live support ticket messages (users/stream_views.py)
+SUPPORT_INBOX_CHANNEL = 'support:inbox'
+
+
+def ticket_channel(ticket_id):
+    return f'support:ticket:{ticket_id}'
+
+
+def publish_ticket_message(message):
+    """
+    Wake the streams watching the message's ticket and the admin inbox. Run
+    it on commit: streams read the new rows from the database.
+    """
+    event = {'ticket': message.ticket_id, 'id': message.pk}
+    broadcaster = get_broadcaster()
+    broadcaster.publish(ticket_channel(message.ticket_id), event)
+    broadcaster.publish(SUPPORT_INBOX_CHANNEL, event)
@@ -0,0 +1,91 @@
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+
+from .models import CareerPrediction, Feedback, StatCounter, User
+
+# Counter names
+USERS = 'users'
+PREDICTIONS = 'predictions'
+FLAGGED_PREDICTIONS = 'predictions.flagged'
+FEEDBACK = 'feedback'
+FEEDBACK_RATING_SUM = 'feedback.rating_sum'
+ROLE_PREFIX = 'predictions.role:'
+
+TOTALS = (USERS, PREDICTIONS, FLAGGED_PREDICTIONS, FEEDBACK, FEEDBACK_RATING_SUM)
+
+
+def role_counter(role):
+    return ROLE_PREFIX + role
+
+
+def add_to_counters(deltas):
+    """
+    Apply {counter name: delta} as atomic `value = value + delta` updates,
+    creating counters that don't exist yet. Runs inside the caller's
+    transaction when there is one, so counters commit or roll back with the
+    rows they describe.
+    """
+    deltas = {name: delta for name, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    with transaction.atomic():
+        missing = []
+        # Sorted so concurrent writers lock counter rows in the same order
+        for name in sorted(deltas):
+            if not StatCounter.objects.filter(name=name).update(value=F('value') + deltas[name]):
+                missing.append(name)
+        if missing:
+            StatCounter.objects.bulk_create([StatCounter(name=name) for name in missing], ignore_conflicts=True)
+            for name in missing:
+                StatCounter.objects.filter(name=name).update(value=F('value') + deltas[name])
+
+
+def count_from_tables():
+    """
+    Counter values recomputed with full-table aggregates.
+    """
+    predictions = CareerPrediction.objects.aggregate(
+        total=Count('id'), flagged=Count('id', filter=Q(is_flagged=True)),
+    )
+    feedback = Feedback.objects.aggregate(total=Count('id'), rating_sum=Sum('rating'))
+    values = {
+        USERS: User.objects.count(),
+        PREDICTIONS: predictions['total'],
+        FLAGGED_PREDICTIONS: predictions['flagged'],
+        FEEDBACK: feedback['total'],
+        FEEDBACK_RATING_SUM: feedback['rating_sum'] or 0,
+    }
+    for row in CareerPrediction.objects.values('predicted_role').annotate(count=Count('id')):
+        values[role_counter(row['predicted_role'])] = row['count']
+    return values
+
+
+def rebuild_counters():
+    """
+    Replace every counter with freshly aggregated values.
+    """
+    with transaction.atomic():
+        values = count_from_tables()
+        StatCounter.objects.all().delete()
+        StatCounter.objects.bulk_create([StatCounter(name=name, value=value) for name, value in values.items()])
+    return values
+
+
+def dashboard_counters(top_roles=5):
+    """
+    What the admin dashboard shows, read from the counters in two indexed
+    queries however large the underlying tables are.
+    """
+    totals = dict(StatCounter.objects.filter(name__in=TOTALS).values_list('name', 'value'))
+    roles = StatCounter.objects.filter(name__startswith=ROLE_PREFIX, value__gt=0)\
+        .order_by('-value', 'name').values_list('name', 'value')[:top_roles]
+
+    feedback_count = totals.get(FEEDBACK, 0)
+    return {
+        'total_users': totals.get(USERS, 0),
+        'total_predictions': totals.get(PREDICTIONS, 0),
+        'flagged_count': totals.get(FLAGGED_PREDICTIONS, 0),
+        'feedback_count': feedback_count,
+        'average_rating': round(totals.get(FEEDBACK_RATING_SUM, 0) / feedback_count, 2) if feedback_count else None,
+        'top_roles': [{'predicted_role': name[len(ROLE_PREFIX):], 'count': value} for name, value in roles],
+    }
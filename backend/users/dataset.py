@@ -0,0 +1,209 @@
+import csv
+import hashlib
+from contextlib import nullcontext
+
+import numpy as np
+
+REQUIRED_COLUMNS = ('skills', 'job_role')
+MIN_DATASET_ROWS = 5
+# Row-level problems reported back to the uploader; the rest are only counted
+MAX_REPORTED_ERRORS = 50
+# Valid rows buffered before they are checked for duplicates and written
+DEDUPE_CHUNK_ROWS = 4096
+
+
+class DatasetValidationError(ValueError):
+    def __init__(self, message, report=None):
+        super().__init__(message)
+        self.report = report or {}
+
+
+def normalize_skills(value):
+    """
+    Lowercase, trim and de-duplicate a comma separated skills cell, keeping order.
+    """
+    skills = (s.strip() for s in value.lower().split(','))
+    return ','.join(dict.fromkeys(s for s in skills if s))
+
+
+def canonical_row_digest(header, row):
+    """
+    16-byte digest of a normalized row that ignores column order.
+    """
+    canonical = '\x1f'.join(f"{name}\x1e{value}" for name, value in sorted(zip(header, row)))
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).digest()
+
+
+class FingerprintStore:
+    """
+    Set of 64-bit row fingerprints kept as sorted uint64 runs, so each one
+    costs 8 bytes instead of a Python int in a set (60-70 bytes). A new chunk
+    is merged into the last run while that run is no bigger, like a binary
+    counter: there are at most log2(n) runs and each fingerprint is copied
+    O(log n) times. A merge briefly needs a second copy of the runs it joins.
+    """
+    def __init__(self):
+        self.runs = []
+
+    def __len__(self):
+        return sum(len(run) for run in self.runs)
+
+    def contains(self, fingerprints):
+        """
+        Boolean mask of which `fingerprints` (a uint64 array) are in the store.
+        """
+        found = np.zeros(len(fingerprints), dtype=bool)
+        for run in self.runs:
+            idx = np.minimum(np.searchsorted(run, fingerprints), len(run) - 1)
+            found |= run[idx] == fingerprints
+        return found
+
+    def add(self, fingerprints):
+        run = np.sort(np.asarray(fingerprints, dtype=np.uint64))
+        while self.runs and len(self.runs[-1]) <= len(run):
+            run = np.sort(np.concatenate((self.runs.pop(), run)), kind='stable')
+        self.runs.append(run)
+
+
+def _content_hash(header, digest_sum, n_rows):
+    # Row digests are summed, so neither row nor column order changes the hash
+    summary = f"{'|'.join(sorted(header))}\x1d{digest_sum:032x}\x1d{n_rows}"
+    return hashlib.blake2b(summary.encode('utf-8'), digest_size=32).hexdigest()
+
+
+def _decoded_lines(uploaded_file):
+    # File.__iter__ yields one line at a time (line endings kept), so quoted
+    # multi-line cells still parse and the upload is never read in full.
+    for line in uploaded_file:
+        yield line.decode('utf-8') if isinstance(line, bytes) else line
+
+
+def ingest_training_csv(uploaded_file, dest_path, max_errors=MAX_REPORTED_ERRORS):
+    """
+    Stream an uploaded training CSV into its canonical form at `dest_path`.
+
+    Headers are lowercased, skills are normalized with `normalize_skills`, and
+    exact duplicate rows are dropped. Rows with a missing skill list or job role
+    are skipped and reported (up to `max_errors` of them). At most
+    DEDUPE_CHUNK_ROWS rows are held in memory at a time, plus an 8-byte
+    fingerprint per written row in a FingerprintStore for de-duplication.
+
+    The report's `content_hash` identifies the canonical dataset: re-uploads
+    that only differ in row or column order, duplicates, whitespace or skill
+    casing hash the same. Pass `dest_path=None` to only validate and hash.
+
+    Returns a report dict; raises DatasetValidationError if the file is unusable.
+    """
+    report = {
+        'rows_read': 0,
+        'rows_written': 0,
+        'duplicates_skipped': 0,
+        'error_count': 0,
+        'errors': [],
+        'errors_truncated': False,
+        'content_hash': None,
+    }
+
+    def add_error(line, message):
+        report['error_count'] += 1
+        if len(report['errors']) < max_errors:
+            report['errors'].append({'line': line, 'error': message})
+        else:
+            report['errors_truncated'] = True
+
+    reader = csv.reader(_decoded_lines(uploaded_file))
+    try:
+        header = next(reader)
+    except StopIteration:
+        raise DatasetValidationError("Uploaded file is empty.", report)
+    except UnicodeDecodeError:
+        raise DatasetValidationError("File must be UTF-8 encoded.", report)
+
+    header = [c.strip().lstrip('\ufeff').lower() for c in header]
+    missing = [c for c in REQUIRED_COLUMNS if c not in header]
+    if missing:
+        raise DatasetValidationError(
+            "Invalid CSV format. Required columns: 'skills', 'job_role'", report
+        )
+    skills_idx = header.index('skills')
+    role_idx = header.index('job_role')
+
+    seen = FingerprintStore()
+    digest_sum = 0
+    pending = [] # (fingerprint, digest, row) of valid rows not yet checked
+    output = open(dest_path, 'w', newline='', encoding='utf-8') if dest_path else nullcontext()
+    with output as destination:
+        writer = csv.writer(destination) if destination else None
+        if writer:
+            writer.writerow(header)
+
+        def flush():
+            # Duplicates of earlier chunks are found with one vectorized lookup,
+            # duplicates within the chunk with a set of its fingerprints
+            nonlocal digest_sum
+            fingerprints = np.fromiter((fp for fp, _, _ in pending), dtype=np.uint64, count=len(pending))
+            known = seen.contains(fingerprints)
+            in_chunk = set()
+            for (fingerprint, digest, row), duplicate in zip(pending, known):
+                if duplicate or fingerprint in in_chunk:
+                    report['duplicates_skipped'] += 1
+                    continue
+                in_chunk.add(fingerprint)
+                digest_sum = (digest_sum + int.from_bytes(digest, 'big')) % (1 << 128)
+                if writer:
+                    writer.writerow(row)
+                report['rows_written'] += 1
+            if in_chunk:
+                seen.add(np.fromiter(in_chunk, dtype=np.uint64, count=len(in_chunk)))
+            pending.clear()
+
+        try:
+            for row in reader:
+                line = reader.line_num
+                if not any(cell.strip() for cell in row):
+                    continue # Blank line
+                report['rows_read'] += 1
+
+                if len(row) != len(header):
+                    add_error(line, f"Expected {len(header)} columns, found {len(row)}.")
+                    continue
+
+                row = [cell.strip() for cell in row]
+                row[skills_idx] = normalize_skills(row[skills_idx])
+                if not row[skills_idx]:
+                    add_error(line, "Missing skills.")
+                    continue
+                if not row[role_idx]:
+                    add_error(line, "Missing job_role.")
+                    continue
+
+                digest = canonical_row_digest(header, row)
+                pending.append((int.from_bytes(digest[:8], 'big'), digest, row))
+                if len(pending) >= DEDUPE_CHUNK_ROWS:
+                    flush()
+            if pending:
+                flush()
+        except UnicodeDecodeError:
+            raise DatasetValidationError(f"File must be UTF-8 encoded (line {reader.line_num + 1}).", report)
+        except csv.Error as e:
+            raise DatasetValidationError(f"Malformed CSV at line {reader.line_num}: {e}", report)
+
+    if report['rows_written'] < MIN_DATASET_ROWS:
+        raise DatasetValidationError(
+            f"Dataset too small. Please provide at least {MIN_DATASET_ROWS} valid records.", report
+        )
+
+    report['content_hash'] = _content_hash(header, digest_sum, report['rows_written'])
+    return report
+
+
+def dataset_content_hash(path):
+    """
+    `content_hash` of a training CSV already on disk, or None if it isn't a
+    usable dataset.
+    """
+    try:
+        with open(path, 'rb') as f:
+            return ingest_training_csv(f, None)['content_hash']
+    except (OSError, DatasetValidationError):
+        return None
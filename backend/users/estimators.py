@@ -0,0 +1,237 @@
+import os
+from contextlib import contextmanager
+
+import joblib
+from django.conf import settings
+
+from .forest_engine import FlatForest
+
+# Fitted scikit-learn estimator inside a model artifact directory
+MODEL_FILE = 'model.joblib'
+
+
+class EstimatorBackend:
+    """
+    Wraps a scikit-learn classifier behind the interface CareerPredictor uses.
+
+    Subclasses set `name` and `default_params` and implement `build()`.
+    Inputs are CSR matrices from SkillEncoder; outputs are class probabilities
+    with columns in `classes_` order.
+    """
+    name = None
+    default_params = {}
+    # Whether fit() can use several cores via the estimator's n_jobs
+    parallel_fit = False
+    # Whether degree/CGPA columns are appended when ML_EDUCATION_FEATURES is on
+    uses_education = True
+
+    def __init__(self, **params):
+        self.params = {**self.default_params, **params}
+        self.model = None
+
+    def build(self, n_samples):
+        raise NotImplementedError
+
+    def fit(self, X, y, n_jobs=None):
+        self.model = self.build(X.shape[0])
+        parallel = self.parallel_fit and n_jobs is not None
+        if parallel:
+            self.model.set_params(n_jobs=n_jobs)
+        self.model.fit(X, y)
+        if parallel:
+            # Parallelism is a property of the training run, not of the saved model
+            self.model.set_params(n_jobs=self.params.get('n_jobs'))
+        self.prepare()
+        return self
+
+    def prepare(self):
+        """
+        Hook run after fitting or loading; derive any serving-side structures here.
+        """
+
+    def save(self, directory):
+        """
+        Write the fitted model into the artifact directory.
+        """
+        # Uncompressed, so its arrays can be memory-mapped on load
+        joblib.dump(self.model, os.path.join(directory, MODEL_FILE))
+
+    def load(self, directory, mmap=True):
+        """
+        Restore the model written by `save`. With `mmap` joblib maps its NumPy
+        arrays read-only instead of copying them, so workers loading the same
+        artifact share those pages.
+        """
+        self.model = joblib.load(os.path.join(directory, MODEL_FILE), mmap_mode='r' if mmap else None)
+        self.prepare()
+
+    def get_model(self):
+        """
+        The fitted scikit-learn estimator.
+        """
+        return self.model
+
+    @contextmanager
+    def batch_scoring(self):
+        """
+        Wrap long runs of large batches (the bulk recompute) in this. Backends
+        that serve from a lighter structure may load something faster for the
+        duration and release it afterwards.
+        """
+        yield self
+
+    @property
+    def classes_(self):
+        return self.model.classes_
+
+    def predict_proba(self, X):
+        return self.model.predict_proba(X)
+
+    def predict_proba_row(self, X_row):
+        return self.predict_proba(X_row)[0]
+
+
+class RandomForestBackend(EstimatorBackend):
+    name = 'random_forest'
+    default_params = {'n_estimators': 100, 'random_state': 42}
+    # Trees are fitted in threads that share the feature matrix
+    parallel_fit = True
+
+    def build(self, n_samples):
+        from sklearn.ensemble import RandomForestClassifier
+        return RandomForestClassifier(**self.params)
+
+    def __init__(self, **params):
+        super().__init__(**params)
+        self.engine = None
+        self.directory = None
+        # sklearn forest held only inside batch_scoring()
+        self._batch_model = None
+
+    def prepare(self):
+        # Array-backed copy of the forest for single users and small batches
+        self.engine = FlatForest.from_sklearn(self.model)
+
+    def save(self, directory):
+        super().save(directory)
+        self.engine.save(directory)
+
+    def load(self, directory, mmap=True):
+        # sklearn's trees copy their nodes into private buffers when unpickled,
+        # so serve from the flat arrays alone and leave the forest on disk
+        self.engine = FlatForest.load(directory, mmap=mmap)
+        self.model = None
+        self.directory = directory
+
+    def get_model(self):
+        """
+        The sklearn forest, for tooling such as benchmark_forest_engine. A
+        loaded artifact reads it from disk on every call and never keeps it:
+        an unpickled forest is a private copy in each worker.
+        """
+        if self.model is not None:
+            return self.model
+        return joblib.load(os.path.join(self.directory, MODEL_FILE))
+
+    @contextmanager
+    def batch_scoring(self):
+        """
+        sklearn's compiled tree walk is about 10x faster than FlatForest's
+        numpy one on big batches, so the forest is loaded for the duration
+        and dropped afterwards. It is a private copy in this worker; only the
+        single background job runner should hold it.
+        """
+        self._batch_model = self.get_model()
+        try:
+            yield self
+        finally:
+            self._batch_model = None
+
+    @property
+    def classes_(self):
+        return self.engine.classes_
+
+    def predict_proba(self, X):
+        batch_model = self._batch_model
+        if batch_model is not None:
+            return batch_model.predict_proba(X)
+        # Outside batch_scoring() requests go through the shared,
+        # memory-mapped arrays, scored in bounded row chunks
+        return self.engine.predict_proba(X)
+
+    def predict_proba_row(self, X_row):
+        return self.engine.predict_proba_row(X_row.indices, X_row.data)
+
+
+class LogisticRegressionBackend(EstimatorBackend):
+    name = 'logistic_regression'
+    default_params = {'C': 1.0, 'max_iter': 1000}
+
+    def build(self, n_samples):
+        from sklearn.linear_model import LogisticRegression
+        return LogisticRegression(**self.params)
+
+
+class NaiveBayesBackend(EstimatorBackend):
+    name = 'naive_bayes'
+    default_params = {'alpha': 1.0}
+
+    def build(self, n_samples):
+        # Bernoulli NB models exactly our binary has-skill features
+        from sklearn.naive_bayes import BernoulliNB
+        return BernoulliNB(**self.params)
+
+
+class NearestNeighborsBackend(EstimatorBackend):
+    name = 'nearest_neighbors'
+    default_params = {'n_neighbors': 5, 'metric': 'cosine', 'algorithm': 'brute', 'weights': 'distance'}
+
+    def build(self, n_samples):
+        from sklearn.neighbors import KNeighborsClassifier
+        params = dict(self.params)
+        params['n_neighbors'] = max(1, min(params['n_neighbors'], n_samples))
+        return KNeighborsClassifier(**params)
+
+
+class SkillSimilarityBackend(EstimatorBackend):
+    """
+    Inverted-index weighted Jaccard matching; match_percentage is the overlap
+    with the closest training profile rather than a class probability.
+    """
+    name = 'skill_similarity'
+    # Education columns would be indexed and weighted as if they were skills
+    uses_education = False
+
+    def build(self, n_samples):
+        from .similarity import SkillIndexMatcher
+        return SkillIndexMatcher(**self.params)
+
+    def predict_proba_row(self, X_row):
+        return self.model.score_row(X_row.indices)
+
+
+ESTIMATOR_BACKENDS = {
+    backend.name: backend
+    for backend in (
+        RandomForestBackend,
+        LogisticRegressionBackend,
+        NaiveBayesBackend,
+        NearestNeighborsBackend,
+        SkillSimilarityBackend,
+    )
+}
+
+
+def get_backend(name=None, params=None):
+    """
+    Instantiate an estimator backend, defaulting to ML_ESTIMATOR / ML_ESTIMATOR_PARAMS.
+    """
+    if name is None:
+        name = settings.ML_ESTIMATOR
+        if params is None:
+            params = settings.ML_ESTIMATOR_PARAMS
+    try:
+        backend_class = ESTIMATOR_BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown estimator backend '{name}'. Choose from: {', '.join(ESTIMATOR_BACKENDS)}")
+    return backend_class(**(params or {}))
@@ -0,0 +1,81 @@
+import json
+import os
+import shutil
+import uuid
+
+import numpy as np
+from django.conf import settings
+
+from .features import load_csc, save_csc
+
+# Bump when the encoding of datasets into features changes, so old entries are ignored
+FEATURE_FORMAT_VERSION = 1
+FEATURE_META_FILE = 'meta.json'
+
+
+def feature_cache_dir():
+    return settings.ML_FEATURE_CACHE_DIR
+
+
+def feature_cache_key(dataset_hash, include_education):
+    """
+    Features depend only on the dataset content and the feature set, not on
+    the estimator or its hyperparameters.
+    """
+    return f"{dataset_hash[:32]}-{'edu' if include_education else 'skills'}-v{FEATURE_FORMAT_VERSION}"
+
+
+def load_cached_features(key):
+    """
+    (X, y, state) for a cached entry, or None on a miss. X is a read-only
+    memory-mapped CSC matrix, y a NumPy array of labels and state the JSON
+    dict stored alongside (encoder vocabularies, role skills).
+    """
+    directory = os.path.join(feature_cache_dir(), key)
+    try:
+        with open(os.path.join(directory, FEATURE_META_FILE)) as f:
+            meta = json.load(f)
+        X = load_csc(directory, meta['shape'])
+        y = np.load(os.path.join(directory, 'labels.npy'))
+    except (OSError, ValueError, KeyError):
+        return None
+    # Touch it so eviction keeps recently used entries
+    os.utime(directory)
+    return X, y, meta['state']
+
+
+def store_cached_features(key, X, y, state):
+    """
+    Write an entry and return its memory-mapped (X, y). The entry is built
+    under a temporary name and renamed into place, then the oldest entries
+    beyond ML_FEATURE_CACHE_SIZE are removed.
+    """
+    cache_dir = feature_cache_dir()
+    directory = os.path.join(cache_dir, key)
+    tmp_dir = os.path.join(cache_dir, f".{key}.{uuid.uuid4().hex[:8]}.tmp")
+    os.makedirs(tmp_dir)
+    try:
+        shape = save_csc(X, tmp_dir)
+        np.save(os.path.join(tmp_dir, 'labels.npy'), np.asarray(y, dtype=str))
+        with open(os.path.join(tmp_dir, FEATURE_META_FILE), 'w') as f:
+            json.dump({'shape': shape, 'state': state}, f)
+        shutil.rmtree(directory, ignore_errors=True)
+        os.replace(tmp_dir, directory)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+    _evict(cache_dir, keep=key)
+    return load_csc(directory, shape), np.load(os.path.join(directory, 'labels.npy'))
+
+
+def _evict(cache_dir, keep):
+    entries = [
+        os.path.join(cache_dir, name)
+        for name in os.listdir(cache_dir)
+        if not name.startswith('.') and name != keep
+    ]
+    entries.sort(key=os.path.getmtime, reverse=True)
+    # The entry just written counts towards the limit
+    for path in entries[max(settings.ML_FEATURE_CACHE_SIZE - 1, 0):]:
+        shutil.rmtree(path, ignore_errors=True)
@@ -0,0 +1,141 @@
+import os
+
+import numpy as np
+from scipy.sparse import csc_matrix, csr_matrix
+
+
+class SkillEncoder:
+    """
+    Encodes lists of skill names as binary CSR rows.
+
+    The skill -> column mapping is frozen when the encoder is fitted, so
+    inference is one dictionary lookup per skill; unknown skills are ignored.
+    Rows are never densified, which keeps memory proportional to the number
+    of skills users actually have rather than the vocabulary size.
+    """
+
+    def __init__(self, vocabulary=None):
+        self.vocabulary = dict(vocabulary or {})
+
+    @property
+    def n_features(self):
+        return len(self.vocabulary)
+
+    @property
+    def classes_(self):
+        # Column order, matching MultiLabelBinarizer.classes_
+        return sorted(self.vocabulary, key=self.vocabulary.get)
+
+    def fit(self, skill_lists):
+        skills = set()
+        for row in skill_lists:
+            skills.update(row)
+        self.vocabulary = {skill: col for col, skill in enumerate(sorted(skills))}
+        return self
+
+    def transform(self, skill_lists):
+        vocabulary = self.vocabulary
+        indptr = [0]
+        indices = []
+        for row in skill_lists:
+            cols = {vocabulary[s] for s in row if s in vocabulary}
+            indices.extend(sorted(cols))
+            indptr.append(len(indices))
+
+        indices = np.asarray(indices, dtype=np.int32)
+        data = np.ones(len(indices), dtype=np.float32)
+        return csr_matrix(
+            (data, indices, np.asarray(indptr, dtype=np.int32)),
+            shape=(len(indptr) - 1, self.n_features),
+        )
+
+    def fit_transform(self, skill_lists):
+        skill_lists = list(skill_lists)
+        return self.fit(skill_lists).transform(skill_lists)
+
+
+def normalize_degree(degree):
+    return str(degree).strip().lower() if degree is not None else ''
+
+
+class EducationEncoder:
+    """
+    Encodes a user's degree as a one-hot column and their normalized CGPA
+    (0-1, see EducationPreprocessor) as one numeric column, so education can
+    be appended to the skill columns.
+    """
+
+    def __init__(self, degrees=None):
+        self.degrees = dict(degrees or {})
+
+    @property
+    def n_features(self):
+        # One column per known degree plus the CGPA column
+        return len(self.degrees) + 1
+
+    def fit(self, degrees):
+        known = {normalize_degree(d) for d in degrees} - {''}
+        self.degrees = {degree: col for col, degree in enumerate(sorted(known))}
+        return self
+
+    def transform(self, degrees, normalized_cgpa):
+        cgpa_col = len(self.degrees)
+        indptr = [0]
+        indices = []
+        data = []
+        for degree, cgpa in zip(degrees, normalized_cgpa):
+            col = self.degrees.get(normalize_degree(degree))
+            if col is not None:
+                indices.append(col)
+                data.append(1.0)
+            if cgpa:
+                indices.append(cgpa_col)
+                data.append(cgpa)
+            indptr.append(len(indices))
+
+        return csr_matrix(
+            (np.asarray(data, dtype=np.float32), np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int32)),
+            shape=(len(indptr) - 1, self.n_features),
+        )
+
+
+CSC_ARRAYS = ('data', 'indices', 'indptr')
+
+
+def save_csc(X, directory):
+    """
+    Write `X` in CSC layout (what tree estimators fit on) as .npy files in `directory`.
+    """
+    X = X.tocsc()
+    X.sort_indices()
+    for name in CSC_ARRAYS:
+        values = getattr(X, name)
+        dtype = np.float32 if name == 'data' else values.dtype
+        mapped = np.lib.format.open_memmap(os.path.join(directory, f"{name}.npy"), mode='w+', dtype=dtype, shape=values.shape)
+        mapped[:] = values
+        mapped.flush()
+        del mapped
+    return X.shape
+
+
+def load_csc(directory, shape):
+    """
+    Read-only CSC matrix backed by memory maps of the files `save_csc` wrote.
+    """
+    arrays = {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode='r') for name in CSC_ARRAYS}
+    matrix = csc_matrix((arrays['data'], arrays['indices'], arrays['indptr']), shape=tuple(shape), copy=False)
+    # Already sorted on write; recording it stops scipy/sklearn from re-sorting in place
+    matrix.has_sorted_indices = True
+    return matrix
+
+
+def memmap_csc(X, directory):
+    """
+    Move `X` into memory-mapped files under `directory` (see save_csc/load_csc).
+    The arrays are already in the CSC float32 layout the forest fits on, so
+    fit reads them in place. They are then file-backed page cache, which the
+    kernel can drop and re-read under memory pressure, rather than anonymous
+    heap, so peak resident memory during training is lower. The forest's
+    threads share one copy either way.
+    """
+    return load_csc(directory, save_csc(X, directory))
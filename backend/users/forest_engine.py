@@ -0,0 +1,147 @@
+import os
+
+import numpy as np
+
+# sklearn marks leaves with TREE_LEAF (-1) children and TREE_UNDEFINED (-2) features
+TREE_LEAF = -1
+
+# Upper bound on rows * features densified at once by FlatForest.predict_proba
+DENSE_CHUNK_ELEMENTS = 4_000_000
+# Rows scored together by FlatForest.predict_proba; bounds the (row, tree)
+# working arrays so large batches stay in a few MB of scratch memory
+BATCH_CHUNK_ROWS = 256
+
+# Arrays written by FlatForest.save, one .npy file each
+FOREST_ARRAYS = ('feature', 'threshold', 'left', 'right', 'value', 'roots', 'classes_')
+
+
+class FlatForest:
+    """
+    A fitted RandomForestClassifier flattened into contiguous NumPy arrays.
+
+    Every tree's nodes are concatenated into shared `feature`, `threshold`,
+    `left` and `right` arrays (child ids are global), `value` holds each node's
+    normalized class distribution and `roots` the first node of every tree.
+    Scoring walks all trees together, one depth level per step, and only looks
+    up the features a row actually has, which avoids sklearn's fixed per-call
+    overhead when scoring a single user.
+    """
+
+    def __init__(self, feature, threshold, left, right, value, roots, classes_):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.value = value
+        self.roots = roots
+        self.classes_ = classes_
+
+    @property
+    def n_trees(self):
+        return len(self.roots)
+
+    @classmethod
+    def from_sklearn(cls, forest):
+        features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+        offset = 0
+        for estimator in forest.estimators_:
+            tree = estimator.tree_
+            left = tree.children_left.astype(np.int32)
+            right = tree.children_right.astype(np.int32)
+            # Shift child ids into the shared node space, leaves stay TREE_LEAF
+            left = np.where(left == TREE_LEAF, TREE_LEAF, left + offset)
+            right = np.where(right == TREE_LEAF, TREE_LEAF, right + offset)
+
+            value = tree.value[:, 0, :].astype(np.float64)
+            normalizer = value.sum(axis=1, keepdims=True)
+            normalizer[normalizer == 0.0] = 1.0
+
+            features.append(tree.feature.astype(np.int32))
+            thresholds.append(tree.threshold.astype(np.float64))
+            lefts.append(left.astype(np.int32))
+            rights.append(right.astype(np.int32))
+            values.append(value / normalizer)
+            roots.append(offset)
+            offset += tree.node_count
+
+        return cls(
+            feature=np.ascontiguousarray(np.concatenate(features)),
+            threshold=np.ascontiguousarray(np.concatenate(thresholds)),
+            left=np.ascontiguousarray(np.concatenate(lefts)),
+            right=np.ascontiguousarray(np.concatenate(rights)),
+            value=np.ascontiguousarray(np.concatenate(values)),
+            roots=np.asarray(roots, dtype=np.int32),
+            # Fixed-width strings rather than objects so the array can be saved
+            # and memory-mapped without pickle
+            classes_=np.asarray(forest.classes_, dtype=str),
+        )
+
+    def save(self, directory):
+        for name in FOREST_ARRAYS:
+            np.save(os.path.join(directory, f"forest_{name}.npy"), getattr(self, name))
+
+    @classmethod
+    def load(cls, directory, mmap=True):
+        """
+        Read arrays written by `save`. With `mmap` they are mapped read-only,
+        so every process serving the same file shares one copy of the pages.
+        """
+        mmap_mode = 'r' if mmap else None
+        # np.asarray drops the np.memmap subclass (same pages), whose per-result
+        # bookkeeping would otherwise slow down every fancy-indexing step
+        return cls(**{
+            name: np.asarray(np.load(os.path.join(directory, f"forest_{name}.npy"), mmap_mode=mmap_mode))
+            for name in FOREST_ARRAYS
+        })
+
+    def predict_proba_row(self, cols, vals=None):
+        """
+        Class probabilities for one row given its non-zero columns.
+        `cols` must be sorted; `vals` defaults to 1.0 for every column.
+        """
+        cols = np.asarray(cols, dtype=np.int32)
+        if vals is None:
+            vals = np.ones(len(cols), dtype=np.float32)
+        # Compare in float32 like sklearn does
+        vals = np.asarray(vals, dtype=np.float32).astype(np.float64)
+
+        nodes = self.roots.copy()
+        active = np.flatnonzero(self.left[nodes] != TREE_LEAF)
+        while len(active):
+            current = nodes[active]
+            feature = self.feature[current]
+            if len(cols):
+                pos = np.searchsorted(cols, feature)
+                pos[pos == len(cols)] = 0
+                x = np.where(cols[pos] == feature, vals[pos], 0.0)
+            else:
+                x = np.zeros(len(current))
+            nodes[active] = np.where(x <= self.threshold[current], self.left[current], self.right[current])
+            active = active[self.left[nodes[active]] != TREE_LEAF]
+
+        return self.value[nodes].sum(axis=0) / self.n_trees
+
+    def predict_proba(self, X):
+        """
+        Class probabilities for every row of a CSR matrix, densified in chunks.
+        Every (row, tree) pair walks its own path; pairs drop out of the active
+        set as they reach a leaf, so shallow paths don't wait for deep ones.
+        """
+        n_rows, n_features = X.shape
+        proba = np.empty((n_rows, len(self.classes_)), dtype=np.float64)
+        chunk = max(1, min(BATCH_CHUNK_ROWS, DENSE_CHUNK_ELEMENTS // max(n_features, 1)))
+        for start in range(0, n_rows, chunk):
+            dense = X[start:start + chunk].toarray().astype(np.float32).astype(np.float64)
+            n_chunk = dense.shape[0]
+            nodes = np.tile(self.roots, n_chunk)
+            row_of = np.repeat(np.arange(n_chunk), self.n_trees)
+            active = np.flatnonzero(self.left[nodes] != TREE_LEAF)
+            while len(active):
+                current = nodes[active]
+                x = dense[row_of[active], self.feature[current]]
+                step = np.where(x <= self.threshold[current], self.left[current], self.right[current])
+                nodes[active] = step
+                active = active[self.left[step] != TREE_LEAF]
+            values = self.value[nodes].reshape(n_chunk, self.n_trees, -1)
+            proba[start:start + n_chunk] = values.sum(axis=1) / self.n_trees
+        return proba
@@ -0,0 +1,150 @@
+import json
+import multiprocessing
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand, CommandError
+from scipy.sparse import vstack
+
+from users.benchmarking import current_rss_mb, latency_summary, peak_rss_mb, time_calls
+from users.estimators import ESTIMATOR_BACKENDS, get_backend
+from users.features import SkillEncoder
+from users.predictor import TOP_K_ROLES, default_dataset_path, load_training_rows
+from users.synthetic import generate_skill_dataset
+
+# Below this many rows there is no meaningful hold-out set, so accuracy is
+# measured on the training rows instead
+MIN_ROWS_FOR_HOLDOUT = 50
+
+
+def top_k_accuracy(proba, classes, y_true, k=TOP_K_ROLES):
+    k = min(k, proba.shape[1])
+    top = np.argpartition(-proba, k - 1, axis=1)[:, :k]
+    top_roles = np.asarray(classes)[top]
+    return float(np.mean([role in row for role, row in zip(y_true, top_roles)]))
+
+
+def split_dataset(skill_lists, roles, test_fraction, seed):
+    n_rows = len(roles)
+    if n_rows < MIN_ROWS_FOR_HOLDOUT:
+        return (skill_lists, roles), (skill_lists, roles), 'train'
+
+    order = np.random.default_rng(seed).permutation(n_rows)
+    n_test = max(1, int(n_rows * test_fraction))
+    test, train = order[:n_test], order[n_test:]
+    pick = lambda idx: ([skill_lists[i] for i in idx], [roles[i] for i in idx])
+    return pick(train), pick(test), 'holdout'
+
+
+def run_backend(backend_name, dataset, options, results):
+    """
+    Fit and measure one backend. Runs in a child process so peak RSS is per backend.
+    """
+    start_rss = current_rss_mb()
+    (train_skills, train_roles), (eval_skills, eval_roles), accuracy_on = dataset
+
+    encoder = SkillEncoder().fit(train_skills)
+    X_train = encoder.transform(train_skills)
+    X_eval = encoder.transform(eval_skills)
+
+    backend = get_backend(backend_name)
+    started = time.perf_counter()
+    backend.fit(X_train, train_roles)
+    fit_seconds = time.perf_counter() - started
+
+    n_eval = X_eval.shape[0]
+    single_rows = [(X_eval[i % n_eval],) for i in range(options['single_iterations'])]
+    single = time_calls(backend.predict_proba_row, single_rows)
+
+    # Repeat the eval rows if there are fewer than one batch of them
+    repeats = -(-options['batch_size'] // n_eval)
+    X_batch = vstack([X_eval] * repeats, format='csr')[:options['batch_size']]
+    batch = time_calls(backend.predict_proba, [(X_batch,)] * options['batch_iterations'])
+
+    accuracy = top_k_accuracy(backend.predict_proba(X_eval), backend.classes_, eval_roles)
+
+    peak = peak_rss_mb()
+    results.put({
+        'backend': backend_name,
+        'fit_seconds': round(fit_seconds, 4),
+        'single_row': latency_summary(single),
+        'batch': {**latency_summary(batch), 'rows': X_batch.shape[0]},
+        f'top{TOP_K_ROLES}_accuracy': round(accuracy, 4),
+        'accuracy_on': accuracy_on,
+        'peak_rss_mb': round(peak, 1) if peak is not None else None,
+        'rss_growth_mb': round(peak - start_rss, 1) if peak is not None and start_rss is not None else None,
+    })
+
+
+class Command(BaseCommand):
+    help = "Compare estimator backends on fit time, latency, memory and top-3 accuracy"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--backends', default=','.join(ESTIMATOR_BACKENDS), help='Comma separated backend names')
+        parser.add_argument('--dataset', default=None, help='Training CSV (defaults to ml/career_data.csv)')
+        parser.add_argument('--synthetic-rows', default='10000', help='Comma separated synthetic dataset sizes; empty to skip')
+        parser.add_argument('--synthetic-skills', type=int, default=500, help='Synthetic skill vocabulary size')
+        parser.add_argument('--synthetic-roles', type=int, default=20, help='Synthetic number of roles')
+        parser.add_argument('--single-iterations', type=int, default=200)
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--batch-iterations', type=int, default=10)
+        parser.add_argument('--test-fraction', type=float, default=0.2)
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--json', dest='json_path', default=None, help='Also write the results to this file')
+
+    def handle(self, *args, **options):
+        backends = [b.strip() for b in options['backends'].split(',') if b.strip()]
+        unknown = [b for b in backends if b not in ESTIMATOR_BACKENDS]
+        if unknown:
+            raise CommandError(f"Unknown backends: {', '.join(unknown)}")
+
+        datasets = [(
+            'career_data.csv',
+            load_training_rows(options['dataset'] or default_dataset_path()),
+        )]
+        for size in [s.strip() for s in options['synthetic_rows'].split(',') if s.strip()]:
+            datasets.append((f"synthetic-{size}", generate_skill_dataset(
+                int(size),
+                n_skills=options['synthetic_skills'],
+                n_roles=options['synthetic_roles'],
+                seed=options['seed'],
+            )))
+
+        # Import every backend's estimator up front so fit times exclude module loading
+        for backend_name in backends:
+            get_backend(backend_name).build(n_samples=1)
+
+        # Fork so children inherit the parsed datasets instead of re-reading them
+        context = multiprocessing.get_context('fork')
+        report = []
+        for dataset_name, (skill_lists, roles) in datasets:
+            dataset = split_dataset(skill_lists, roles, options['test_fraction'], options['seed'])
+            self.stdout.write(self.style.MIGRATE_HEADING(f"{dataset_name} ({len(roles)} rows)"))
+            for backend_name in backends:
+                results = context.Queue()
+                child = context.Process(target=run_backend, args=(backend_name, dataset, options, results))
+                child.start()
+                child.join()
+                if child.exitcode != 0:
+                    raise CommandError(f"{backend_name} failed on {dataset_name} (exit code {child.exitcode})")
+                result = results.get()
+                result['dataset'] = dataset_name
+                result['rows'] = len(roles)
+                report.append(result)
+                self.stdout.write(self._format(result))
+
+        if options['json_path']:
+            with open(options['json_path'], 'w') as f:
+                json.dump(report, f, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"Wrote {options['json_path']}"))
+
+    @staticmethod
+    def _format(r):
+        accuracy = r[f'top{TOP_K_ROLES}_accuracy']
+        return (
+            f"  {r['backend']:<20} fit {r['fit_seconds']:>8.3f}s | "
+            f"single p50 {r['single_row']['p50_ms']:.3f} p99 {r['single_row']['p99_ms']:.3f} ms | "
+            f"batch({r['batch']['rows']}) p50 {r['batch']['p50_ms']:.1f} p99 {r['batch']['p99_ms']:.1f} ms | "
+            f"peak RSS {r['peak_rss_mb']} MB (+{r['rss_growth_mb']}) | "
+            f"top-{TOP_K_ROLES} acc {accuracy:.3f} ({r['accuracy_on']})"
+        )
@@ -0,0 +1,87 @@
+import numpy as np
+from django.core.management.base import BaseCommand, CommandError
+from scipy.sparse import csr_matrix
+
+from users.benchmarking import batch_timings, latency_summary, random_skill_rows, time_calls
+from users.forest_engine import FlatForest
+from users.model_registry import get_predictor
+
+
+class Command(BaseCommand):
+    help = "Check the flattened forest against sklearn and compare single-row and batch latency"
+
+    # The recompute's batch path may be this much slower than sklearn before the check fails
+    BATCH_SLOWDOWN_LIMIT = 1.5
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1000, help='Random users used for the parity check')
+        parser.add_argument('--iterations', type=int, default=500, help='Single-row calls timed per engine')
+        parser.add_argument('--max-skills', type=int, default=8, help='Maximum skills per random user')
+        parser.add_argument('--batch-rows', type=int, default=5000, help='Rows per batch in the batch timing check')
+        parser.add_argument('--tolerance', type=float, default=1e-9, help='Largest allowed probability difference')
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        predictor = get_predictor()
+        if not predictor.is_trained:
+            raise CommandError("No trained model available")
+
+        if predictor.estimator.name != 'random_forest':
+            raise CommandError(f"Active model uses the '{predictor.estimator.name}' backend, not random_forest")
+
+        forest = predictor.estimator.get_model()
+        engine = FlatForest.from_sklearn(forest)
+        # Includes the education columns when the model was trained with them
+        n_features = forest.n_features_in_
+        self.stdout.write(
+            f"Model {predictor.version}: {engine.n_trees} trees, {len(engine.feature)} nodes, "
+            f"{n_features} features, {len(engine.classes_)} classes"
+        )
+
+        # Parity: every random row must score the same as sklearn
+        rows = random_skill_rows(n_features, options['rows'], options['max_skills'], seed=options['seed'])
+        X = self._to_csr(rows, n_features)
+        expected = forest.predict_proba(X)
+        single = np.vstack([engine.predict_proba_row(cols) for cols in rows])
+        batch = engine.predict_proba(X)
+        single_diff = float(np.abs(single - expected).max())
+        batch_diff = float(np.abs(batch - expected).max())
+        self.stdout.write(f"Parity over {len(rows)} rows: single-row max diff {single_diff:.3g}, batch max diff {batch_diff:.3g}")
+        if max(single_diff, batch_diff) > options['tolerance']:
+            raise CommandError(f"Flattened forest disagrees with sklearn (tolerance {options['tolerance']})")
+
+        # Latency: one user per call, as in PredictionView
+        timed = rows[:options['iterations']]
+        sklearn_times = time_calls(forest.predict_proba, [(X[i],) for i in range(len(timed))])
+        engine_times = time_calls(engine.predict_proba_row, [(cols,) for cols in timed])
+
+        for name, samples in (('sklearn predict_proba', sklearn_times), ('FlatForest', engine_times)):
+            summary = latency_summary(samples)
+            self.stdout.write(f"{name:>22}: p50 {summary['p50_ms']:.3f} ms, p99 {summary['p99_ms']:.3f} ms")
+
+        speedup = np.median(sklearn_times) / np.median(engine_times)
+        self.stdout.write(self.style.SUCCESS(f"Parity OK, median speedup {speedup:.1f}x"))
+
+        # Batch: one call over many users, as the bulk recompute scores a chunk
+        batch_rows = random_skill_rows(n_features, options['batch_rows'], options['max_skills'], seed=options['seed'] + 1)
+        X_batch = self._to_csr(batch_rows, n_features)
+        backend = predictor.estimator
+        with backend.batch_scoring():
+            timings = batch_timings({
+                'sklearn predict_proba': forest.predict_proba,
+                'FlatForest': engine.predict_proba,
+                'recompute path': backend.predict_proba,
+            }, X_batch, repeats=5)
+        for name, seconds in timings.items():
+            self.stdout.write(f"{name:>22}: {seconds:.3f} s for {len(batch_rows)} rows")
+        slowdown = timings['recompute path'] / timings['sklearn predict_proba']
+        if slowdown > self.BATCH_SLOWDOWN_LIMIT:
+            raise CommandError(f"Batch scoring is {slowdown:.1f}x slower than sklearn (limit {self.BATCH_SLOWDOWN_LIMIT}x)")
+        self.stdout.write(self.style.SUCCESS(f"Batch OK, recompute path at {slowdown:.2f}x sklearn"))
+
+    @staticmethod
+    def _to_csr(rows, n_features):
+        indptr = np.cumsum([0] + [len(cols) for cols in rows])
+        indices = np.concatenate(rows) if rows else np.empty(0, dtype=np.int32)
+        data = np.ones(len(indices), dtype=np.float32)
+        return csr_matrix((data, indices, indptr), shape=(len(rows), n_features))
@@ -0,0 +1,134 @@
+import json
+import multiprocessing
+import os
+import random
+import tempfile
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+
+from users.benchmarking import current_rss_mb, latency_summary, path_size_bytes, peak_rss_mb, time_calls
+from users.estimators import get_backend
+from users.predictor import CareerPredictor, load_training_rows
+from users.synthetic import parse_row_count, write_career_csv
+
+
+def run_size(csv_path, options, results):
+    """
+    Train, save, reload and query a predictor on one dataset. Runs in a child
+    process so peak RSS belongs to this dataset size alone.
+    """
+    start_rss = current_rss_mb()
+
+    # Measure a cold training run, not a feature cache hit from an earlier benchmark
+    started = time.perf_counter()
+    with override_settings(ML_FEATURE_CACHE_SIZE=0):
+        predictor = CareerPredictor(csv_path=csv_path)
+    train_seconds = time.perf_counter() - started
+    train_peak = peak_rss_mb()
+
+    # Left for the work directory cleanup; the loaded model maps its files
+    artifact_path = os.path.join(options['work_dir'], f"model_{os.getpid()}")
+    started = time.perf_counter()
+    predictor.save(artifact_path)
+    save_seconds = time.perf_counter() - started
+    artifact_bytes = path_size_bytes(artifact_path)
+
+    started = time.perf_counter()
+    predictor = CareerPredictor.load(artifact_path)
+    load_seconds = time.perf_counter() - started
+
+    # Query with real rows from the dataset, as a signed-in user would
+    skill_lists, _ = load_training_rows(csv_path)
+    rng = random.Random(options['seed'])
+    queries = [rng.choice(skill_lists) for _ in range(max(options['single_iterations'], options['batch_size']))]
+    single = time_calls(predictor.predict_roles, [(skills,) for skills in queries[:options['single_iterations']]])
+    batch_queries = queries[:options['batch_size']]
+    batch = time_calls(predictor.predict_roles_batch, [(batch_queries,)] * options['batch_iterations'])
+
+    peak = peak_rss_mb()
+    results.put({
+        'rows': len(skill_lists),
+        'backend': predictor.estimator.name,
+        'include_education': predictor.include_education,
+        'features': predictor.encoder.n_features,
+        'roles': len(predictor.estimator.classes_),
+        'train_seconds': round(train_seconds, 3),
+        'save_seconds': round(save_seconds, 3),
+        'load_seconds': round(load_seconds, 3),
+        'artifact_mb': round(artifact_bytes / (1024 * 1024), 2),
+        'train_peak_rss_mb': round(train_peak, 1) if train_peak is not None else None,
+        'peak_rss_mb': round(peak, 1) if peak is not None else None,
+        'rss_growth_mb': round(peak - start_rss, 1) if peak is not None and start_rss is not None else None,
+        'single_row': latency_summary(single),
+        'batch': {**latency_summary(batch), 'rows': len(batch_queries)},
+    })
+
+
+class Command(BaseCommand):
+    help = "Measure CareerPredictor training time, artifact size, memory and latency as the dataset grows"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='10k,100k,1M', help='Comma separated synthetic dataset sizes')
+        parser.add_argument('--dataset', action='append', default=[], help='Also benchmark this CSV (repeatable)')
+        parser.add_argument('--skills', type=int, default=500, help='Synthetic skill vocabulary size')
+        parser.add_argument('--roles', type=int, default=20, help='Synthetic number of roles')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--data-dir', default=None, help='Keep generated CSVs here and reuse them on later runs')
+        parser.add_argument('--single-iterations', type=int, default=500)
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--batch-iterations', type=int, default=5)
+        parser.add_argument('--json', dest='json_path', default='predictor_benchmark.json', help='Report file')
+
+    def handle(self, *args, **options):
+        try:
+            sizes = [parse_row_count(s) for s in options['sizes'].split(',') if s.strip()]
+        except ValueError:
+            raise CommandError(f"Invalid --sizes: {options['sizes']}")
+
+        with tempfile.TemporaryDirectory(prefix='predictor_bench_') as work_dir:
+            options['work_dir'] = work_dir
+            data_dir = options['data_dir'] or work_dir
+            os.makedirs(data_dir, exist_ok=True)
+
+            datasets = [(os.path.basename(path), path) for path in options['dataset']]
+            for n_rows in sizes:
+                path = os.path.join(data_dir, f"career_{n_rows}_{options['skills']}s_{options['roles']}r_{options['seed']}.csv")
+                if not os.path.exists(path):
+                    self.stdout.write(f"Generating {n_rows} rows...")
+                    write_career_csv(path, n_rows, n_skills=options['skills'], n_roles=options['roles'], seed=options['seed'])
+                datasets.append((f"synthetic-{n_rows}", path))
+
+            # Import the estimator up front so training times exclude module loading
+            get_backend().build(n_samples=1)
+
+            # Fork so every size starts from the same clean parent process
+            context = multiprocessing.get_context('fork')
+            report = []
+            for name, path in datasets:
+                results = context.Queue()
+                child = context.Process(target=run_size, args=(path, options, results))
+                child.start()
+                child.join()
+                if child.exitcode != 0:
+                    raise CommandError(f"Benchmark failed on {name} (exit code {child.exitcode})")
+                result = results.get()
+                result['dataset'] = name
+                result['csv_mb'] = round(os.path.getsize(path) / (1024 * 1024), 2)
+                report.append(result)
+                self.stdout.write(self._format(result))
+
+        with open(options['json_path'], 'w') as f:
+            json.dump(report, f, indent=2)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {options['json_path']}"))
+
+    @staticmethod
+    def _format(r):
+        return (
+            f"{r['dataset']:<18} {r['rows']:>8} rows | train {r['train_seconds']:>8.2f}s | "
+            f"artifact {r['artifact_mb']:>8.2f} MB (load {r['load_seconds']:.2f}s) | "
+            f"peak RSS {r['peak_rss_mb']} MB | "
+            f"single p50 {r['single_row']['p50_ms']:.3f} p99 {r['single_row']['p99_ms']:.3f} ms | "
+            f"batch({r['batch']['rows']}) p50 {r['batch']['p50_ms']:.1f} ms"
+        )
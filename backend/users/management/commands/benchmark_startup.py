@@ -0,0 +1,78 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Heavy modules we want to keep off the startup path
+ML_MODULES = ('numpy', 'scipy', 'pandas', 'sklearn', 'joblib')
+
+# Each snippet runs in a fresh interpreter; it prints a JSON line with the
+# seconds spent and which heavy modules ended up imported
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import django
+django.setup()
+{body}
+print(json.dumps({{
+    'seconds': time.perf_counter() - started,
+    'loaded': [m for m in {modules!r} if m in sys.modules],
+}}))
+"""
+
+SCENARIOS = (
+    ('django.setup()', ''),
+    ('URL resolution (all views)', "from django.urls import resolve\nresolve('/api/predict-career/')"),
+    ('system checks (manage.py migrate/check)', "from django.core import checks\nchecks.run_checks()"),
+    ('first ML use (import predictor)', "from django.urls import resolve\nresolve('/api/predict-career/')\nimport users.predictor"),
+)
+
+
+class Command(BaseCommand):
+    help = "Time interpreter startup paths in fresh subprocesses and report which ML modules they import"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=5, help='Fresh interpreters per scenario')
+        parser.add_argument('--json', dest='json_path', default=None, help='Also write the results to this file')
+
+    def handle(self, *args, **options):
+        env = {**os.environ, 'DJANGO_SETTINGS_MODULE': os.environ.get('DJANGO_SETTINGS_MODULE', settings.SETTINGS_MODULE)}
+        report = []
+        for name, body in SCENARIOS:
+            code = PROBE.format(body=body, modules=ML_MODULES)
+            samples = []
+            loaded = []
+            for _ in range(options['repeat']):
+                started = time.perf_counter()
+                result = subprocess.run(
+                    [sys.executable, '-c', code],
+                    cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+                )
+                wall = time.perf_counter() - started
+                if result.returncode != 0:
+                    raise CommandError(f"{name} failed:\n{result.stderr}")
+                probe = json.loads(result.stdout.strip().splitlines()[-1])
+                samples.append((wall, probe['seconds']))
+                loaded = probe['loaded']
+
+            entry = {
+                'scenario': name,
+                'process_ms': round(statistics.median(wall for wall, _ in samples) * 1000, 1),
+                'import_ms': round(statistics.median(seconds for _, seconds in samples) * 1000, 1),
+                'ml_modules_loaded': loaded,
+            }
+            report.append(entry)
+            self.stdout.write(
+                f"{name:<42} process {entry['process_ms']:>8.1f} ms | django+imports {entry['import_ms']:>8.1f} ms | "
+                f"ML modules: {', '.join(loaded) or 'none'}"
+            )
+
+        if options['json_path']:
+            with open(options['json_path'], 'w') as f:
+                json.dump(report, f, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"Wrote {options['json_path']}"))
@@ -0,0 +1,40 @@
+import os
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from users.synthetic import parse_row_count, write_career_csv
+
+
+class Command(BaseCommand):
+    help = "Write a synthetic training CSV in the career_data.csv schema"
+
+    def add_arguments(self, parser):
+        parser.add_argument('output', help='CSV file to write')
+        parser.add_argument('--rows', default='10k', help='Number of rows, e.g. 10000, 100k or 1M')
+        parser.add_argument('--skills', type=int, default=500, help='Skill vocabulary size')
+        parser.add_argument('--roles', type=int, default=20, help='Number of job roles')
+        parser.add_argument('--certifications', type=int, default=50, help='Certification vocabulary size')
+        parser.add_argument('--noise', type=float, default=0.2, help='Fraction of off-profile skills and degrees')
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        try:
+            n_rows = parse_row_count(options['rows'])
+        except ValueError:
+            raise CommandError(f"Invalid --rows: {options['rows']}")
+
+        started = time.perf_counter()
+        written = write_career_csv(
+            options['output'],
+            n_rows,
+            n_skills=options['skills'],
+            n_roles=options['roles'],
+            n_certifications=options['certifications'],
+            noise=options['noise'],
+            seed=options['seed'],
+        )
+        size_mb = os.path.getsize(options['output']) / (1024 * 1024)
+        self.stdout.write(self.style.SUCCESS(
+            f"Wrote {written} rows ({size_mb:.1f} MB) to {options['output']} in {time.perf_counter() - started:.1f}s"
+        ))
@@ -0,0 +1,100 @@
+import json
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from users.benchmarking import path_size_bytes, process_memory_mb
+from users.model_registry import registry
+
+# Runs in each simulated worker: load the artifact, score random users so the
+# model pages are really touched, report ready, then idle until stdin closes
+WORKER = """
+import random, sys
+import django
+django.setup()
+from users.predictor import CareerPredictor
+predictor = CareerPredictor.load({path!r}, mmap={mmap!r})
+skills = predictor.encoder.classes_
+rng = random.Random({seed!r})
+users = [rng.sample(skills, min(len(skills), rng.randint(1, 8))) for _ in range({predictions!r})]
+predictor.predict_roles_batch(users)
+for user_skills in users[:100]:
+    predictor.predict_roles(user_skills)
+print('ready', flush=True)
+sys.stdin.read()
+"""
+
+
+class Command(BaseCommand):
+    help = "Start several worker processes on the active model and report their RSS/PSS with and without memory mapping"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=4)
+        parser.add_argument('--predictions', type=int, default=2000, help='Random users scored by each worker')
+        parser.add_argument('--modes', default='copy,mmap', help='copy (arrays read into each process) and/or mmap')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--json', dest='json_path', default=None, help='Also write the results to this file')
+
+    def handle(self, *args, **options):
+        if process_memory_mb() is None:
+            raise CommandError("Needs /proc/<pid>/smaps_rollup (Linux)")
+
+        version = registry._read_active()
+        if not version:
+            raise CommandError("No active model; train one first")
+        path = registry.artifact_path(version)
+        self.stdout.write(f"Model {version}: artifact {path_size_bytes(path) / (1024 * 1024):.1f} MB, {options['workers']} workers")
+
+        report = []
+        for mode in [m.strip() for m in options['modes'].split(',') if m.strip()]:
+            if mode not in ('copy', 'mmap'):
+                raise CommandError(f"Unknown mode: {mode}")
+            code = WORKER.format(path=path, mmap=mode == 'mmap', seed=options['seed'], predictions=options['predictions'])
+            workers = self._start_workers(code, options['workers'])
+            try:
+                samples = [process_memory_mb(worker.pid) for worker in workers]
+            finally:
+                for worker in workers:
+                    worker.stdin.close()
+                for worker in workers:
+                    worker.wait()
+
+            entry = {
+                'mode': mode,
+                'workers': len(samples),
+                'rss_mb_per_worker': round(sum(s['rss_mb'] for s in samples) / len(samples), 1),
+                'pss_mb_per_worker': round(sum(s['pss_mb'] for s in samples) / len(samples), 1),
+                'private_mb_per_worker': round(sum(s['private_mb'] for s in samples) / len(samples), 1),
+                'total_pss_mb': round(sum(s['pss_mb'] for s in samples), 1),
+            }
+            report.append(entry)
+            self.stdout.write(
+                f"{mode:>5}: RSS {entry['rss_mb_per_worker']:.1f} MB/worker | PSS {entry['pss_mb_per_worker']:.1f} MB/worker | "
+                f"private {entry['private_mb_per_worker']:.1f} MB/worker | all workers {entry['total_pss_mb']:.1f} MB"
+            )
+
+        if options['json_path']:
+            with open(options['json_path'], 'w') as f:
+                json.dump(report, f, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"Wrote {options['json_path']}"))
+
+    @staticmethod
+    def _start_workers(code, n_workers):
+        # All workers stay alive together so shared pages are split between them
+        workers = [
+            subprocess.Popen(
+                [sys.executable, '-c', code],
+                cwd=settings.BASE_DIR, env=os.environ.copy(), text=True,
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            )
+            for _ in range(n_workers)
+        ]
+        for worker in workers:
+            if worker.stdout.readline().strip() != 'ready':
+                for other in workers:
+                    other.kill()
+                raise CommandError(f"Worker {worker.pid} failed to load the model")
+        return workers
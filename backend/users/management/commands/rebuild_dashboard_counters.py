@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from users.counters import count_from_tables, rebuild_counters
+from users.models import StatCounter
+
+
+class Command(BaseCommand):
+    help = "Recompute the admin dashboard counters from the users, predictions and feedback tables"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--check', action='store_true', help='Only report counters that drifted, change nothing')
+
+    def handle(self, *args, **options):
+        if options['check']:
+            stored = dict(StatCounter.objects.values_list('name', 'value'))
+            actual = count_from_tables()
+            drifted = {
+                name: (stored.get(name, 0), actual.get(name, 0))
+                for name in stored.keys() | actual.keys()
+                if stored.get(name, 0) != actual.get(name, 0)
+            }
+            for name, (was, should_be) in sorted(drifted.items()):
+                self.stdout.write(f"{name}: stored {was}, actual {should_be}")
+            if drifted:
+                self.stdout.write(self.style.WARNING(f"{len(drifted)} counter(s) drifted; run without --check to fix"))
+            else:
+                self.stdout.write(self.style.SUCCESS(f"All {len(actual)} counters match"))
+            return
+
+        values = rebuild_counters()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {len(values)} counters"))
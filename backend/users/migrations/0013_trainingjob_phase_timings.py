@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-17 23:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0012_trainingjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='trainingjob',
+            name='phase_timings',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-17 23:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0013_trainingjob_phase_timings'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='trainingjob',
+            name='dataset_hash',
+            field=models.CharField(blank=True, db_index=True, max_length=64),
+        ),
+    ]
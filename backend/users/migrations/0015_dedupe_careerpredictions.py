@@ -0,0 +1,37 @@
+# Generated by Django 6.0.1 on 2026-10-17 23:25
+
+from django.db import migrations
+from django.db.models import Count
+
+
+def dedupe_predictions(apps, schema_editor):
+    """
+    Keep the most recently updated row per (user, predicted_role), carrying
+    over the flag if any duplicate was flagged, so the unique constraint in
+    the next migration can be added.
+    """
+    CareerPrediction = apps.get_model('users', 'CareerPrediction')
+    duplicated = CareerPrediction.objects.values('user_id', 'predicted_role')\
+        .annotate(rows=Count('id')).filter(rows__gt=1)
+    for group in duplicated.iterator():
+        rows = list(
+            CareerPrediction.objects
+            .filter(user_id=group['user_id'], predicted_role=group['predicted_role'])
+            .order_by('-updated_at', '-id')
+        )
+        keep, extra = rows[0], rows[1:]
+        if not keep.is_flagged and any(p.is_flagged for p in extra):
+            keep.is_flagged = True
+            keep.save(update_fields=['is_flagged'])
+        CareerPrediction.objects.filter(id__in=[p.id for p in extra]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0014_trainingjob_dataset_hash'),
+    ]
+
+    operations = [
+        migrations.RunPython(dedupe_predictions, migrations.RunPython.noop),
+    ]
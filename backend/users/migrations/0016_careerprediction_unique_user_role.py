@@ -0,0 +1,17 @@
+# Generated by Django 6.0.1 on 2026-10-17 23:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0015_dedupe_careerpredictions'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='careerprediction',
+            constraint=models.UniqueConstraint(fields=('user', 'predicted_role'), name='unique_user_predicted_role'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0.1 on 2026-10-17 23:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0016_careerprediction_unique_user_role'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='careerprediction',
+            index=models.Index(fields=['is_flagged', '-created_at', '-id'], name='prediction_flagged_recent'),
+        ),
+    ]
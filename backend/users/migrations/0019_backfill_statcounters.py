@@ -0,0 +1,43 @@
+# Generated by Django 6.0.1 on 2026-10-17 23:56
+
+from django.db import migrations
+from django.db.models import Count, Q, Sum
+
+
+def backfill_counters(apps, schema_editor):
+    """
+    Initial counter values; from here on users/counters.py keeps them current
+    (same names as there; rebuild_dashboard_counters recomputes them).
+    """
+    User = apps.get_model('users', 'User')
+    CareerPrediction = apps.get_model('users', 'CareerPrediction')
+    Feedback = apps.get_model('users', 'Feedback')
+    StatCounter = apps.get_model('users', 'StatCounter')
+
+    predictions = CareerPrediction.objects.aggregate(
+        total=Count('id'), flagged=Count('id', filter=Q(is_flagged=True)),
+    )
+    feedback = Feedback.objects.aggregate(total=Count('id'), rating_sum=Sum('rating'))
+    values = {
+        'users': User.objects.count(),
+        'predictions': predictions['total'],
+        'predictions.flagged': predictions['flagged'],
+        'feedback': feedback['total'],
+        'feedback.rating_sum': feedback['rating_sum'] or 0,
+    }
+    for row in CareerPrediction.objects.values('predicted_role').annotate(count=Count('id')):
+        values['predictions.role:' + row['predicted_role']] = row['count']
+
+    StatCounter.objects.all().delete()
+    StatCounter.objects.bulk_create([StatCounter(name=name, value=value) for name, value in values.items()])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0018_statcounter'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
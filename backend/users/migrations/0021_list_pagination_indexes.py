@@ -0,0 +1,38 @@
+# Generated by Django 6.0.1 on 2026-10-18 00:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0020_user_profile_version'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='careerprediction',
+            index=models.Index(fields=['user', '-updated_at', '-id'], name='prediction_user_updated'),
+        ),
+        migrations.AddIndex(
+            model_name='feedback',
+            index=models.Index(fields=['-created_at', '-id'], name='feedback_recent'),
+        ),
+        migrations.AddIndex(
+            model_name='feedback',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='feedback_user_recent'),
+        ),
+        migrations.AddIndex(
+            model_name='supportticket',
+            index=models.Index(fields=['-updated_at', '-id'], name='ticket_updated'),
+        ),
+        migrations.AddIndex(
+            model_name='supportticket',
+            index=models.Index(fields=['user', '-updated_at', '-id'], name='ticket_user_updated'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['-date_joined', '-id'], name='user_joined_recent'),
+        ),
+    ]
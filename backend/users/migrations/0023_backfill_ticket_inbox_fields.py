@@ -0,0 +1,59 @@
+# Generated by Django 6.0.1 on 2026-10-18 00:51
+
+from itertools import groupby
+
+from django.db import migrations
+
+PREVIEW_LENGTH = 140
+
+
+def preview(text):
+    text = ' '.join(text.split())
+    if len(text) > PREVIEW_LENGTH:
+        text = text[:PREVIEW_LENGTH - 1].rstrip() + '…'
+    return text
+
+
+def backfill_inbox_fields(apps, schema_editor):
+    """
+    Fill the denormalized ticket fields from existing messages. There's no
+    read history yet, so a side's unread count is the messages the other side
+    sent after its last reply.
+    """
+    SupportTicket = apps.get_model('users', 'SupportTicket')
+    TicketMessage = apps.get_model('users', 'TicketMessage')
+
+    messages = TicketMessage.objects.order_by('ticket_id', 'created_at', 'id')\
+        .values_list('ticket_id', 'message', 'is_admin_reply', 'created_at')
+    updated = []
+    for ticket_id, rows in groupby(messages.iterator(), key=lambda row: row[0]):
+        rows = list(rows)
+        ticket = SupportTicket(pk=ticket_id, message_count=len(rows))
+        _, text, _, ticket.last_message_at = rows[-1]
+        ticket.last_message_preview = preview(text)
+        ticket.unread_by_admin = ticket.unread_by_user = 0
+        for _, _, is_admin_reply, _ in rows:
+            if is_admin_reply:
+                ticket.unread_by_user += 1
+                ticket.unread_by_admin = 0
+            else:
+                ticket.unread_by_admin += 1
+                ticket.unread_by_user = 0
+        updated.append(ticket)
+
+    SupportTicket.objects.bulk_update(
+        updated,
+        ['message_count', 'last_message_at', 'last_message_preview', 'unread_by_admin', 'unread_by_user'],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0022_supportticket_inbox_fields'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_inbox_fields, migrations.RunPython.noop),
+    ]
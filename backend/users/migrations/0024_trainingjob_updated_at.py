@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-18 01:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0023_backfill_ticket_inbox_fields'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='trainingjob',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 6.0.1 on 2026-10-18 01:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0024_trainingjob_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='trainingjob',
+            name='kind',
+            field=models.CharField(choices=[('train', 'Retrain model'), ('recompute', 'Recompute predictions')], default='train', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='trainingjob',
+            name='result',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AlterField(
+            model_name='trainingjob',
+            name='dataset_path',
+            field=models.CharField(blank=True, max_length=500),
+        ),
+    ]
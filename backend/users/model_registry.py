@@ -0,0 +1,289 @@
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from datetime import datetime
+
+from django.conf import settings
+from django.utils import timezone
+
+from .prediction_cache import clear_prediction_cache
+
+ACTIVE_POINTER = 'ACTIVE'
+ARTIFACT_PREFIX = 'career_model_'
+
+# Throwaway predictions run by warmup() after loading the model
+WARMUP_PREDICTIONS = 5
+
+
+class ModelRegistry:
+    """
+    Process-wide owner of the trained CareerPredictor.
+
+    `users.predictor` (and with it numpy, pandas, scipy and scikit-learn) is
+    only imported the first time a model is loaded or trained, so importing
+    the views, running management commands or booting a worker stays cheap.
+
+    Trained models are written to versioned artifact directories under
+    ML_MODEL_DIR and the ACTIVE pointer file names the one to serve. Each
+    process loads the active artifact once and only reloads it when the
+    pointer changes, so requests never pay for training. Artifact arrays are
+    memory-mapped, so worker processes on a host share one copy of the model.
+    """
+
+    def __init__(self, model_dir=None):
+        self._model_dir = model_dir
+        self._lock = threading.Lock()
+        self._predictor = None
+        self._pointer_mtime = None
+        # How the served model got here, for the readiness endpoint
+        self.load_seconds = None
+        self.loaded_at = None
+        self.warmup_seconds = None
+
+    @property
+    def model_dir(self):
+        return self._model_dir or settings.ML_MODEL_DIR
+
+    @property
+    def pointer_path(self):
+        return os.path.join(self.model_dir, ACTIVE_POINTER)
+
+    def artifact_path(self, version):
+        return os.path.join(self.model_dir, f"{ARTIFACT_PREFIX}{version}")
+
+    def get_predictor(self):
+        """
+        Return the loaded predictor, loading or training it on first use.
+        """
+        pointer_mtime = self._current_pointer_mtime()
+        predictor = self._predictor
+        if predictor is not None and pointer_mtime == self._pointer_mtime:
+            return predictor
+
+        with self._lock:
+            # Another thread may have loaded it while we waited
+            pointer_mtime = self._current_pointer_mtime()
+            if self._predictor is not None and pointer_mtime == self._pointer_mtime:
+                return self._predictor
+
+            started = time.perf_counter()
+            predictor = self._load_active()
+            if predictor is None:
+                predictor = self._train_and_save()
+                pointer_mtime = self._current_pointer_mtime()
+
+            self._activate(predictor, pointer_mtime, load_seconds=time.perf_counter() - started)
+            return predictor
+
+    def serves_dataset(self, dataset_hash):
+        """
+        True if the active model was trained on a dataset with this content hash
+        using the current estimator settings, so retraining would not change it.
+        Reads the active artifact's metadata only; never loads or trains a model.
+        """
+        from .estimators import get_backend
+
+        meta = self.active_meta()
+        if meta is None:
+            return False
+        backend = get_backend()
+        return (
+            meta.get('dataset_hash') == dataset_hash
+            and meta.get('backend') == backend.name
+            # meta.json holds the params after a JSON round trip
+            and meta.get('backend_params') == json.loads(json.dumps(backend.params))
+            and meta.get('include_education') == settings.ML_EDUCATION_FEATURES
+        )
+
+    def active_version(self):
+        """
+        The version the ACTIVE pointer names, or None before the first model.
+        """
+        return self._read_active()
+
+    def active_meta(self):
+        """
+        The metadata of the active artifact, or None if there is no usable one.
+        """
+        from .predictor import ARTIFACT_FORMAT_VERSION, ARTIFACT_META_FILE
+
+        version = self._read_active()
+        if not version:
+            return None
+        try:
+            with open(os.path.join(self.artifact_path(version), ARTIFACT_META_FILE)) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if meta.get('format_version') != ARTIFACT_FORMAT_VERSION:
+            return None
+        return meta
+
+    def warmup(self, n_predictions=WARMUP_PREDICTIONS):
+        """
+        Load the active model and run a few throwaway predictions, so the first
+        real request doesn't pay for imports, artifact loading or cold code paths.
+        """
+        started = time.perf_counter()
+        predictor = self.get_predictor()
+        if predictor.is_trained:
+            # Each role's most common skills make realistic dummy users
+            dummy_users = [skills[:3] for skills in list(predictor.role_skills.values())[:n_predictions]]
+            for skills in dummy_users:
+                predictor.predict_roles(skills)
+            predictor.predict_roles_batch(dummy_users)
+        self.warmup_seconds = time.perf_counter() - started
+        return predictor
+
+    def status(self):
+        """
+        What this process is serving, without loading anything.
+        """
+        predictor = self._predictor
+        loaded = predictor is not None and predictor.is_trained
+        return {
+            'model_loaded': loaded,
+            'version': predictor.version if loaded else None,
+            'estimator': predictor.estimator.name if loaded else None,
+            'loaded_at': self.loaded_at,
+            'load_seconds': round(self.load_seconds, 4) if self.load_seconds is not None else None,
+            'warmup_seconds': round(self.warmup_seconds, 4) if self.warmup_seconds is not None else None,
+        }
+
+    def train(self, csv_path=None):
+        """
+        Train a new predictor without touching the one being served.
+        Safe to call from a background thread while requests keep predicting.
+        """
+        from .predictor import CareerPredictor
+        return CareerPredictor(csv_path=csv_path)
+
+    def promote(self, predictor):
+        """
+        Persist `predictor` as a new version and make it the active model.
+
+        The artifact and the ACTIVE pointer are both renamed into place, and the
+        in-memory swap is a single reference assignment, so concurrent requests
+        see either the old model or the new one, never a mix.
+        """
+        with self._lock:
+            self._save_and_activate(predictor)
+            self._activate(predictor, self._current_pointer_mtime())
+            return predictor
+
+    def retrain(self, csv_path=None):
+        """
+        Train a new model from the dataset, persist it and make it active.
+        """
+        predictor = self.train(csv_path)
+        if not predictor.is_trained:
+            raise ValueError("Training produced no model; is the dataset missing?")
+        return self.promote(predictor)
+
+    def _activate(self, predictor, pointer_mtime, load_seconds=None):
+        previous = self._predictor
+        self._predictor = predictor
+        self._pointer_mtime = pointer_mtime
+        # None when the model was trained in this process rather than loaded
+        self.load_seconds = load_seconds
+        self.loaded_at = timezone.now().isoformat()
+        if previous is not None and previous.version != predictor.version:
+            # Cached results belong to the old model
+            clear_prediction_cache()
+
+    def _train_and_save(self, csv_path=None):
+        predictor = self.train(csv_path)
+        if not predictor.is_trained:
+            # Nothing to persist (e.g. dataset missing); serve the empty predictor
+            return predictor
+        self._save_and_activate(predictor)
+        return predictor
+
+    def _save_and_activate(self, predictor):
+        version = f"{datetime.now().strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        predictor.version = version
+        os.makedirs(self.model_dir, exist_ok=True)
+        predictor.save(self.artifact_path(version))
+        self._write_active(version)
+        self._prune_artifacts(keep=version)
+
+    def _prune_artifacts(self, keep):
+        """
+        Delete all but the newest ML_KEEP_ARTIFACTS versions. The active one
+        is never deleted. Workers still serving a deleted version keep their
+        memory maps until they see the new pointer and reload.
+        """
+        artifacts = []
+        for name in os.listdir(self.model_dir):
+            # Skip .tmp dirs, another process may still be writing one
+            if not name.startswith(ARTIFACT_PREFIX) or name.endswith('.tmp'):
+                continue
+            try:
+                # Version timestamps only have second resolution; the renamed
+                # artifact's mtime orders versions saved within one second
+                artifacts.append((os.stat(os.path.join(self.model_dir, name)).st_mtime_ns, name))
+            except FileNotFoundError:
+                continue # Pruned by another process
+        names = [name for _, name in sorted(artifacts, reverse=True)]
+        active = os.path.basename(self.artifact_path(keep))
+        for name in names[max(settings.ML_KEEP_ARTIFACTS, 1):]:
+            if name == active:
+                continue
+            path = os.path.join(self.model_dir, name)
+            try:
+                if os.path.isdir(path):
+                    shutil.rmtree(path)
+                else:
+                    # Single-file artifacts from before versioned directories
+                    os.remove(path)
+            except OSError as e:
+                print(f"Could not remove old model artifact {name}: {e}")
+
+    def _load_active(self):
+        version = self._read_active()
+        if not version:
+            return None
+
+        from .predictor import CareerPredictor
+        try:
+            predictor = CareerPredictor.load(self.artifact_path(version))
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Could not load model artifact {version}: {e}. Retraining.")
+            return None
+
+        if predictor.estimator.name != settings.ML_ESTIMATOR:
+            print(f"Model {version} uses '{predictor.estimator.name}' but ML_ESTIMATOR is '{settings.ML_ESTIMATOR}'. Retraining.")
+            return None
+        if predictor.include_education != settings.ML_EDUCATION_FEATURES:
+            print(f"Model {version} education features don't match ML_EDUCATION_FEATURES. Retraining.")
+            return None
+        return predictor
+
+    def _read_active(self):
+        try:
+            with open(self.pointer_path) as f:
+                return f.read().strip()
+        except FileNotFoundError:
+            return None
+
+    def _write_active(self, version):
+        tmp_path = f"{self.pointer_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(version)
+        os.replace(tmp_path, self.pointer_path)
+
+    def _current_pointer_mtime(self):
+        try:
+            return os.stat(self.pointer_path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+
+registry = ModelRegistry()
+
+
+def get_predictor():
+    return registry.get_predictor()
@@ -1,7 +1,20 @@
+import uuid
+
 from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.db import models, router, transaction
+
+class CountedModel(models.Model):
+    # Saves run in a transaction, so the dashboard counters the post_save
+    # signals update (users/signals.py) commit or roll back with the row
+    class Meta:
+        abstract = True
 
-class User(AbstractUser):
+    def save(self, *args, **kwargs):
+        using = kwargs.get('using') or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using):
+            super().save(*args, **kwargs)
+
+class User(CountedModel, AbstractUser):
     ROLE_CHOICES = (
         ('admin', 'Admin'),
         ('user', 'User'),
@@ -10,6 +23,25 @@ class User(AbstractUser):
     profile_photo = models.ImageField(upload_to='profile_photos/', blank=True, null=True)
     banner_image = models.ImageField(upload_to='banners/', blank=True, null=True)
     is_flagged = models.BooleanField(default=False)
+    profile_version = models.PositiveIntegerField(default=0) # Bumped on every profile edit, see users/profile_cache.py
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Admin user list pages (users/pagination.py)
+            models.Index(fields=['-date_joined', '-id'], name='user_joined_recent'),
+        ]
+
+    def save(self, *args, **kwargs):
+        # profile_version only changes through bump_profile_version's F()
+        # update. A full save of an instance loaded before a bump would write
+        # the old number back and a later bump would reuse a cached version,
+        # so updates of existing rows never write the field.
+        if not self._state.adding and not kwargs.get('force_insert') and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'profile_version'
+            ]
+        super().save(*args, **kwargs)
 
 
 class Education(models.Model):
@@ -55,7 +87,7 @@ class Certification(models.Model):
     def __str__(self):
         return self.name
 
-class CareerPrediction(models.Model):
+class CareerPrediction(CountedModel):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='career_predictions')
     predicted_role = models.CharField(max_length=255)
     match_percentage = models.FloatField()
@@ -64,25 +96,66 @@ class CareerPrediction(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     is_flagged = models.BooleanField(default=False)
 
+    class Meta:
+        constraints = [
+            # One row per role and user; re-predictions update it in place
+            models.UniqueConstraint(fields=['user', 'predicted_role'], name='unique_user_predicted_role'),
+        ]
+        indexes = [
+            # Flagged-review list: WHERE is_flagged ORDER BY created_at DESC, id DESC
+            models.Index(fields=['is_flagged', '-created_at', '-id'], name='prediction_flagged_recent'),
+            # Prediction history pages
+            models.Index(fields=['user', '-updated_at', '-id'], name='prediction_user_updated'),
+        ]
 
     def __str__(self):
         return f"{self.user.username} - {self.predicted_role}"
 
-class Feedback(models.Model):
+class Feedback(CountedModel):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='feedback')
     message = models.TextField()
     rating = models.IntegerField(default=5) # 1-5 stars
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Feedback list pages: all (admin) and per user
+            models.Index(fields=['-created_at', '-id'], name='feedback_recent'),
+            models.Index(fields=['user', '-created_at', '-id'], name='feedback_user_recent'),
+        ]
+
     def __str__(self):
         return f"Feedback from {self.user.username}"
 
+# Characters of the latest message kept on the ticket for inbox lists
+TICKET_PREVIEW_LENGTH = 140
+
+def message_preview(text):
+    text = ' '.join(text.split())
+    if len(text) > TICKET_PREVIEW_LENGTH:
+        text = text[:TICKET_PREVIEW_LENGTH - 1].rstrip() + '\u2026'
+    return text
+
 class SupportTicket(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='tickets')
     subject = models.CharField(max_length=255)
     is_resolved = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Denormalized from messages so inbox lists never touch TicketMessage;
+    # maintained by TicketMessageView and the ticket messages endpoint
+    last_message_at = models.DateTimeField(null=True, blank=True)
+    last_message_preview = models.CharField(max_length=TICKET_PREVIEW_LENGTH, blank=True)
+    message_count = models.PositiveIntegerField(default=0)
+    unread_by_admin = models.PositiveIntegerField(default=0) # User messages since an admin last read the ticket
+    unread_by_user = models.PositiveIntegerField(default=0) # Admin replies since the owner last read the ticket
+
+    class Meta:
+        indexes = [
+            # Ticket list pages: all (admin) and per user
+            models.Index(fields=['-updated_at', '-id'], name='ticket_updated'),
+            models.Index(fields=['user', '-updated_at', '-id'], name='ticket_user_updated'),
+        ]
 
     def __str__(self):
         return f"Ticket #{self.id} - {self.subject}"
@@ -94,5 +167,52 @@ class TicketMessage(models.Model):
     is_admin_reply = models.BooleanField(default=False) # Helper to distinguish UI styling easily
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Ticket messages pages, newest first
+            models.Index(fields=['ticket', '-created_at', '-id'], name='ticket_message_recent'),
+        ]
+
     def __str__(self):
         return f"Message in #{self.ticket.id} by {self.sender.username}"
+
+class TrainingJob(models.Model):
+    STATUS_CHOICES = (
+        ('queued', 'Queued'),
+        ('running', 'Running'),
+        ('completed', 'Completed'),
+        ('failed', 'Failed'),
+    )
+    KIND_CHOICES = (
+        ('train', 'Retrain model'),
+        ('recompute', 'Recompute predictions'),
+    )
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES, default='train')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='queued')
+    progress = models.PositiveSmallIntegerField(default=0) # 0-100
+    message = models.CharField(max_length=255, blank=True)
+    error = models.TextField(blank=True)
+    dataset_path = models.CharField(max_length=500, blank=True) # Retrains only
+    dataset_hash = models.CharField(max_length=64, blank=True, db_index=True) # Canonical content hash, see users/dataset.py
+    model_version = models.CharField(max_length=64, blank=True)
+    duration_seconds = models.FloatField(null=True, blank=True) # Wall time of the training run
+    phase_timings = models.JSONField(default=dict, blank=True) # Seconds per phase: parse, encode, fit
+    result = models.JSONField(default=dict, blank=True) # Recomputes: users_processed, predictions_saved
+    created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='training_jobs')
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True) # Heartbeat while queued or running, see users/training.py
+
+    def __str__(self):
+        return f"Training job {self.id} ({self.status})"
+
+class StatCounter(models.Model):
+    # Materialized dashboard statistics (total users, predictions per role,
+    # flags, feedback ratings), kept current by users/counters.py
+    name = models.CharField(max_length=300, unique=True)
+    value = models.BigIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.name} = {self.value}"
@@ -0,0 +1,47 @@
+from django.conf import settings
+from rest_framework.pagination import CursorPagination
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Keyset pagination: each page is an indexed range scan, so deep pages of a
+    long list cost the same as the first, and rows added while paging don't
+    shift or repeat items. Orderings end in -id so the key is unique.
+
+    Page size defaults to API_PAGE_SIZE; clients may ask for ?page_size= up
+    to API_MAX_PAGE_SIZE.
+    """
+    page_size = settings.API_PAGE_SIZE
+    page_size_query_param = 'page_size'
+    max_page_size = settings.API_MAX_PAGE_SIZE
+
+
+class RecentlyUpdatedPagination(KeysetPagination):
+    # Tickets, prediction history
+    ordering = ('-updated_at', '-id')
+
+
+class NewestFirstPagination(KeysetPagination):
+    # Feedback
+    ordering = ('-created_at', '-id')
+
+
+class UserListPagination(KeysetPagination):
+    # Admin user list
+    ordering = ('-date_joined', '-id')
+
+
+class ProfileRowPagination(KeysetPagination):
+    # A user's education, jobs, skills and certifications, in the order they
+    # were added (no timestamps on these rows)
+    ordering = ('id',)
+
+
+class TicketMessagePagination(NewestFirstPagination):
+    # Newest messages first; clients page back through older ones
+    pass
+
+
+class FlaggedPredictionPagination(NewestFirstPagination):
+    page_size = 20
+    max_page_size = 100
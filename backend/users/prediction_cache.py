@@ -0,0 +1,46 @@
+import hashlib
+
+from django.core.cache import caches
+
+PREDICTION_CACHE_ALIAS = 'predictions'
+
+
+def skills_fingerprint(skills):
+    """
+    Stable hash of a skill list: order, case, whitespace and duplicates don't matter.
+    """
+    normalized = sorted({s.strip().lower() for s in skills if s and s.strip()})
+    return hashlib.sha1('\n'.join(normalized).encode('utf-8')).hexdigest()
+
+
+def prediction_cache_key(model_version, skills, education=None):
+    key = f"prediction:{model_version}:{skills_fingerprint(skills)}"
+    if education:
+        # Education-aware models also depend on degree and grades
+        parts = [str(education.get(field) or '').strip().lower() for field in ('degree', 'grade', 'cgpa')]
+        key += ':' + hashlib.sha1('\n'.join(parts).encode('utf-8')).hexdigest()
+    return key
+
+
+def cached_predict_roles(predictor, skills, education=None):
+    """
+    predict_roles with a cache in front of it.
+
+    Entries are keyed on the model version, so a promoted model never serves
+    results computed by its predecessor. Untrained/unversioned predictors are
+    never cached.
+    """
+    if not predictor.version:
+        return predictor.predict_roles(skills, education)
+
+    cache = caches[PREDICTION_CACHE_ALIAS]
+    key = prediction_cache_key(predictor.version, skills, education)
+    predictions = cache.get(key)
+    if predictions is None:
+        predictions = predictor.predict_roles(skills, education)
+        cache.set(key, predictions)
+    return predictions
+
+
+def clear_prediction_cache():
+    caches[PREDICTION_CACHE_ALIAS].clear()
@@ -1,105 +1,350 @@
+import numpy as np
 import pandas as pd
+from scipy.sparse import hstack
 import os
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.preprocessing import MultiLabelBinarizer
+import json
+import shutil
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timezone
 from django.conf import settings
 
+from .dataset import dataset_content_hash
+from .estimators import get_backend
+from .feature_cache import feature_cache_key, load_cached_features, store_cached_features
+from .features import EducationEncoder, SkillEncoder, memmap_csc
+from .preprocess import EducationPreprocessor
+
+# Number of missing skills suggested per predicted role
+MAX_MISSING_SKILLS = 5
+
+# Number of roles returned per prediction
+TOP_K_ROLES = 3
+
+# Bump whenever the pickled layout of a trained predictor changes so stale
+# artifacts on disk are retrained instead of loaded.
+ARTIFACT_FORMAT_VERSION = 7
+
+# Metadata file inside a model artifact directory
+ARTIFACT_META_FILE = 'meta.json'
+
+
+def default_dataset_path():
+    return os.path.join(settings.BASE_DIR, 'ml', 'career_data.csv')
+
+
+def split_skills(skills):
+    return [s.strip() for s in str(skills).lower().split(',') if s.strip()]
+
+
+def load_training_frame(csv_path):
+    """
+    Read and validate a training CSV, dropping rows without skills or a role.
+    """
+    val_df = pd.read_csv(csv_path)
+
+    # Validation
+    # Normalize headers to be case insensitive potentially, or just enforce strict
+    if 'skills' not in val_df.columns or 'job_role' not in val_df.columns:
+        raise ValueError("CSV must contain 'skills' and 'job_role' columns")
+
+    # Preprocess: Skills are comma separated in 'Skills' column
+    # Handle NaN
+    return val_df.dropna(subset=['skills', 'job_role'])
+
+
+def load_training_rows(csv_path):
+    """
+    Read a training CSV into (skill lists, job roles).
+    """
+    val_df = load_training_frame(csv_path)
+    X_raw = [split_skills(skills) for skills in val_df['skills']]
+    y = val_df['job_role'].tolist()
+    return X_raw, y
+
+
+def education_frame(educations):
+    """
+    DataFrame of degree/grade/cgpa from a list of education dicts (or None per user).
+    """
+    return pd.DataFrame.from_records(
+        [education or {} for education in educations],
+        columns=['degree', 'grade', 'cgpa'],
+    )
+
+
 class CareerPredictor:
-    def __init__(self):
-        self.model = RandomForestClassifier(n_estimators=100, random_state=42)
-        self.mlb = MultiLabelBinarizer()
+    def __init__(self, csv_path=None, train=True, backend=None, backend_params=None, include_education=None,
+                 n_jobs=None):
+        # Estimator is chosen by ML_ESTIMATOR unless a backend name is passed
+        self.estimator = get_backend(backend, backend_params)
+        self.encoder = SkillEncoder()
+        # Optionally append degree + normalized CGPA columns after the skills
+        if include_education is None:
+            include_education = settings.ML_EDUCATION_FEATURES
+        self.include_education = include_education
+        self.education_encoder = EducationEncoder()
         self.is_trained = False
-        self.df = None
-        self._train_model()
+        # role -> skills seen for that role, most common first
+        self.role_skills = {}
+        self.csv_path = csv_path or default_dataset_path()
+        # Canonical content hash of the training set (see users.dataset)
+        self.dataset_hash = None
+        self.version = None
+        self.trained_at = None
+        self.training_seconds = None
+        # Seconds spent per training phase: parse, encode, fit
+        self.phase_timings = {}
+        # Cores used while fitting; ML_TRAINING_JOBS unless given
+        self.n_jobs = settings.ML_TRAINING_JOBS if n_jobs is None else n_jobs
+        if train:
+            self._train_model()
+
+    @property
+    def encodes_education(self):
+        """
+        Whether education columns are part of X. `include_education` records
+        the ML_EDUCATION_FEATURES setting the model was trained under; backends
+        that only compare skill sets leave the columns out either way.
+        """
+        return self.include_education and self.estimator.uses_education
 
     def _train_model(self):
-        csv_path = os.path.join(settings.BASE_DIR, 'ml', 'career_data.csv')
+        csv_path = self.csv_path
         if not os.path.exists(csv_path):
             print("Dataset not found. Skipping training.")
             return
 
-        self.df = pd.read_csv(csv_path)
-        # Normalize skills in dataframe to lowercase to ensure consistency
-        if 'skills' in self.df.columns:
-            self.df['skills'] = self.df['skills'].astype(str).str.lower()
-        
-        # Validation
-        val_df = self.df.copy()
-        # Normalize headers to be case insensitive potentially, or just enforce strict
-        if 'skills' not in val_df.columns or 'job_role' not in val_df.columns:
-            raise ValueError("CSV must contain 'skills' and 'job_role' columns")
-            
-        # Preprocess: Skills are comma separated in 'Skills' column
-        # Handle NaN
-        val_df = val_df.dropna(subset=['skills', 'job_role'])
-        
-        X_raw = [str(skills).lower().split(',') for skills in val_df['skills']]
-        y = val_df['job_role']
-
-        # Determine all possible skills from dataset
-        self.mlb.fit(X_raw)
-        X = self.mlb.transform(X_raw)
-
-        self.model.fit(X, y)
+        started = time.perf_counter()
+        # Hashed here rather than trusted from the upload: the file may have been
+        # replaced again before this training run started
+        self.dataset_hash = dataset_content_hash(csv_path)
+        cache_key = None
+        if self.dataset_hash and settings.ML_FEATURE_CACHE_SIZE > 0:
+            cache_key = feature_cache_key(self.dataset_hash, self.encodes_education)
+
+        # Same data and feature set as an earlier run: skip parsing and encoding
+        cached = load_cached_features(cache_key) if cache_key else None
+        if cached is not None:
+            X, y, state = cached
+            self._set_feature_state(state)
+            parsed = time.perf_counter()
+        else:
+            val_df, X_raw, y = self._parse_dataset(csv_path)
+            parsed = time.perf_counter()
+            X = self._encode_features(val_df, X_raw)
+            del val_df, X_raw
+
+        # The matrix is written to disk once and memory-mapped, so during the
+        # fit it is reclaimable page cache rather than heap. It lives under
+        # ML_MODEL_DIR rather than /tmp, which is often RAM-backed.
+        os.makedirs(settings.ML_MODEL_DIR, exist_ok=True)
+        with tempfile.TemporaryDirectory(prefix='features-', dir=settings.ML_MODEL_DIR, ignore_cleanup_errors=True) as feature_dir:
+            if cached is None and cache_key:
+                X, y = store_cached_features(cache_key, X, y, self._feature_state())
+            elif cached is None:
+                X = memmap_csc(X, feature_dir)
+            encoded = time.perf_counter()
+            self.estimator.fit(X, y, n_jobs=self.n_jobs)
+            del X
+        fitted = time.perf_counter()
+
         self.is_trained = True
+        self.trained_at = datetime.now(timezone.utc).isoformat()
+        self.training_seconds = fitted - started
+        self.phase_timings = {
+            'parse': round(parsed - started, 4),
+            'encode': round(encoded - parsed, 4),
+            'fit': round(fitted - encoded, 4),
+            'features_cached': cached is not None,
+        }
 
-    def predict_roles(self, user_skills):
+    def _parse_dataset(self, csv_path):
+        val_df = load_training_frame(csv_path)
+        X_raw = [split_skills(skills) for skills in val_df['skills']]
+        y = val_df['job_role'].tolist()
+        self.role_skills = self._build_role_skill_index(X_raw, y)
+        return val_df, X_raw, y
+
+    def _encode_features(self, val_df, X_raw):
+        # Determine all possible skills from dataset; X stays sparse
+        X = self.encoder.fit_transform(X_raw)
+        if self.encodes_education:
+            # degree/cgpa columns as in career_data.csv; missing ones encode as empty
+            education = val_df.reindex(columns=['degree', 'grade', 'cgpa'])
+            self.education_encoder.fit(education['degree'].dropna())
+            X = hstack([X, self._encode_education(education)], format='csr')
+        return X
+
+    def _feature_state(self):
+        # Everything besides X and y that encoding produces
+        return {
+            'vocabulary': self.encoder.vocabulary,
+            'degrees': self.education_encoder.degrees,
+            'role_skills': self.role_skills,
+        }
+
+    def _set_feature_state(self, state):
+        self.encoder = SkillEncoder(state['vocabulary'])
+        self.education_encoder = EducationEncoder(state['degrees'])
+        self.role_skills = state['role_skills']
+
+    @staticmethod
+    def _build_role_skill_index(X_raw, y):
+        """
+        Count how often each skill appears per role so missing skills can be
+        suggested most-common-first without scanning the dataset per request.
+        """
+        counts = {}
+        for skills, role in zip(X_raw, y):
+            counts.setdefault(role, Counter()).update(set(skills))
+
+        # Ties are broken alphabetically so suggestions are deterministic
+        return {
+            role: [skill for skill, _ in sorted(counter.items(), key=lambda item: (-item[1], item[0]))]
+            for role, counter in counts.items()
+        }
+
+    def missing_skills(self, role, user_skills, limit=MAX_MISSING_SKILLS):
+        """
+        Most common skills for `role` that the user does not have yet.
+        """
+        user_skills = set(user_skills)
+        missing = []
+        for skill in self.role_skills.get(role, ()):
+            if skill not in user_skills:
+                missing.append(skill)
+                if len(missing) == limit:
+                    break
+        return missing
+
+    def _encode_education(self, education):
+        features = EducationPreprocessor.preprocess_batch(education)
+        return self.education_encoder.transform(education['degree'], features['normalized_cgpa'])
+
+    def save(self, path):
+        """
+        Write the predictor as an artifact directory at `path`: the estimator's
+        arrays (see EstimatorBackend.save) plus a meta.json holding the skill
+        vocabulary, role metadata and training details. The directory is built
+        next to its destination and renamed into place so readers never see a
+        partially written artifact.
+        """
         if not self.is_trained:
-            return []
-
-        # Transform user skills
-        # Filter out skills that model hasn't seen to avoid errors, or MLB handles it?
-        # MLB ignores unknown classes in transform? No, it raises error usually unless strictly handled.
-        # Actually MLB.transform expects iterable of iterables.
-        
-        # Better approach: Manually map to columns
-        # But MLB is easier if we handle ignore.
-        
+            raise ValueError("Cannot save an untrained predictor")
+
+        meta = {
+            'format_version': ARTIFACT_FORMAT_VERSION,
+            'version': self.version,
+            'trained_at': self.trained_at,
+            'training_seconds': self.training_seconds,
+            'phase_timings': self.phase_timings,
+            'csv_path': self.csv_path,
+            'dataset_hash': self.dataset_hash,
+            'backend': self.estimator.name,
+            'backend_params': self.estimator.params,
+            'vocabulary': self.encoder.vocabulary,
+            'include_education': self.include_education,
+            'degrees': self.education_encoder.degrees,
+            'role_skills': self.role_skills,
+        }
+        tmp_path = f"{path}.tmp"
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        os.makedirs(tmp_path)
+        self.estimator.save(tmp_path)
+        with open(os.path.join(tmp_path, ARTIFACT_META_FILE), 'w') as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """
+        Rebuild a trained predictor from an artifact written by `save`.
+        With `mmap` the estimator's arrays are memory-mapped read-only, so all
+        workers on a host serving the same version share them.
+        Raises ValueError if the artifact was written by an incompatible version.
+        """
+        with open(os.path.join(path, ARTIFACT_META_FILE)) as f:
+            meta = json.load(f)
+        if meta.get('format_version') != ARTIFACT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported model artifact format: {meta.get('format_version')}")
+
+        predictor = cls(
+            csv_path=meta['csv_path'],
+            train=False,
+            backend=meta['backend'],
+            backend_params=meta['backend_params'],
+            include_education=meta['include_education'],
+        )
+        predictor.estimator.load(path, mmap=mmap)
+        predictor._set_feature_state(meta)
+        predictor.dataset_hash = meta.get('dataset_hash')
+        predictor.version = meta['version']
+        predictor.trained_at = meta['trained_at']
+        predictor.training_seconds = meta.get('training_seconds')
+        predictor.phase_timings = meta.get('phase_timings', {})
+        predictor.is_trained = True
+        return predictor
+
+    def _predict_proba(self, X):
+        # Backends may have a cheaper path for the single-user case
+        if X.shape[0] == 1:
+            return self.estimator.predict_proba_row(X)[None, :]
+        return self.estimator.predict_proba(X)
+
+    def predict_roles(self, user_skills, education=None):
+        return self.predict_roles_batch([user_skills], [education])[0]
+
+    def predict_roles_batch(self, skill_lists, educations=None, top_k=TOP_K_ROLES):
+        """
+        Score many users at once. `skill_lists` holds one list of skill names per
+        user; the result holds one `predict_roles`-style list per user, in order.
+        `educations` optionally holds one {'degree', 'cgpa', 'grade'} dict (or
+        None) per user and is only used by education-aware models.
+        All users are encoded into a single sparse matrix and scored with one
+        predict_proba call.
+        """
+        results = [[] for _ in skill_lists]
+        if not self.is_trained or not skill_lists:
+            return results
+
         # Let's clean user skills
-        user_skills_clean = [s.strip().lower() for s in user_skills]
-        
-        # MLB.set_params might not set unknown ignore.
-        # Safe way: Only keep skills known to MLB
-        known_skills = set(self.mlb.classes_)
-        valid_skills = [s for s in user_skills_clean if s in known_skills]
-        
-        if not valid_skills:
-            return [] # No relevant skills
-
-        X_user = self.mlb.transform([valid_skills])
-        
-        # Get probabilities
-        probs = self.model.predict_proba(X_user)[0]
-        
-        # Map class names to probabilities
-        role_probs = dict(zip(self.model.classes_, probs))
-        
-        # Sort by probability
-        sorted_roles = sorted(role_probs.items(), key=lambda item: item[1], reverse=True)
-        
-        top_3 = sorted_roles[:3]
-        
-        results = []
-        for role, prob in top_3:
-            if prob > 0: # Only include if there's some match
-                # Determine missing skills (simple heuristic)
-                # Find a row in DF with this role and compare skills
-                # This is a bit naive for ML but works for simple feedback
-                
-                # Get all skills associated with this role in dataset
-                role_rows = self.df[self.df['job_role'] == role]
-                all_role_skills = set()
-                for skills_str in role_rows['skills']:
-                    all_role_skills.update(skills_str.split(','))
-                
-                missing = list(all_role_skills - set(user_skills_clean))
-                # Limit missing skills to top 5 most common or just first few
-                missing = missing[:5]
-
-                results.append({
-                    "role": role,
-                    "match_percentage": round(prob * 100, 1),
-                    "missing_skills": missing
-                })
-        
+        cleaned = [[s.strip().lower() for s in skills] for skills in skill_lists]
+
+        # Unknown skills are dropped by the encoder; users left with no
+        # known skill get no prediction
+        X_users = self.encoder.transform(cleaned)
+        rows = np.flatnonzero(np.diff(X_users.indptr))
+        if not len(rows):
+            return results # No relevant skills
+
+        if self.encodes_education:
+            education = education_frame(educations or [None] * len(skill_lists))
+            X_users = hstack([X_users, self._encode_education(education)], format='csr')
+
+        probs = self._predict_proba(X_users[rows])
+
+        # Pick the top k columns per row without sorting every class,
+        # then order just those k by probability
+        k = min(top_k, probs.shape[1])
+        top_idx = np.argpartition(-probs, k - 1, axis=1)[:, :k]
+        top_probs = np.take_along_axis(probs, top_idx, axis=1)
+        order = np.argsort(-top_probs, axis=1, kind='stable')
+        top_idx = np.take_along_axis(top_idx, order, axis=1)
+        top_probs = np.take_along_axis(top_probs, order, axis=1)
+
+        classes = self.estimator.classes_
+        for row, user_index in enumerate(rows):
+            user_results = results[user_index]
+            for class_index, prob in zip(top_idx[row], top_probs[row]):
+                if prob > 0: # Only include if there's some match
+                    role = str(classes[class_index])
+                    user_results.append({
+                        "role": role,
+                        "match_percentage": round(float(prob) * 100, 1),
+                        # Suggest the role's most common skills the user is missing
+                        "missing_skills": self.missing_skills(role, cleaned[user_index])
+                    })
+
         return results
@@ -1,5 +1,22 @@
 import re
 
+import numpy as np
+
+# Letter grades on a 10-point scale (common Indian grading, where S/O appear)
+GRADE_POINTS = {
+    'O': 10.0,
+    'S': 9.0,
+    'A+': 9.0,
+    'A': 8.0,
+    'B+': 7.0,
+    'B': 6.0,
+    'C+': 5.0,
+    'C': 4.0,
+    'D': 3.0,
+    'F': 0.0,
+    'E': 0.0
+}
+
 class EducationPreprocessor:
     @staticmethod
     def validate_education_data(data):
@@ -39,24 +56,8 @@ class EducationPreprocessor:
             return None
             
         grade = grade.strip().upper()
-        mapping = {
-            'O': 10.0,
-            'S': 9.0, # Sometimes S is 10, O is 10. Adjusting for common Indian context or US?
-                      # Let's assume standard 4.0 or 10.0 scale mapping or just simple encoding.
-                      # Let's use a standard 10-point mapping often used in India (since regex had S/O)
-            'A+': 9.0,
-            'A': 8.0, 
-            'B+': 7.0,
-            'B': 6.0,
-            'C+': 5.0,
-            'C': 4.0,
-            'D': 3.0,
-            'F': 0.0,
-            'E': 0.0
-        }
-        
-        if grade in mapping:
-            return mapping[grade]
+        if grade in GRADE_POINTS:
+            return GRADE_POINTS[grade]
         
         # If it's already a number, return it
         try:
@@ -92,3 +93,39 @@ class EducationPreprocessor:
             'encoded_grade': encoded_grade,
             'normalized_cgpa': normalized_cgpa
         }
+
+    @classmethod
+    def preprocess_batch(cls, data, scale=10.0):
+        """
+        Vectorized `preprocess` for many education records at once.
+        `data` is an Education queryset or a DataFrame with `grade` and/or
+        `cgpa` columns. Returns NumPy arrays in input order; grades that cannot
+        be encoded are NaN (where `encode_grade` returns None).
+        """
+        import pandas as pd
+
+        if hasattr(data, 'values_list'):
+            df = pd.DataFrame.from_records(list(data.values_list('grade', 'cgpa')), columns=['grade', 'cgpa'])
+        else:
+            df = data
+
+        n_rows = len(df)
+        if 'grade' in df:
+            grades = df['grade'].astype('string').str.strip().str.upper()
+            encoded = grades.map(GRADE_POINTS).astype('Float64')
+            # Anything that isn't a letter grade may already be numeric
+            encoded = encoded.fillna(pd.to_numeric(grades, errors='coerce'))
+            encoded_grade = encoded.to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            encoded_grade = np.full(n_rows, np.nan)
+
+        if 'cgpa' in df and scale > 0:
+            cgpa = pd.to_numeric(df['cgpa'], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+            normalized_cgpa = np.clip(np.nan_to_num(cgpa / scale, nan=0.0), 0.0, 1.0)
+        else:
+            normalized_cgpa = np.zeros(n_rows)
+
+        return {
+            'encoded_grade': encoded_grade,
+            'normalized_cgpa': normalized_cgpa
+        }
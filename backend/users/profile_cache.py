@@ -0,0 +1,46 @@
+import hashlib
+
+from django.core.cache import caches
+from django.db.models import F, prefetch_related_objects
+
+from .models import User
+
+PROFILE_CACHE_ALIAS = 'profiles'
+
+# Related rows DetailedUserSerializer renders
+PROFILE_RELATIONS = ('education', 'job_history', 'skills', 'certifications')
+
+
+def profile_cache_key(user, request):
+    # Image fields serialize as absolute URLs, so the host is part of the key
+    origin = hashlib.sha1(request.build_absolute_uri('/').encode('utf-8')).hexdigest()[:12]
+    return f"profile:{user.pk}:{user.profile_version}:{origin}"
+
+
+def bump_profile_version(user):
+    """
+    Invalidate every cached snapshot of the user's profile. Call after the
+    change is saved: a reader that raced it can only cache fresh data under
+    the old version, which nobody reads any more.
+    """
+    User.objects.filter(pk=user.pk).update(profile_version=F('profile_version') + 1)
+
+
+def cached_profile(user, request):
+    """
+    DetailedUserSerializer output for `user`, cached under its profile version.
+
+    `user` must be freshly loaded for this request (request.user is) so the
+    version is current. On a miss the related rows come from one prefetch
+    pass instead of a query per serializer field.
+    """
+    from .serializers import DetailedUserSerializer
+
+    cache = caches[PROFILE_CACHE_ALIAS]
+    key = profile_cache_key(user, request)
+    data = cache.get(key)
+    if data is None:
+        prefetch_related_objects([user], *PROFILE_RELATIONS)
+        data = DetailedUserSerializer(user, context={'request': request}).data
+        cache.set(key, data)
+    return data
@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from .models import User, Education, JobHistory, Skill, Certification, Feedback
+from .models import User, Education, JobHistory, Skill, Certification, Feedback, CareerPrediction
 from django.contrib.auth.hashers import make_password
 
 class UserSerializer(serializers.ModelSerializer):
@@ -73,6 +73,17 @@ class FeedbackSerializer(serializers.ModelSerializer):
         model = Feedback
         fields = ['id', 'user', 'message', 'rating', 'created_at']
 
+class PredictionLogSerializer(serializers.ModelSerializer):
+    # Same shape as the dashboard's prediction_logs rows
+    user = serializers.CharField(source='user.username', read_only=True)
+    role = serializers.CharField(source='predicted_role', read_only=True)
+    match = serializers.FloatField(source='match_percentage', read_only=True)
+
+    class Meta:
+        model = CareerPrediction
+        fields = ['id', 'user', 'role', 'match', 'created_at', 'is_flagged']
+        read_only_fields = fields
+
 class ChangePasswordSerializer(serializers.Serializer):
     old_password = serializers.CharField(required=True)
     new_password = serializers.CharField(required=True)
@@ -146,3 +157,26 @@ class SupportTicketSerializer(serializers.ModelSerializer):
         model = SupportTicket
         fields = ['id', 'user', 'user_username', 'user_email', 'subject', 'is_resolved', 'created_at', 'updated_at', 'messages']
         read_only_fields = ['user', 'messages']
+
+class SupportTicketSummarySerializer(serializers.ModelSerializer):
+    # Inbox row: ticket header plus the denormalized last-message fields, no messages
+    user_username = serializers.ReadOnlyField(source='user.username')
+    user_email = serializers.ReadOnlyField(source='user.email')
+
+    class Meta:
+        model = SupportTicket
+        fields = [
+            'id', 'user', 'user_username', 'user_email', 'subject', 'is_resolved', 'created_at', 'updated_at',
+            'last_message_at', 'last_message_preview', 'message_count', 'unread_by_admin', 'unread_by_user',
+        ]
+        read_only_fields = fields
+
+from .models import TrainingJob
+
+class TrainingJobSerializer(serializers.ModelSerializer):
+    created_by = serializers.StringRelatedField(read_only=True)
+
+    class Meta:
+        model = TrainingJob
+        fields = ['id', 'kind', 'status', 'progress', 'message', 'error', 'dataset_hash', 'model_version', 'duration_seconds', 'phase_timings', 'result', 'created_by', 'created_at', 'started_at', 'finished_at', 'updated_at']
+        read_only_fields = fields
@@ -0,0 +1,146 @@
+from itertools import groupby
+
+from django.db import connection, transaction
+from django.db.models import F
+
+from .counters import PREDICTIONS, add_to_counters, role_counter
+from .models import CareerPrediction, Education, Skill, User
+
+# Users scored per predict_roles_batch call when recomputing everyone
+RECOMPUTE_CHUNK_SIZE = 500
+
+# Most recent first; an ongoing degree (no end year) counts as the latest
+EDUCATION_RECENCY = (F('end_year').desc(nulls_first=True), F('start_year').desc(), '-id')
+
+
+def latest_education(user):
+    """
+    The user's most recent education as a {'degree', 'grade', 'cgpa'} dict, or None.
+    """
+    return user.education.order_by(*EDUCATION_RECENCY).values('degree', 'grade', 'cgpa').first()
+
+
+def latest_educations(user_ids):
+    """
+    `latest_education` for many users in one query, as a dict keyed by user id.
+    """
+    educations = {}
+    rows = Education.objects.filter(user_id__in=user_ids)\
+        .order_by('user_id', *EDUCATION_RECENCY)\
+        .values('user_id', 'degree', 'grade', 'cgpa')
+    for row in rows:
+        user_id = row.pop('user_id')
+        educations.setdefault(user_id, row)
+    return educations
+
+
+def save_predictions(user, predictions):
+    """
+    Persist a user's predictions, refreshing the row if the role was predicted before.
+    """
+    return bulk_save_predictions({user.pk: predictions})
+
+
+def bulk_save_predictions(predictions_by_user):
+    """
+    Upsert predictions for many users with one bulk INSERT ... ON CONFLICT.
+    `predictions_by_user` maps user id -> list of prediction dicts.
+
+    The unique (user, predicted_role) constraint makes this race-safe: a
+    concurrent request predicting the same role updates the row instead of
+    duplicating it. created_at and is_flagged are left as they were.
+
+    The upsert isn't the only statement. bulk_create can't say which rows it
+    inserted and which it refreshed, and only new rows count towards the
+    dashboard counters, so one transaction runs:
+    - SELECT ... FOR UPDATE on the users, so concurrent saves for the same
+      user queue up behind each other
+    - a SELECT of the (user, role) pairs that already exist
+    - the upsert
+    - one UPDATE per counter that changed
+    """
+    rows = [
+        CareerPrediction(
+            user_id=user_id,
+            predicted_role=p['role'],
+            match_percentage=p['match_percentage'],
+            missing_skills=",".join(p['missing_skills']),
+        )
+        for user_id, preds in predictions_by_user.items()
+        for p in preds
+    ]
+    if not rows:
+        return 0
+
+    conflict_target = {}
+    # MySQL's ON DUPLICATE KEY UPDATE takes no target; SQLite/PostgreSQL require one
+    if connection.features.supports_update_conflicts_with_target:
+        conflict_target['unique_fields'] = ['user', 'predicted_role']
+
+    with transaction.atomic():
+        # Locking the users serializes concurrent upserts for the same user, so
+        # the existing-row check below can't race with another insert
+        user_ids = list(predictions_by_user)
+        list(User.objects.select_for_update().filter(pk__in=user_ids).values_list('pk', flat=True))
+        existing = set(
+            CareerPrediction.objects
+            .filter(user_id__in=user_ids, predicted_role__in={row.predicted_role for row in rows})
+            .values_list('user_id', 'predicted_role')
+        )
+        deltas = {}
+        for row in rows:
+            if (row.user_id, row.predicted_role) not in existing:
+                deltas[PREDICTIONS] = deltas.get(PREDICTIONS, 0) + 1
+                name = role_counter(row.predicted_role)
+                deltas[name] = deltas.get(name, 0) + 1
+
+        CareerPrediction.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            # updated_at is stamped by auto_now on insert and copied on conflict
+            update_fields=['match_percentage', 'missing_skills', 'updated_at'],
+            **conflict_target,
+        )
+        add_to_counters(deltas)
+    return len(rows)
+
+
+def recompute_all_predictions(predictor, chunk_size=RECOMPUTE_CHUNK_SIZE):
+    """
+    Refresh stored predictions for every user that has skills.
+
+    Users are walked in keyset pages by user id (no server-side cursor, which
+    MySQL would buffer in full anyway), so only `chunk_size` users are held in
+    memory at a time; each chunk is scored with a single batch call and
+    written back in bulk.
+    """
+    users_processed = 0
+    predictions_saved = 0
+    last_user_id = 0
+
+    while True:
+        user_ids = list(
+            Skill.objects.filter(user_id__gt=last_user_id)
+            .order_by('user_id').values_list('user_id', flat=True).distinct()[:chunk_size]
+        )
+        if not user_ids:
+            break
+        last_user_id = user_ids[-1]
+
+        # Ids came back sorted, so the page is one index range
+        skill_rows = Skill.objects.filter(user_id__gte=user_ids[0], user_id__lte=last_user_id)\
+            .order_by('user_id', 'id').values_list('user_id', 'name')
+        chunk = {user_id: [name for _, name in rows] for user_id, rows in groupby(skill_rows, key=lambda row: row[0])}
+
+        educations = None
+        if predictor.encodes_education:
+            by_user = latest_educations(user_ids)
+            educations = [by_user.get(user_id) for user_id in chunk]
+        results = predictor.predict_roles_batch(list(chunk.values()), educations)
+        predictions_saved += bulk_save_predictions(dict(zip(chunk, results)))
+        users_processed += len(chunk)
+
+    return {
+        'users_processed': users_processed,
+        'predictions_saved': predictions_saved,
+    }
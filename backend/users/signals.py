@@ -0,0 +1,82 @@
+from django.db.models.signals import post_delete, post_init, post_save, pre_delete
+from django.dispatch import receiver
+
+from .counters import (
+    FEEDBACK, FEEDBACK_RATING_SUM, FLAGGED_PREDICTIONS, PREDICTIONS, USERS,
+    add_to_counters, role_counter,
+)
+from .models import CareerPrediction, Feedback, User
+
+# Dashboard counters follow single-row saves and deletes here, cascades
+# included. Counted models save inside a transaction (CountedModel) and
+# deletes are counted in pre_delete, inside the delete's transaction, while
+# deferred fields can still be loaded; either way the counters commit or roll
+# back with the row. Bulk writes bypass signals: bulk_save_predictions updates
+# the counters itself, and rebuild_dashboard_counters fixes anything else.
+
+
+def _loaded(instance, field):
+    # Read without triggering a query for deferred fields
+    return instance.__dict__.get(field)
+
+
+@receiver(post_init, sender=CareerPrediction)
+def remember_prediction_state(sender, instance, **kwargs):
+    # What the counters currently include for this row
+    instance._counted = (_loaded(instance, 'predicted_role'), _loaded(instance, 'is_flagged'))
+
+
+@receiver(post_save, sender=CareerPrediction)
+def count_saved_prediction(sender, instance, created, **kwargs):
+    role, flagged = instance.predicted_role, bool(instance.is_flagged)
+    if created:
+        deltas = {PREDICTIONS: 1, role_counter(role): 1, FLAGGED_PREDICTIONS: int(flagged)}
+    else:
+        old_role, old_flagged = instance._counted
+        deltas = {}
+        if old_flagged is not None and bool(old_flagged) != flagged:
+            deltas[FLAGGED_PREDICTIONS] = 1 if flagged else -1
+        if old_role is not None and old_role != role:
+            deltas[role_counter(old_role)] = -1
+            deltas[role_counter(role)] = 1
+    add_to_counters(deltas)
+    instance._counted = (role, flagged)
+
+
+@receiver(pre_delete, sender=CareerPrediction)
+def count_deleted_prediction(sender, instance, **kwargs):
+    role, flagged = instance._counted
+    role = role if role is not None else instance.predicted_role
+    flagged = flagged if flagged is not None else instance.is_flagged
+    add_to_counters({PREDICTIONS: -1, role_counter(role): -1, FLAGGED_PREDICTIONS: -int(bool(flagged))})
+
+
+@receiver(post_init, sender=Feedback)
+def remember_feedback_rating(sender, instance, **kwargs):
+    instance._counted_rating = _loaded(instance, 'rating')
+
+
+@receiver(post_save, sender=Feedback)
+def count_saved_feedback(sender, instance, created, **kwargs):
+    if created:
+        add_to_counters({FEEDBACK: 1, FEEDBACK_RATING_SUM: instance.rating})
+    elif instance._counted_rating is not None:
+        add_to_counters({FEEDBACK_RATING_SUM: instance.rating - instance._counted_rating})
+    instance._counted_rating = instance.rating
+
+
+@receiver(pre_delete, sender=Feedback)
+def count_deleted_feedback(sender, instance, **kwargs):
+    rating = instance._counted_rating if instance._counted_rating is not None else instance.rating
+    add_to_counters({FEEDBACK: -1, FEEDBACK_RATING_SUM: -rating})
+
+
+@receiver(post_save, sender=User)
+def count_new_user(sender, instance, created, **kwargs):
+    if created:
+        add_to_counters({USERS: 1})
+
+
+@receiver(post_delete, sender=User)
+def count_deleted_user(sender, instance, **kwargs):
+    add_to_counters({USERS: -1})
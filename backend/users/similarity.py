@@ -0,0 +1,74 @@
+import numpy as np
+
+
+class SkillIndexMatcher:
+    """
+    Role matching by weighted skill overlap with training rows.
+
+    Training builds an inverted index (skill column -> rows that list it) and
+    an IDF weight per skill. A user is compared only with rows sharing at
+    least one of their skills, using IDF-weighted Jaccard similarity, and each
+    role scores as its best matching row. Query cost therefore depends on the
+    user's skills and their posting-list lengths, not on the dataset size.
+
+    Follows the scikit-learn classifier surface (`fit`, `predict_proba`,
+    `classes_`) so it can be used as an estimator backend; the "probabilities"
+    are similarity scores in [0, 1] and do not sum to one.
+    """
+
+    def fit(self, X, y):
+        X = X.tocsr()
+        n_rows, n_features = X.shape
+        self.classes_, self.row_roles = np.unique(np.asarray(y), return_inverse=True)
+
+        # Smoothed IDF, as in TfidfTransformer, so rare skills count for more
+        doc_freq = np.bincount(X.indices, minlength=n_features)
+        self.idf = np.log((1.0 + n_rows) / (1.0 + doc_freq)) + 1.0
+
+        binary = X.copy()
+        binary.data[:] = 1.0
+        self.row_weight = np.asarray(binary @ self.idf).ravel()
+
+        # CSC layout of the same matrix is exactly the inverted index
+        postings = binary.tocsc()
+        postings.sort_indices()
+        self.posting_indptr = postings.indptr.astype(np.int64)
+        self.posting_rows = postings.indices.astype(np.int32)
+        return self
+
+    def score_row(self, cols):
+        """
+        Best weighted-Jaccard similarity per role for one user's skill columns.
+        """
+        scores = np.zeros(len(self.classes_))
+        cols = np.asarray(cols, dtype=np.int64)
+        if not len(cols):
+            return scores
+
+        starts = self.posting_indptr[cols]
+        lengths = self.posting_indptr[cols + 1] - starts
+        total = int(lengths.sum())
+        if not total:
+            return scores
+
+        # Gather the posting lists of the user's skills into one flat array
+        offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        rows = self.posting_rows[np.arange(total) + offsets]
+        weights = np.repeat(self.idf[cols], lengths)
+
+        touched, inverse = np.unique(rows, return_inverse=True)
+        shared = np.bincount(inverse, weights=weights)
+        user_weight = self.idf[cols].sum()
+        similarity = shared / (user_weight + self.row_weight[touched] - shared)
+
+        np.maximum.at(scores, self.row_roles[touched], similarity)
+        return scores
+
+    def predict_proba(self, X):
+        # Row by row keeps memory bounded by one user's posting lists, unlike
+        # a (users x training rows) sparse product
+        X = X.tocsr()
+        scores = np.zeros((X.shape[0], len(self.classes_)))
+        for i in range(X.shape[0]):
+            scores[i] = self.score_row(X.indices[X.indptr[i]:X.indptr[i + 1]])
+        return scores
@@ -0,0 +1,184 @@
+import asyncio
+import json
+import time
+from functools import partial
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core import signing
+from django.core.handlers.asgi import ASGIRequest
+from django.db.models import Max
+from django.http import JsonResponse, StreamingHttpResponse
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+
+from .broadcast import SUPPORT_INBOX_CHANNEL, get_broadcaster, ticket_channel
+from .models import SupportTicket, TicketMessage, User
+from .serializers import TicketMessageSerializer
+from .views import is_support_admin
+
+# Messages read from the database per query while catching up
+BACKFILL_BATCH = 200
+# Reconnect delay suggested to EventSource
+RECONNECT_MS = 3000
+# Stream tokens are signed with this salt, so no other signed value passes as one
+STREAM_TOKEN_SALT = 'users.stream_token'
+
+
+def make_stream_token(user):
+    return signing.TimestampSigner(salt=STREAM_TOKEN_SALT).sign(str(user.pk))
+
+
+class StreamTokenView(APIView):
+    """
+    A token for opening event streams. EventSource can't set headers, so it
+    goes in the URL; unlike the access token it only opens streams and
+    expires after SSE_TOKEN_MAX_AGE seconds.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        return Response({'token': make_stream_token(request.user), 'expires_in': settings.SSE_TOKEN_MAX_AGE})
+
+
+def authenticate_stream(request):
+    """
+    User from a JWT in the Authorization header or a ?stream_token= from
+    StreamTokenView, or None.
+    """
+    auth = JWTAuthentication()
+    header = auth.get_header(request)
+    if header:
+        raw_token = auth.get_raw_token(header)
+        if not raw_token:
+            return None
+        try:
+            return auth.get_user(auth.get_validated_token(raw_token))
+        except (InvalidToken, TokenError, AuthenticationFailed):
+            return None
+
+    stream_token = request.GET.get('stream_token')
+    if not stream_token:
+        return None
+    try:
+        user_id = signing.TimestampSigner(salt=STREAM_TOKEN_SALT).unsign(stream_token, max_age=settings.SSE_TOKEN_MAX_AGE)
+    except signing.BadSignature:
+        return None
+    return User.objects.filter(pk=user_id, is_active=True).first()
+
+
+def resume_after(request, messages):
+    """
+    Message id to resume after: Last-Event-ID (sent by EventSource when it
+    reconnects) or ?last_event_id=, else the newest existing message so
+    only new ones are streamed.
+    """
+    value = request.headers.get('Last-Event-ID') or request.GET.get('last_event_id')
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return messages.aggregate(last=Max('id'))['last'] or 0
+
+
+def messages_after(messages, last_id):
+    # Ids follow insertion order; a message committed late with a lower id
+    # than one already sent is not re-sent
+    rows = messages.filter(id__gt=last_id).select_related('sender').order_by('id')[:BACKFILL_BATCH]
+    return [dict(TicketMessageSerializer(m).data, ticket=m.ticket_id) for m in rows]
+
+
+def sse_event(event_id, event, data):
+    return f"id: {event_id}\nevent: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+async def message_events(channel, messages, last_id):
+    """
+    Subscribe, send everything after `last_id`, then send new messages as the
+    broadcaster announces them, with comment heartbeats in between. Ends
+    after SSE_MAX_STREAM_SECONDS; the client reconnects and resumes.
+    """
+    broadcaster = get_broadcaster()
+    # Subscribed before the first read, so nothing committed in between is missed
+    queue = broadcaster.subscribe(channel)
+    deadline = time.monotonic() + settings.SSE_MAX_STREAM_SECONDS
+    fetch = sync_to_async(partial(messages_after, messages))
+    try:
+        yield f"retry: {RECONNECT_MS}\n\n"
+        while True:
+            rows = await fetch(last_id)
+            for row in rows:
+                last_id = row['id']
+                yield sse_event(row['id'], 'message', row)
+            if len(rows) == BACKFILL_BATCH:
+                continue
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            try:
+                await asyncio.wait_for(queue.get(), timeout=min(settings.SSE_HEARTBEAT_SECONDS, remaining))
+                # One read covers every event queued so far
+                while not queue.empty():
+                    queue.get_nowait()
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+    finally:
+        broadcaster.unsubscribe(channel, queue)
+
+
+def event_stream_response(events):
+    response = StreamingHttpResponse(events, content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # Stop nginx from buffering the stream
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+async def stream_user(request):
+    """
+    (user, None) or (None, error response) for a stream request.
+    """
+    if not isinstance(request, ASGIRequest):
+        # Under WSGI the whole stream would be buffered into one response
+        return None, JsonResponse({'error': 'Live updates need the ASGI server'}, status=503)
+    user = await sync_to_async(authenticate_stream)(request)
+    if user is None:
+        return None, JsonResponse({'error': 'Authentication required'}, status=401)
+    return user, None
+
+
+async def ticket_message_stream(request, pk):
+    """
+    SSE stream of a ticket's new messages, for its owner or an admin.
+    """
+    user, error = await stream_user(request)
+    if error:
+        return error
+    ticket = await SupportTicket.objects.filter(pk=pk).afirst()
+    if ticket is None:
+        return JsonResponse({'error': 'Ticket not found'}, status=404)
+    if ticket.user_id != user.pk and not is_support_admin(user):
+        return JsonResponse({'error': 'Unauthorized'}, status=403)
+
+    messages = TicketMessage.objects.filter(ticket_id=ticket.pk)
+    last_id = await sync_to_async(resume_after)(request, messages)
+    return event_stream_response(message_events(ticket_channel(ticket.pk), messages, last_id))
+
+
+async def support_inbox_stream(request):
+    """
+    Admin-only SSE stream of new messages on every ticket.
+    """
+    user, error = await stream_user(request)
+    if error:
+        return error
+    if not is_support_admin(user):
+        return JsonResponse({'error': 'Unauthorized'}, status=403)
+
+    messages = TicketMessage.objects.all()
+    last_id = await sync_to_async(resume_after)(request, messages)
+    return event_stream_response(message_events(SUPPORT_INBOX_CHANNEL, messages, last_id))
@@ -0,0 +1,157 @@
+import csv
+
+import numpy as np
+
+# Skills in each role's core profile
+ROLE_PROFILE_SIZE = 12
+
+# Columns of ml/career_data.csv, in file order
+CAREER_DATA_COLUMNS = (
+    'degree', 'specialization', 'course', 'college', 'year_of_completion',
+    'cgpa', 'skills', 'certifications', 'job_role',
+)
+
+DEGREES = ('B.Tech', 'B.E', 'B.Sc', 'BCA', 'M.Tech', 'MCA', 'M.Sc', 'MBA')
+SPECIALIZATIONS = (
+    'Computer Science', 'Information Technology', 'Electronics', 'Data Science',
+    'Artificial Intelligence', 'Mathematics', 'Statistics', 'Finance', 'Marketing',
+)
+N_COLLEGES = 200
+COMPLETION_YEARS = (2015, 2025)
+
+# Rows generated and written per batch, so memory stays flat for 1M-row files
+WRITE_CHUNK_ROWS = 50000
+
+
+def make_vocabulary(n_skills=500, n_roles=20, n_certifications=50, seed=0):
+    """
+    Skill, role and certification names plus the per-role structure rows are
+    sampled from. Skill popularity follows a Zipf-like curve and every role
+    has a core skill profile, a preferred degree, specialization and a few
+    typical certifications.
+    """
+    rng = np.random.default_rng(seed)
+    popularity = 1.0 / np.arange(1, n_skills + 1) ** 0.8
+    popularity /= popularity.sum()
+    profile_size = min(ROLE_PROFILE_SIZE, n_skills)
+    n_certifications = max(1, n_certifications)
+
+    return {
+        'rng': rng,
+        'skills': np.array([f"skill_{i}" for i in range(n_skills)]),
+        'roles': np.array([f"Role {i}" for i in range(n_roles)]),
+        'certifications': np.array([f"Certification {i}" for i in range(n_certifications)]),
+        'popularity': popularity,
+        'profiles': np.array([
+            rng.choice(n_skills, size=profile_size, replace=False, p=popularity) for _ in range(n_roles)
+        ]),
+        'role_degree': rng.integers(0, len(DEGREES), size=n_roles),
+        'role_specialization': rng.integers(0, len(SPECIALIZATIONS), size=n_roles),
+        'role_certifications': rng.integers(0, n_certifications, size=(n_roles, 3)),
+    }
+
+
+def sample_skill_rows(vocab, n_rows, min_skills=3, max_skills=8, noise=0.2):
+    """
+    Draw `n_rows` (role id, skill list) pairs: most skills come from the role's
+    profile, a `noise` fraction are random popular skills.
+    """
+    rng = vocab['rng']
+    profiles = vocab['profiles']
+    n_roles, profile_size = profiles.shape
+    skills = vocab['skills']
+
+    role_ids = rng.integers(0, n_roles, size=n_rows)
+    sizes = rng.integers(min_skills, max_skills + 1, size=n_rows)
+    noise_counts = rng.binomial(sizes, noise)
+    n_core = np.minimum(sizes - noise_counts, profile_size)
+
+    # A random permutation of each row's profile; the first n_core are kept
+    order = np.argsort(rng.random((n_rows, profile_size)), axis=1)
+    core = np.take_along_axis(profiles[role_ids], order, axis=1)
+    extra = rng.choice(len(skills), size=int(noise_counts.sum()), p=vocab['popularity'])
+    extra_ends = np.cumsum(noise_counts)
+
+    skill_lists = []
+    for i in range(n_rows):
+        row = set(core[i, :n_core[i]].tolist())
+        row.update(extra[extra_ends[i] - noise_counts[i]:extra_ends[i]].tolist())
+        skill_lists.append(skills[sorted(row)].tolist())
+    return role_ids, skill_lists
+
+
+def generate_skill_dataset(n_rows, n_skills=500, n_roles=20, min_skills=3, max_skills=8, noise=0.2, seed=0):
+    """
+    Synthetic (skill lists, job roles) with a realistic shape, see `make_vocabulary`.
+    """
+    vocab = make_vocabulary(n_skills, n_roles, seed=seed)
+    role_ids, skill_lists = sample_skill_rows(vocab, n_rows, min_skills, max_skills, noise)
+    return skill_lists, vocab['roles'][role_ids].tolist()
+
+
+def career_data_rows(vocab, n_rows, noise=0.2):
+    """
+    Rows in the career_data.csv schema, as lists in CAREER_DATA_COLUMNS order.
+    """
+    rng = vocab['rng']
+    role_ids, skill_lists = sample_skill_rows(vocab, n_rows, noise=noise)
+
+    # Most people in a role share its usual degree and specialization
+    usual = rng.random(n_rows) >= noise
+    degrees = np.where(usual, vocab['role_degree'][role_ids], rng.integers(0, len(DEGREES), size=n_rows))
+    specializations = np.where(
+        usual, vocab['role_specialization'][role_ids], rng.integers(0, len(SPECIALIZATIONS), size=n_rows),
+    )
+    colleges = rng.integers(0, N_COLLEGES, size=n_rows)
+    years = rng.integers(COMPLETION_YEARS[0], COMPLETION_YEARS[1] + 1, size=n_rows)
+    cgpas = np.round(np.clip(rng.normal(7.6, 0.9, size=n_rows), 5.0, 10.0), 1)
+    n_certs = rng.integers(0, 3, size=n_rows)
+
+    rows = []
+    for i, role_id in enumerate(role_ids):
+        certs = vocab['certifications'][np.unique(vocab['role_certifications'][role_id, :n_certs[i]])]
+        specialization = SPECIALIZATIONS[specializations[i]]
+        rows.append([
+            DEGREES[degrees[i]],
+            specialization,
+            specialization,
+            f"College {colleges[i]}",
+            int(years[i]),
+            float(cgpas[i]),
+            ",".join(skill_lists[i]),
+            ",".join(certs),
+            vocab['roles'][role_id],
+        ])
+    return rows
+
+
+def write_career_csv(path, n_rows, n_skills=500, n_roles=20, n_certifications=50, noise=0.2, seed=0,
+                     chunk_rows=WRITE_CHUNK_ROWS):
+    """
+    Write a synthetic training CSV with the same columns as ml/career_data.csv.
+    Rows are generated in chunks so large files don't have to fit in memory.
+    """
+    vocab = make_vocabulary(n_skills, n_roles, n_certifications, seed=seed)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(CAREER_DATA_COLUMNS)
+        written = 0
+        while written < n_rows:
+            batch = min(chunk_rows, n_rows - written)
+            writer.writerows(career_data_rows(vocab, batch, noise=noise))
+            written += batch
+    return written
+
+
+def parse_row_count(value):
+    """
+    Row counts as plain integers or with a k/m suffix ("10k", "1M").
+    """
+    value = str(value).strip().lower()
+    multiplier = {'k': 1000, 'm': 1000000}.get(value[-1:], 1)
+    if multiplier != 1:
+        value = value[:-1]
+    rows = int(float(value) * multiplier)
+    if rows <= 0:
+        raise ValueError(f"Row count must be positive: {value}")
+    return rows
@@ -1,3 +1,705 @@
-from django.test import TestCase
+import csv
+import io
+import os
+import shutil
+import tempfile
+import time
+from unittest import mock
 
-# Create your tests here.
+import numpy as np
+from django.core.cache import caches
+from django.db import IntegrityError, transaction
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils.http import http_date
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+from scipy.sparse import csr_matrix
+from sklearn.ensemble import RandomForestClassifier
+
+from .benchmarking import random_skill_rows
+from .counters import count_from_tables, dashboard_counters, rebuild_counters
+from .dataset import (
+    MIN_DATASET_ROWS, DatasetValidationError, FingerprintStore, dataset_content_hash, ingest_training_csv,
+)
+from .forest_engine import FlatForest
+from .model_registry import ModelRegistry
+from .models import CareerPrediction, Feedback, StatCounter, SupportTicket, User
+from .pagination import NewestFirstPagination
+from .prediction_cache import PREDICTION_CACHE_ALIAS, cached_predict_roles, prediction_cache_key
+from .profile_cache import PROFILE_CACHE_ALIAS, bump_profile_version
+from .serializers import UserSerializer
+from .services import bulk_save_predictions, save_predictions
+from .stream_views import authenticate_stream, make_stream_token
+from .synthetic import write_career_csv
+from .training import pending_job_for, start_training_job
+
+# FlatForest sums the same leaf values as sklearn, only in a different order
+PROBA_TOLERANCE = 1e-9
+
+
+class TrainedModelMixin:
+    """
+    Tiny forests trained on a small synthetic dataset; every test gets its own
+    empty model directory and registry.
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.work_dir = tempfile.mkdtemp()
+        cls.addClassCleanup(shutil.rmtree, cls.work_dir, ignore_errors=True)
+        cls.csv_path = os.path.join(cls.work_dir, 'career_data.csv')
+        write_career_csv(cls.csv_path, 120, n_skills=30, n_roles=4, n_certifications=5)
+        cls.enterClassContext(override_settings(
+            ML_ESTIMATOR='random_forest',
+            ML_ESTIMATOR_PARAMS={'n_estimators': 5, 'random_state': 0},
+            ML_EDUCATION_FEATURES=False,
+            ML_FEATURE_CACHE_DIR=os.path.join(cls.work_dir, 'features'),
+        ))
+
+    def setUp(self):
+        super().setUp()
+        self.model_dir = tempfile.mkdtemp(dir=self.work_dir)
+        self.registry = ModelRegistry(model_dir=self.model_dir)
+
+    def artifact_names(self):
+        return sorted(name for name in os.listdir(self.model_dir) if name.startswith('career_model_'))
+
+
+class ModelRegistryTests(TrainedModelMixin, TestCase):
+    def test_promote_writes_artifact_and_active_pointer(self):
+        predictor = self.registry.promote(self.registry.train(self.csv_path))
+        self.assertEqual(self.registry.active_version(), predictor.version)
+        self.assertTrue(os.path.isdir(self.registry.artifact_path(predictor.version)))
+        self.assertIs(self.registry.get_predictor(), predictor)
+
+        # A fresh process loads the active artifact instead of retraining
+        loaded = ModelRegistry(model_dir=self.model_dir).get_predictor()
+        self.assertEqual(loaded.version, predictor.version)
+        self.assertEqual(loaded.predict_roles(['skill_1', 'skill_2']), predictor.predict_roles(['skill_1', 'skill_2']))
+
+    def test_promote_prunes_old_artifacts(self):
+        with self.settings(ML_KEEP_ARTIFACTS=2):
+            versions = [self.registry.promote(self.registry.train(self.csv_path)).version for _ in range(4)]
+        self.assertEqual(self.artifact_names(), sorted(f'career_model_{v}' for v in versions[-2:]))
+        self.assertEqual(self.registry.active_version(), versions[-1])
+
+    def test_prune_never_removes_the_active_artifact(self):
+        with self.settings(ML_KEEP_ARTIFACTS=0):
+            predictor = self.registry.promote(self.registry.train(self.csv_path))
+        self.assertEqual(self.artifact_names(), [f'career_model_{predictor.version}'])
+
+
+class BatchScoringTests(TrainedModelMixin, TestCase):
+    def test_batch_scoring_holds_the_forest_only_for_the_job(self):
+        predictor = self.registry.promote(self.registry.train(self.csv_path))
+        backend = predictor.estimator
+        n_features = backend.get_model().n_features_in_
+        X = skill_matrix(random_skill_rows(n_features, 200, 6, seed=0), n_features)
+        served = backend.predict_proba(X)
+        with mock.patch.object(backend.engine, 'predict_proba', wraps=backend.engine.predict_proba) as engine_batch:
+            with backend.batch_scoring():
+                self.assertIsNotNone(backend._batch_model)
+                batched = backend.predict_proba(X)
+        self.assertEqual(engine_batch.call_count, 0)
+        self.assertIsNone(backend._batch_model)
+        np.testing.assert_allclose(batched, served, atol=PROBA_TOLERANCE)
+
+    def test_batch_model_is_released_when_the_job_fails(self):
+        backend = self.registry.promote(self.registry.train(self.csv_path)).estimator
+        with self.assertRaises(RuntimeError):
+            with backend.batch_scoring():
+                raise RuntimeError('recompute failed')
+        self.assertIsNone(backend._batch_model)
+
+
+class EducationFeatureTests(TrainedModelMixin, TestCase):
+    def test_skill_similarity_indexes_only_skills(self):
+        with self.settings(ML_ESTIMATOR='skill_similarity', ML_ESTIMATOR_PARAMS={}, ML_EDUCATION_FEATURES=True):
+            predictor = self.registry.promote(self.registry.train(self.csv_path))
+            self.assertTrue(predictor.include_education)
+            self.assertFalse(predictor.encodes_education)
+            matcher = predictor.estimator.get_model()
+            self.assertEqual(len(matcher.idf), len(predictor.encoder.vocabulary))
+            education = {'degree': 'B.Tech', 'grade': None, 'cgpa': 8.0}
+            self.assertEqual(
+                predictor.predict_roles(['skill_1', 'skill_2'], education),
+                predictor.predict_roles(['skill_1', 'skill_2']),
+            )
+            # Still matches the setting, so the registry serves it instead of retraining
+            self.assertEqual(ModelRegistry(model_dir=self.model_dir).get_predictor().version, predictor.version)
+
+    def test_forest_appends_education_columns(self):
+        with self.settings(ML_EDUCATION_FEATURES=True):
+            predictor = self.registry.train(self.csv_path)
+        self.assertTrue(predictor.encodes_education)
+        self.assertGreater(predictor.estimator.get_model().n_features_in_, len(predictor.encoder.vocabulary))
+
+
+class ModelHotSwapTests(TrainedModelMixin, TestCase):
+    def test_other_workers_reload_when_the_pointer_changes(self):
+        first = self.registry.promote(self.registry.train(self.csv_path))
+        # Another worker process serving from the same directory
+        worker = ModelRegistry(model_dir=self.model_dir)
+        served = worker.get_predictor()
+        self.assertEqual(served.version, first.version)
+        self.assertIs(worker.get_predictor(), served) # No reload while the pointer is unchanged
+
+        second = self.registry.promote(self.registry.train(self.csv_path))
+        self.assertNotEqual(second.version, first.version)
+        self.assertEqual(worker.get_predictor().version, second.version)
+
+    def test_promote_swaps_in_process(self):
+        first = self.registry.promote(self.registry.train(self.csv_path))
+        self.assertIs(self.registry.get_predictor(), first)
+        second = self.registry.promote(self.registry.train(self.csv_path))
+        self.assertIs(self.registry.get_predictor(), second)
+
+
+class PredictionCacheTests(TrainedModelMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        caches[PREDICTION_CACHE_ALIAS].clear()
+
+    def test_same_skill_set_is_a_cache_hit(self):
+        predictor = self.registry.promote(self.registry.train(self.csv_path))
+        with mock.patch.object(predictor, 'predict_roles', wraps=predictor.predict_roles) as predict:
+            first = cached_predict_roles(predictor, ['skill_1', 'Skill_2'])
+            # Order, case, whitespace and duplicates don't change the skill set
+            second = cached_predict_roles(predictor, [' skill_2', 'SKILL_1', 'skill_1'])
+        self.assertEqual(first, second)
+        self.assertEqual(predict.call_count, 1)
+
+    def test_promote_invalidates_cached_predictions(self):
+        first = self.registry.promote(self.registry.train(self.csv_path))
+        cached_predict_roles(first, ['skill_1'])
+        cache = caches[PREDICTION_CACHE_ALIAS]
+        self.assertIsNotNone(cache.get(prediction_cache_key(first.version, ['skill_1'])))
+
+        second = self.registry.promote(self.registry.train(self.csv_path))
+        self.assertIsNone(cache.get(prediction_cache_key(first.version, ['skill_1'])))
+        with mock.patch.object(second, 'predict_roles', wraps=second.predict_roles) as predict:
+            cached_predict_roles(second, ['skill_1'])
+        self.assertEqual(predict.call_count, 1)
+
+    def test_unversioned_predictor_is_never_cached(self):
+        # Trained but not yet promoted
+        predictor = self.registry.train(self.csv_path)
+        with mock.patch.object(predictor, 'predict_roles', return_value=[]) as predict:
+            cached_predict_roles(predictor, ['skill_1'])
+            cached_predict_roles(predictor, ['skill_1'])
+        self.assertEqual(predict.call_count, 2)
+
+
+def csv_upload(text):
+    # Uploaded files iterate line by line as bytes, like this
+    return io.BytesIO(text.encode('utf-8'))
+
+
+class DatasetIngestionTests(TestCase):
+    header = 'degree,Skills,job_role\n'
+
+    def setUp(self):
+        self.dest = os.path.join(tempfile.mkdtemp(), 'career_data.csv')
+        self.addCleanup(shutil.rmtree, os.path.dirname(self.dest))
+
+    def valid_rows(self, n):
+        return ''.join(f'B.Tech,"python,skill_{i}",Role {i % 3}\n' for i in range(n))
+
+    def test_writes_the_canonical_dataset(self):
+        report = ingest_training_csv(csv_upload(self.header + 'BCA," Python , SQL,python",Data Analyst\n' + self.valid_rows(5)), self.dest)
+        self.assertEqual((report['rows_read'], report['rows_written']), (6, 6))
+        with open(self.dest, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[0], ['degree', 'skills', 'job_role'])
+        self.assertEqual(rows[1], ['BCA', 'python,sql', 'Data Analyst'])
+
+    def test_reports_bad_rows_with_line_numbers(self):
+        upload = csv_upload(self.header + self.valid_rows(5) + 'BCA,,Data Analyst\nBCA,python,\nBCA,python\n\n')
+        report = ingest_training_csv(upload, self.dest)
+        self.assertEqual(report['rows_written'], 5)
+        self.assertEqual(report['error_count'], 3)
+        self.assertEqual([error['line'] for error in report['errors']], [7, 8, 9])
+        self.assertIn('Missing skills', report['errors'][0]['error'])
+        self.assertIn('Missing job_role', report['errors'][1]['error'])
+
+    def test_error_list_is_truncated(self):
+        upload = csv_upload(self.header + self.valid_rows(5) + 'BCA,,Data Analyst\n' * 10)
+        report = ingest_training_csv(upload, self.dest, max_errors=3)
+        self.assertEqual(report['error_count'], 10)
+        self.assertEqual(len(report['errors']), 3)
+        self.assertTrue(report['errors_truncated'])
+
+    def test_drops_duplicate_rows(self):
+        duplicates = 'B.Tech," PYTHON,skill_0 ",Role 0\nB.Tech,"python,skill_1",Role 1\n'
+        report = ingest_training_csv(csv_upload(self.header + self.valid_rows(5) + duplicates), self.dest)
+        self.assertEqual((report['rows_written'], report['duplicates_skipped']), (5, 2))
+        with open(self.dest, encoding='utf-8') as f:
+            self.assertEqual(len(f.readlines()), 6)
+
+    def test_drops_duplicates_across_dedupe_chunks(self):
+        # Chunks of 4: duplicates land in the same chunk and in later ones
+        rows = self.valid_rows(10)
+        with mock.patch('users.dataset.DEDUPE_CHUNK_ROWS', 4):
+            report = ingest_training_csv(csv_upload(self.header + rows + self.valid_rows(3) + rows), self.dest)
+        self.assertEqual((report['rows_written'], report['duplicates_skipped']), (10, 13))
+        with open(self.dest, newline='', encoding='utf-8') as f:
+            written = list(csv.reader(f))[1:]
+        self.assertEqual([row[1] for row in written], [f'python,skill_{i}' for i in range(10)])
+
+    def test_rejects_too_few_valid_rows(self):
+        upload = csv_upload(self.header + self.valid_rows(MIN_DATASET_ROWS - 1) + 'BCA,,Data Analyst\n')
+        with self.assertRaises(DatasetValidationError) as raised:
+            ingest_training_csv(upload, self.dest)
+        self.assertIn('too small', str(raised.exception))
+        self.assertEqual(raised.exception.report['rows_written'], MIN_DATASET_ROWS - 1)
+        self.assertEqual(raised.exception.report['error_count'], 1)
+
+    def test_rejects_missing_columns_and_empty_files(self):
+        with self.assertRaises(DatasetValidationError):
+            ingest_training_csv(csv_upload('degree,job_role\nBCA,Analyst\n'), self.dest)
+        with self.assertRaises(DatasetValidationError):
+            ingest_training_csv(csv_upload(''), self.dest)
+
+
+class FingerprintStoreTests(TestCase):
+    def test_membership_across_merged_runs(self):
+        store = FingerprintStore()
+        rng = np.random.default_rng(0)
+        # Even values in random order; the odd neighbours are never added
+        values = rng.permutation(np.arange(1000, dtype=np.uint64) * np.uint64(2 ** 53 + 2))
+        for start in range(0, 1000, 100):
+            store.add(values[start:start + 100])
+        self.assertEqual(len(store), 1000)
+        self.assertLessEqual(len(store.runs), 4)
+        self.assertTrue(store.contains(values).all())
+        self.assertFalse(store.contains(values + np.uint64(1)).any())
+        self.assertFalse(FingerprintStore().contains(values).any())
+
+
+class DatasetDedupeTests(TrainedModelMixin, TestCase):
+    def reordered_copy(self):
+        # Same data with rows reversed, columns rotated and a duplicate row
+        with open(self.csv_path, newline='', encoding='utf-8') as f:
+            header, *rows = list(csv.reader(f))
+        rows = rows[::-1] + rows[:1]
+        path = os.path.join(self.model_dir, 'reordered.csv')
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(header[1:] + header[:1])
+            writer.writerows(row[1:] + row[:1] for row in rows)
+        return path
+
+    def test_content_hash_ignores_row_and_column_order(self):
+        self.assertEqual(dataset_content_hash(self.reordered_copy()), dataset_content_hash(self.csv_path))
+
+    def test_content_hash_changes_with_the_data(self):
+        with open(self.csv_path, encoding='utf-8') as f:
+            lines = f.readlines()
+        path = os.path.join(self.model_dir, 'fewer.csv')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.writelines(lines[:-1])
+        self.assertNotEqual(dataset_content_hash(path), dataset_content_hash(self.csv_path))
+
+    def test_active_model_serves_a_reordered_upload(self):
+        self.registry.promote(self.registry.train(self.csv_path))
+        self.assertTrue(self.registry.serves_dataset(dataset_content_hash(self.reordered_copy())))
+        self.assertFalse(self.registry.serves_dataset('0' * 64))
+        # Other estimator settings would train a different model
+        with self.settings(ML_ESTIMATOR_PARAMS={'n_estimators': 7}):
+            self.assertFalse(self.registry.serves_dataset(dataset_content_hash(self.csv_path)))
+
+    def test_pending_job_only_matches_the_newest_upload(self):
+        with mock.patch('users.training._submit'):
+            job = start_training_job(self.csv_path, dataset_hash='a' * 64)
+            self.assertEqual(pending_job_for('a' * 64), job)
+            start_training_job(self.csv_path, dataset_hash='b' * 64)
+        self.assertIsNone(pending_job_for('a' * 64))
+
+
+def skill_matrix(rows, n_features):
+    indptr = np.cumsum([0] + [len(cols) for cols in rows])
+    data = np.ones(indptr[-1], dtype=np.float32)
+    return csr_matrix((data, np.concatenate(rows), indptr), shape=(len(rows), n_features))
+
+
+class FlatForestTests(TestCase):
+    n_features = 40
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        rows = random_skill_rows(cls.n_features, 300, max_skills=8, seed=1)
+        X = skill_matrix(rows, cls.n_features)
+        # Labels that depend on the skills, so trees grow real splits
+        y = np.array([f"role_{int(cols[0]) % 4}" for cols in rows])
+        cls.forest = RandomForestClassifier(n_estimators=15, random_state=0).fit(X, y)
+        cls.rows = random_skill_rows(cls.n_features, 200, max_skills=8, seed=2)
+        cls.X = skill_matrix(cls.rows, cls.n_features)
+        cls.expected = cls.forest.predict_proba(cls.X)
+
+    def test_single_row_matches_sklearn(self):
+        engine = FlatForest.from_sklearn(self.forest)
+        single = np.vstack([engine.predict_proba_row(cols) for cols in self.rows])
+        np.testing.assert_allclose(single, self.expected, atol=PROBA_TOLERANCE)
+
+    def test_batch_matches_sklearn(self):
+        engine = FlatForest.from_sklearn(self.forest)
+        np.testing.assert_allclose(engine.predict_proba(self.X), self.expected, atol=PROBA_TOLERANCE)
+        self.assertEqual(list(engine.classes_), list(self.forest.classes_))
+
+    def test_memory_mapped_artifact_matches_sklearn(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        FlatForest.from_sklearn(self.forest).save(directory)
+        engine = FlatForest.load(directory, mmap=True)
+        np.testing.assert_allclose(engine.predict_proba(self.X), self.expected, atol=PROBA_TOLERANCE)
+        np.testing.assert_allclose(engine.predict_proba_row(self.rows[0]), self.expected[0], atol=PROBA_TOLERANCE)
+
+
+class DashboardCounterTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='alice', password='pw')
+        self.other = User.objects.create_user(username='bob', password='pw')
+
+    def assertCountersMatchTables(self):
+        counters = dict(StatCounter.objects.values_list('name', 'value'))
+        for name, value in count_from_tables().items():
+            self.assertEqual(counters.get(name, 0), value, name)
+
+    def test_single_row_writes_keep_counters_current(self):
+        prediction = CareerPrediction.objects.create(user=self.user, predicted_role='Data Scientist', match_percentage=80)
+        CareerPrediction.objects.create(user=self.other, predicted_role='Data Scientist', match_percentage=60)
+        CareerPrediction.objects.create(user=self.user, predicted_role='Web Developer', match_percentage=40)
+        Feedback.objects.create(user=self.user, message='Great', rating=5)
+        feedback = Feedback.objects.create(user=self.other, message='Meh', rating=2)
+        self.assertCountersMatchTables()
+
+        prediction.is_flagged = True
+        prediction.predicted_role = 'ML Engineer'
+        prediction.save()
+        feedback.rating = 4
+        feedback.save()
+        self.assertCountersMatchTables()
+
+        # Deferred fields must still be counted correctly on delete
+        CareerPrediction.objects.only('id').get(pk=prediction.pk).delete()
+        Feedback.objects.get(pk=feedback.pk).delete()
+        self.assertCountersMatchTables()
+
+        # Cascades go through the same signals
+        self.other.delete()
+        self.assertCountersMatchTables()
+
+    def test_dashboard_counters(self):
+        for role, user in (('Data Scientist', self.user), ('Data Scientist', self.other), ('Web Developer', self.user)):
+            CareerPrediction.objects.create(user=user, predicted_role=role, match_percentage=50)
+        Feedback.objects.create(user=self.user, message='a', rating=5)
+        Feedback.objects.create(user=self.other, message='b', rating=2)
+
+        stats = dashboard_counters()
+        self.assertEqual(stats['total_users'], 2)
+        self.assertEqual(stats['total_predictions'], 3)
+        self.assertEqual(stats['feedback_count'], 2)
+        self.assertEqual(stats['average_rating'], 3.5)
+        self.assertEqual(stats['top_roles'][0], {'predicted_role': 'Data Scientist', 'count': 2})
+
+    def test_failed_counter_update_rolls_back_the_save(self):
+        with mock.patch('users.signals.add_to_counters', side_effect=RuntimeError('counter write failed')):
+            with self.assertRaises(RuntimeError):
+                Feedback.objects.create(user=self.user, message='lost', rating=3)
+        self.assertFalse(Feedback.objects.exists())
+        self.assertCountersMatchTables()
+
+    def test_rebuild_fixes_drift(self):
+        CareerPrediction.objects.create(user=self.user, predicted_role='Data Scientist', match_percentage=50)
+        StatCounter.objects.filter(name='predictions').update(value=99)
+        rebuild_counters()
+        self.assertCountersMatchTables()
+
+
+class PredictionUpsertTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='alice', password='pw')
+        self.other = User.objects.create_user(username='bob', password='pw')
+
+    def prediction(self, role, match, missing=()):
+        return {'role': role, 'match_percentage': match, 'missing_skills': list(missing)}
+
+    def test_repeated_upserts_update_rows_in_place(self):
+        save_predictions(self.user, [self.prediction('Data Scientist', 80, ['sql']), self.prediction('Web Developer', 40)])
+        first = CareerPrediction.objects.get(user=self.user, predicted_role='Data Scientist')
+        CareerPrediction.objects.filter(pk=first.pk).update(is_flagged=True)
+
+        save_predictions(self.user, [self.prediction('Data Scientist', 90, ['docker']), self.prediction('Web Developer', 40)])
+        self.assertEqual(CareerPrediction.objects.filter(user=self.user).count(), 2)
+        row = CareerPrediction.objects.get(pk=first.pk)
+        self.assertEqual((row.match_percentage, row.missing_skills), (90, 'docker'))
+        # Flags and creation time belong to the row, not the prediction
+        self.assertTrue(row.is_flagged)
+        self.assertEqual(row.created_at, first.created_at)
+
+    def test_bulk_upsert_counts_only_new_rows(self):
+        bulk_save_predictions({self.user.pk: [self.prediction('Data Scientist', 80)]})
+        bulk_save_predictions({
+            self.user.pk: [self.prediction('Data Scientist', 85), self.prediction('ML Engineer', 60)],
+            self.other.pk: [self.prediction('Data Scientist', 70)],
+        })
+        self.assertEqual(CareerPrediction.objects.count(), 3)
+        stats = dashboard_counters()
+        self.assertEqual(stats['total_predictions'], 3)
+        self.assertEqual(stats['top_roles'][0], {'predicted_role': 'Data Scientist', 'count': 2})
+
+    def test_unique_user_role_constraint(self):
+        CareerPrediction.objects.create(user=self.user, predicted_role='Data Scientist', match_percentage=80)
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            CareerPrediction.objects.create(user=self.user, predicted_role='Data Scientist', match_percentage=50)
+        # Another user may have the same role
+        CareerPrediction.objects.create(user=self.other, predicted_role='Data Scientist', match_percentage=50)
+
+
+class ProfileCacheTests(TestCase):
+    def setUp(self):
+        caches[PROFILE_CACHE_ALIAS].clear()
+        self.user = User.objects.create_user(username='alice', password='pw', first_name='Alice')
+        # A real token, so every request loads the user afresh like production does
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.user)}')
+
+    def add_skill(self, name):
+        response = self.client.post('/api/skills/', {'name': name, 'proficiency': 'Expert'})
+        self.assertEqual(response.status_code, 201)
+
+    def assertProfileFresh(self):
+        user = User.objects.get(pk=self.user.pk)
+        profile = self.client.get('/api/profile/').data
+        self.assertEqual(profile['first_name'], user.first_name)
+        self.assertEqual(sorted(skill['name'] for skill in profile['skills']), sorted(user.skills.values_list('name', flat=True)))
+
+    def test_edits_invalidate_the_cached_profile(self):
+        self.assertProfileFresh()
+        self.add_skill('Python')
+        self.assertProfileFresh()
+        self.assertEqual(self.client.patch('/api/profile/', {'first_name': 'Alicia'}).status_code, 200)
+        self.assertProfileFresh()
+        self.add_skill('SQL')
+        self.assertProfileFresh()
+
+    def test_repeat_reads_come_from_the_cache(self):
+        self.add_skill('Python')
+        self.assertProfileFresh()
+        # Only the token's user lookup; no profile rows are loaded
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.get('/api/profile/').status_code, 200)
+
+    def test_deleting_a_row_invalidates_the_cached_profile(self):
+        self.add_skill('Python')
+        self.add_skill('SQL')
+        self.assertProfileFresh()
+        skill = self.user.skills.get(name='SQL')
+        self.assertEqual(self.client.delete(f'/api/skills/{skill.pk}/').status_code, 204)
+        self.assertProfileFresh()
+
+    def test_saving_a_stale_user_does_not_roll_back_the_version(self):
+        self.assertProfileFresh()
+        # A name edit that loaded the user before a concurrent skill edit
+        stale = User.objects.get(pk=self.user.pk)
+        self.add_skill('Python')
+        self.assertProfileFresh()
+        serializer = UserSerializer(stale, data={'first_name': 'Alicia'}, partial=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        bump_profile_version(stale)
+        self.assertProfileFresh()
+        self.add_skill('SQL')
+        self.assertProfileFresh()
+
+    def test_full_save_keeps_the_bumped_version(self):
+        stale = User.objects.get(pk=self.user.pk)
+        bump_profile_version(self.user)
+        stale.set_password('new-password')
+        stale.save()
+        self.assertEqual(User.objects.get(pk=self.user.pk).profile_version, stale.profile_version + 1)
+
+
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='alice', password='pw')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.ticket = SupportTicket.objects.create(user=self.user, subject='Help')
+
+    def test_unchanged_list_is_not_modified(self):
+        response = self.client.get('/api/support/tickets/')
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+        self.assertIn('no-cache', response['Cache-Control'])
+
+        response = self.client.get('/api/support/tickets/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_new_message_changes_etag(self):
+        etag = self.client.get('/api/support/tickets/')['ETag']
+        self.client.post(f'/api/support/tickets/{self.ticket.pk}/message/', {'message': 'Hello?'})
+
+        response = self.client.get('/api/support/tickets/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_deletes_are_not_hidden_behind_if_modified_since(self):
+        SupportTicket.objects.create(user=self.user, subject='Older')
+        response = self.client.get('/api/support/tickets/')
+        # The newest updated_at would survive the delete below, so lists send no Last-Modified
+        self.assertNotIn('Last-Modified', response)
+        since = http_date(time.time() + 60)
+        SupportTicket.objects.filter(subject='Older').delete()
+        response = self.client.get('/api/support/tickets/', HTTP_IF_MODIFIED_SINCE=since)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['results']), 1)
+
+    def test_etag_is_per_user(self):
+        etag = self.client.get('/api/support/tickets/')['ETag']
+        other = APIClient()
+        other.force_authenticate(User.objects.create_user(username='bob', password='pw'))
+        response = other.get('/api/support/tickets/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+
+class AdminDashboardStatsTests(TestCase):
+    def test_flagged_predictions_are_counted_not_listed(self):
+        admin = User.objects.create_user(username='admin', password='pw', is_staff=True)
+        for role in ('Data Scientist', 'Web Developer'):
+            CareerPrediction.objects.create(user=admin, predicted_role=role, match_percentage=50, is_flagged=True)
+        client = APIClient()
+        client.force_authenticate(admin)
+        response = client.get('/api/admin/stats/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['flagged_count'], 2)
+        # The dashboard pages through them at admin/flagged-predictions/
+        self.assertNotIn('flagged_predictions', response.data)
+        self.assertEqual(len(client.get('/api/admin/flagged-predictions/').data['results']), 2)
+
+
+class CursorPaginationTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='alice', password='pw')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.feedback_ids = [
+            Feedback.objects.create(user=self.user, message=f'#{i}', rating=4).pk
+            for i in range(7)
+        ]
+
+    def test_pages_cover_every_row_once_newest_first(self):
+        url, seen = '/api/feedback/?page_size=3', []
+        while url:
+            page = self.client.get(url).data
+            self.assertLessEqual(len(page['results']), 3)
+            seen += [row['id'] for row in page['results']]
+            url = page['next']
+        self.assertEqual(seen, self.feedback_ids[::-1])
+
+    def test_rows_added_while_paging_are_not_repeated(self):
+        first = self.client.get('/api/feedback/?page_size=3').data
+        Feedback.objects.create(user=self.user, message='late', rating=1)
+        second = self.client.get(first['next']).data
+        first_ids = {row['id'] for row in first['results']}
+        self.assertFalse(first_ids & {row['id'] for row in second['results']})
+
+    def test_page_size_is_capped(self):
+        with mock.patch.object(NewestFirstPagination, 'max_page_size', 2):
+            response = self.client.get('/api/feedback/?page_size=50')
+        self.assertEqual(len(response.data['results']), 2)
+
+
+class TicketInboxTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username='alice', password='pw')
+        self.admin = User.objects.create_user(username='support', password='pw', role='admin')
+        self.owner_client = APIClient()
+        self.owner_client.force_authenticate(self.owner)
+        self.admin_client = APIClient()
+        self.admin_client.force_authenticate(self.admin)
+        self.ticket = SupportTicket.objects.create(user=self.owner, subject='Login broken')
+
+    def post_message(self, client, text):
+        response = client.post(f'/api/support/tickets/{self.ticket.pk}/message/', {'message': text})
+        self.assertEqual(response.status_code, 201)
+        self.ticket.refresh_from_db()
+
+    def test_messages_update_inbox_fields(self):
+        self.post_message(self.owner_client, 'I  cannot\nlog in')
+        self.assertEqual(self.ticket.message_count, 1)
+        self.assertEqual(self.ticket.last_message_preview, 'I cannot log in')
+        self.assertEqual((self.ticket.unread_by_admin, self.ticket.unread_by_user), (1, 0))
+
+        self.post_message(self.admin_client, 'x' * 500)
+        self.assertEqual(self.ticket.message_count, 2)
+        self.assertEqual(len(self.ticket.last_message_preview), 140)
+        # Replying marks the thread read for the admin side
+        self.assertEqual((self.ticket.unread_by_admin, self.ticket.unread_by_user), (0, 1))
+        self.assertEqual(self.ticket.last_message_at, self.ticket.messages.latest('created_at').created_at)
+
+    def test_reading_messages_clears_the_readers_unread_count(self):
+        self.post_message(self.owner_client, 'one')
+        self.post_message(self.owner_client, 'two')
+        self.assertEqual(self.ticket.unread_by_admin, 2)
+
+        response = self.admin_client.get(f'/api/support/tickets/{self.ticket.pk}/messages/')
+        self.assertEqual([row['message'] for row in response.data['results']], ['two', 'one'])
+        self.ticket.refresh_from_db()
+        self.assertEqual(self.ticket.unread_by_admin, 0)
+
+    def test_summary_list(self):
+        self.post_message(self.owner_client, 'hello')
+        rows = self.admin_client.get('/api/support/tickets/?view=summary').data['results']
+        self.assertEqual(len(rows), 1)
+        self.assertNotIn('messages', rows[0])
+        self.assertEqual(rows[0]['last_message_preview'], 'hello')
+        self.assertEqual(rows[0]['unread_by_admin'], 1)
+
+    def test_other_users_cannot_post(self):
+        stranger = APIClient()
+        stranger.force_authenticate(User.objects.create_user(username='mallory', password='pw'))
+        response = stranger.post(f'/api/support/tickets/{self.ticket.pk}/message/', {'message': 'hi'})
+        self.assertEqual(response.status_code, 403)
+        self.ticket.refresh_from_db()
+        self.assertEqual(self.ticket.message_count, 0)
+
+
+class StreamTokenTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='alice', password='pw')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.factory = RequestFactory()
+
+    def stream_request(self, **params):
+        return self.factory.get('/api/support/inbox/stream/', params)
+
+    def test_issued_token_authenticates_streams(self):
+        response = self.client.post('/api/support/stream-token/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(authenticate_stream(self.stream_request(stream_token=response.data['token'])), self.user)
+
+    def test_token_requires_authentication(self):
+        self.assertEqual(APIClient().post('/api/support/stream-token/').status_code, 401)
+
+    def test_expired_token_is_rejected(self):
+        token = make_stream_token(self.user)
+        with mock.patch('django.core.signing.time.time', return_value=time.time() + 3600):
+            self.assertIsNone(authenticate_stream(self.stream_request(stream_token=token)))
+
+    def test_tampered_token_and_inactive_user_are_rejected(self):
+        token = make_stream_token(self.user)
+        self.assertIsNone(authenticate_stream(self.stream_request(stream_token=token[:-1] + 'x')))
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        self.assertIsNone(authenticate_stream(self.stream_request(stream_token=token)))
+
+    def test_access_token_is_not_accepted_in_the_url(self):
+        access = str(AccessToken.for_user(self.user))
+        self.assertIsNone(authenticate_stream(self.stream_request(token=access)))
+        self.assertIsNone(authenticate_stream(self.stream_request(stream_token=access)))
+        # In the Authorization header it still works
+        request = self.factory.get('/api/support/inbox/stream/', HTTP_AUTHORIZATION=f'Bearer {access}')
+        self.assertEqual(authenticate_stream(request), self.user)
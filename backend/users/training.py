@@ -0,0 +1,234 @@
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from .model_registry import get_predictor, registry
+from .models import TrainingJob
+from .services import RECOMPUTE_CHUNK_SIZE, recompute_all_predictions
+
+# Background jobs: model retrains and prediction recomputes, both tracked as
+# TrainingJob rows (see TrainingJob.kind).
+
+# One worker so jobs run one after another instead of competing for CPU; a
+# recompute queued behind a retrain scores with the new model
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='model-training')
+
+# Ids of the queued or running jobs submitted by this process. A heartbeat
+# thread keeps their updated_at fresh, so other processes can tell them apart
+# from jobs whose process died.
+_live_jobs = set()
+_live_jobs_lock = threading.Lock()
+_heartbeat_thread = None
+
+
+def start_training_job(dataset_path, user=None, dataset_hash=''):
+    """
+    Queue a background retrain on `dataset_path` and return its TrainingJob.
+    The job only starts once the surrounding transaction commits.
+    """
+    job = TrainingJob.objects.create(
+        dataset_path=dataset_path,
+        dataset_hash=dataset_hash or '',
+        created_by=user,
+        message='Queued',
+    )
+    transaction.on_commit(lambda: _submit(run_training_job, job.id))
+    return job
+
+
+def start_recompute_job(user=None, chunk_size=RECOMPUTE_CHUNK_SIZE):
+    """
+    Queue a background refresh of every user's stored predictions with the
+    active model and return its TrainingJob.
+    """
+    job = TrainingJob.objects.create(kind='recompute', created_by=user, message='Queued')
+    transaction.on_commit(lambda: _submit(run_recompute_job, job.id, chunk_size))
+    return job
+
+
+def pending_job_for(dataset_hash):
+    """
+    The newest training job if it is still queued or running on this exact
+    dataset. Older jobs don't count: a later upload has replaced their file,
+    and neither do jobs whose process stopped heartbeating.
+    """
+    fail_stale_jobs()
+    latest = TrainingJob.objects.filter(kind='train').order_by('-created_at').first()
+    if latest and latest.dataset_hash == dataset_hash and latest.status in ('queued', 'running'):
+        return latest
+    return None
+
+
+def pending_recompute_job():
+    """
+    A recompute that is still queued or running, if any; a second one would
+    only redo the same work.
+    """
+    fail_stale_jobs()
+    return TrainingJob.objects.filter(kind='recompute', status__in=('queued', 'running')).order_by('-created_at').first()
+
+
+def fail_stale_jobs():
+    """
+    Mark queued or running jobs that haven't heartbeated for
+    ML_TRAINING_JOB_STALE_SECONDS as failed. Their process was restarted or
+    killed, so nothing will ever finish them.
+    """
+    cutoff = timezone.now() - timedelta(seconds=settings.ML_TRAINING_JOB_STALE_SECONDS)
+    count = TrainingJob.objects.filter(status__in=('queued', 'running'), updated_at__lt=cutoff).update(
+        status='failed',
+        message='Training was interrupted (the server restarted or the worker died)',
+        finished_at=timezone.now(),
+        updated_at=timezone.now(),
+    )
+    if count:
+        print(f"Marked {count} orphaned training job(s) as failed")
+    return count
+
+
+def _submit(runner, job_id, *args):
+    global _heartbeat_thread
+    with _live_jobs_lock:
+        _live_jobs.add(job_id)
+        if _heartbeat_thread is None:
+            _heartbeat_thread = threading.Thread(target=_heartbeat, name='training-heartbeat', daemon=True)
+            _heartbeat_thread.start()
+    _executor.submit(runner, job_id, *args)
+
+
+def _heartbeat():
+    # A few beats per stale window, so one slow write doesn't get a job failed
+    interval = max(settings.ML_TRAINING_JOB_STALE_SECONDS / 5, 1)
+    while True:
+        time.sleep(interval)
+        with _live_jobs_lock:
+            job_ids = list(_live_jobs)
+        if not job_ids:
+            continue
+        try:
+            TrainingJob.objects.filter(pk__in=job_ids, status__in=('queued', 'running')).update(updated_at=timezone.now())
+        except Exception as e:
+            print(f"Training job heartbeat failed: {e}")
+        finally:
+            close_old_connections()
+
+
+def _update(job, **fields):
+    for name, value in fields.items():
+        setattr(job, name, value)
+    # auto_now fields are only written when listed
+    job.save(update_fields=[*fields, 'updated_at'])
+
+
+def _claim(job_id):
+    """
+    Mark a queued job running and return it, or None if it waited so long in
+    the queue that it was failed as stale.
+    """
+    close_old_connections()
+    claimed = TrainingJob.objects.filter(pk=job_id, status='queued').update(
+        status='running', updated_at=timezone.now(),
+    )
+    if not claimed:
+        print(f"Job {job_id} is no longer queued; skipping it")
+        _finish(job_id)
+        return None
+    return TrainingJob.objects.get(pk=job_id)
+
+
+def _finish(job_id):
+    with _live_jobs_lock:
+        _live_jobs.discard(job_id)
+    close_old_connections()
+
+
+def _fail(job, message, started):
+    traceback.print_exc()
+    _update(
+        job,
+        status='failed',
+        message=message[:255],
+        error=traceback.format_exc(),
+        duration_seconds=time.perf_counter() - started,
+        finished_at=timezone.now(),
+    )
+
+
+def run_training_job(job_id):
+    """
+    Train, persist and promote a model for the given job, recording progress as it goes.
+    The previous model keeps serving requests until the new one is promoted.
+    """
+    job = _claim(job_id)
+    if job is None:
+        return
+    started = time.perf_counter()
+    try:
+        _update(job, progress=10, message='Training model', started_at=timezone.now())
+        predictor = registry.train(job.dataset_path)
+        if not predictor.is_trained:
+            raise ValueError("Training produced no model; is the dataset missing?")
+
+        _update(
+            job,
+            progress=80,
+            message='Saving and activating model',
+            phase_timings=predictor.phase_timings,
+            dataset_hash=predictor.dataset_hash or '',
+        )
+        registry.promote(predictor)
+
+        _update(
+            job,
+            status='completed',
+            progress=100,
+            message='Model retrained successfully',
+            model_version=predictor.version,
+            duration_seconds=time.perf_counter() - started,
+            finished_at=timezone.now(),
+        )
+    except Exception as e:
+        _fail(job, f'Training failed: {e}', started)
+    finally:
+        _finish(job_id)
+
+
+def run_recompute_job(job_id, chunk_size=RECOMPUTE_CHUNK_SIZE):
+    """
+    Score every user with skills using the active model and store the results.
+    """
+    job = _claim(job_id)
+    if job is None:
+        return
+    started = time.perf_counter()
+    try:
+        _update(job, progress=5, message='Loading model', started_at=timezone.now())
+        predictor = get_predictor()
+        if not predictor.is_trained:
+            raise ValueError("No trained model available")
+
+        _update(job, progress=10, message='Recomputing predictions', model_version=predictor.version)
+        # Whole chunks are scored at once: let the backend load its fastest
+        # batch model for the job and release it when the job ends
+        with predictor.estimator.batch_scoring():
+            result = recompute_all_predictions(predictor, chunk_size=chunk_size)
+
+        _update(
+            job,
+            status='completed',
+            progress=100,
+            message=f"Recomputed predictions for {result['users_processed']} users",
+            result=result,
+            duration_seconds=time.perf_counter() - started,
+            finished_at=timezone.now(),
+        )
+    except Exception as e:
+        _fail(job, f'Recompute failed: {e}', started)
+    finally:
+        _finish(job_id)
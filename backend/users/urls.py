@@ -1,8 +1,9 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import RegisterView, EducationViewSet, JobHistoryViewSet, CustomTokenObtainPairView, UserViewSet, SkillViewSet, CertificationViewSet, ChangePasswordView, UserProfileView, PredictionView, PredictionHistoryView, PredictionDeleteView, GoogleLoginView, FeedbackViewSet, AdminDashboardStatsView, TrainingDataView, PredictionFeedbackView, SupportTicketViewSet, TicketMessageView
+from .views import RegisterView, EducationViewSet, JobHistoryViewSet, CustomTokenObtainPairView, UserViewSet, SkillViewSet, CertificationViewSet, ChangePasswordView, UserProfileView, PredictionView, PredictionHistoryView, PredictionDeleteView, GoogleLoginView, FeedbackViewSet, AdminDashboardStatsView, FlaggedPredictionListView, TrainingDataView, PredictionRecomputeView, ModelReadinessView, PredictionFeedbackView, SupportTicketViewSet, TicketMessageView, TicketMessageListView, TrainingJobViewSet
 
 from .resume_view import ResumeView
+from .stream_views import StreamTokenView, ticket_message_stream, support_inbox_stream
 from rest_framework_simplejwt.views import TokenRefreshView
 
 router = DefaultRouter()
@@ -13,6 +14,7 @@ router.register(r'certifications', CertificationViewSet, basename='certification
 router.register(r'users', UserViewSet, basename='users')
 router.register(r'feedback', FeedbackViewSet, basename='feedback')
 router.register(r'support/tickets', SupportTicketViewSet, basename='support_tickets')
+router.register(r'admin/training-jobs', TrainingJobViewSet, basename='training_jobs')
 
 
 urlpatterns = [
@@ -27,9 +29,16 @@ urlpatterns = [
     path('prediction-delete/<int:pk>/', PredictionDeleteView.as_view(), name='prediction_delete'),
     path('profile/', UserProfileView.as_view(), name='user_profile'),
     path('admin/stats/', AdminDashboardStatsView.as_view(), name='admin_stats'),
+    path('admin/flagged-predictions/', FlaggedPredictionListView.as_view(), name='admin_flagged_predictions'),
     path('admin/upload-data/', TrainingDataView.as_view(), name='admin_upload_data'),
+    path('admin/recompute-predictions/', PredictionRecomputeView.as_view(), name='admin_recompute_predictions'),
+    path('health/ready/', ModelReadinessView.as_view(), name='model_readiness'),
     path('prediction/flag/<int:pk>/', PredictionFeedbackView.as_view(), name='prediction_flag'),
     path('support/tickets/<int:pk>/message/', TicketMessageView.as_view(), name='ticket_message'),
+    path('support/tickets/<int:pk>/messages/', TicketMessageListView.as_view(), name='ticket_messages'),
+    path('support/tickets/<int:pk>/stream/', ticket_message_stream, name='ticket_message_stream'),
+    path('support/inbox/stream/', support_inbox_stream, name='support_inbox_stream'),
+    path('support/stream-token/', StreamTokenView.as_view(), name='support_stream_token'),
 
     path('', include(router.urls)),
 ]
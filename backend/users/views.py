@@ -4,6 +4,35 @@ from .models import User, Education, JobHistory, Skill, Certification, Feedback,
 
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework_simplejwt.views import TokenObtainPairView
+from .profile_cache import bump_profile_version, cached_profile
+from .conditional import ConditionalGetMixin, queryset_validators
+from .pagination import (
+    FlaggedPredictionPagination, NewestFirstPagination, ProfileRowPagination,
+    RecentlyUpdatedPagination, UserListPagination,
+)
+
+class ProfileVersionMixin(ConditionalGetMixin):
+    """
+    For viewsets over the user's own profile rows: every write invalidates
+    the cached profile snapshot, and the profile version doubles as the
+    ETag for list and detail reads.
+    """
+    pagination_class = ProfileRowPagination
+
+    def get_validators(self, request):
+        return f"profile:{request.user.profile_version}", None
+
+    def perform_create(self, serializer):
+        serializer.save(user=self.request.user)
+        bump_profile_version(self.request.user)
+
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        bump_profile_version(self.request.user)
+
+    def perform_destroy(self, instance):
+        super().perform_destroy(instance)
+        bump_profile_version(self.request.user)
 
 class CustomTokenObtainPairView(TokenObtainPairView):
     serializer_class = CustomTokenObtainPairSerializer
@@ -13,29 +42,23 @@ class RegisterView(generics.CreateAPIView):
     permission_classes = (permissions.AllowAny,)
     serializer_class = UserSerializer
 
-class EducationViewSet(viewsets.ModelViewSet):
+class EducationViewSet(ProfileVersionMixin, viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
     serializer_class = EducationSerializer
     
     def get_queryset(self):
         return self.request.user.education.all()
-
-    def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
         
 import os
 
 
-class JobHistoryViewSet(viewsets.ModelViewSet):
+class JobHistoryViewSet(ProfileVersionMixin, viewsets.ModelViewSet):
     serializer_class = JobHistorySerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
         return JobHistory.objects.filter(user=self.request.user)
 
-    def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
-
 class UserViewSet(viewsets.ModelViewSet):
     """
     Admin-only viewset to list and manage users
@@ -43,35 +66,31 @@ class UserViewSet(viewsets.ModelViewSet):
     queryset = User.objects.all()
     serializer_class = UserSerializer
     permission_classes = [permissions.IsAdminUser]
+    pagination_class = UserListPagination
 
     def perform_update(self, serializer):
         instance = serializer.instance
         if 'is_flagged' in self.request.data:
              instance.is_flagged = self.request.data['is_flagged']
-             instance.save()
+             instance.save(update_fields=['is_flagged'])
         super().perform_update(serializer)
+        bump_profile_version(instance)
 
 
-class SkillViewSet(viewsets.ModelViewSet):
+class SkillViewSet(ProfileVersionMixin, viewsets.ModelViewSet):
     serializer_class = SkillSerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
         return self.request.user.skills.all()
 
-    def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
-
-class CertificationViewSet(viewsets.ModelViewSet):
+class CertificationViewSet(ProfileVersionMixin, viewsets.ModelViewSet):
     serializer_class = CertificationSerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
         return self.request.user.certifications.all()
 
-    def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
-
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -86,13 +105,17 @@ class ChangePasswordView(APIView):
                 return Response({"old_password": ["Wrong password."]}, status=status.HTTP_400_BAD_REQUEST)
             
             request.user.set_password(serializer.data.get("new_password"))
-            request.user.save()
+            request.user.save(update_fields=['password'])
             return Response({"success": "Password updated successfully"}, status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-class UserProfileView(generics.RetrieveUpdateAPIView):
+class UserProfileView(ConditionalGetMixin, generics.RetrieveUpdateAPIView):
     permission_classes = [IsAuthenticated]
 
+    def get_validators(self, request):
+        # Every profile edit bumps the version (users/profile_cache.py)
+        return f"profile:{request.user.profile_version}", None
+
     def get_object(self):
         return self.request.user
 
@@ -101,16 +124,28 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
             return DetailedUserSerializer
         return UserSerializer
 
-from .predictor import CareerPredictor
-from .models import CareerPrediction
+    def retrieve(self, request, *args, **kwargs):
+        # Most-requested page, rarely changed: served from the versioned cache
+        return Response(cached_profile(request.user, request))
+
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        bump_profile_version(serializer.instance)
+
+from .model_registry import get_predictor, registry
+from .prediction_cache import cached_predict_roles
+from .models import CareerPrediction, TrainingJob
+from .serializers import TrainingJobSerializer
+from .training import start_training_job, start_recompute_job, pending_job_for, pending_recompute_job
+from .services import save_predictions, latest_education, RECOMPUTE_CHUNK_SIZE
 
 class PredictionView(APIView):
     permission_classes = [IsAuthenticated]
     
     def get(self, request):
         user = request.user
-        # simple caching: if prediction exists and recent (TODO), return it.
-        # For now, always predict fresh based on current skills.
+        # Results are cached per model version and skill set, so repeat
+        # visits and users with identical skills skip the model entirely.
         
         skills = list(user.skills.values_list('name', flat=True))
         
@@ -120,8 +155,10 @@ class PredictionView(APIView):
         if not skills:
              return Response({"message": "Add skills to get career predictions"}, status=status.HTTP_200_OK)
 
-        predictor = CareerPredictor()
-        predictions = predictor.predict_roles(skills)
+        predictor = get_predictor()
+        # Education-aware models also look at the user's most recent degree
+        education = latest_education(user) if predictor.encodes_education else None
+        predictions = cached_predict_roles(predictor, skills, education)
         
         # Save top prediction ? Or all? 
         # Requirement: "save into job history" -> probably separate model "CareerPrediction"
@@ -132,32 +169,26 @@ class PredictionView(APIView):
         # PERSIST HISTORY: Do NOT delete old predictions
         # CareerPrediction.objects.filter(user=user).delete()
         
-        for p in predictions:
-            # DEDUPLICATION: Update timestamp if role already exists
-            CareerPrediction.objects.update_or_create(
-                user=user,
-                predicted_role=p['role'],
-                defaults={
-                    'match_percentage': p['match_percentage'],
-                    'missing_skills': ",".join(p['missing_skills'])
-                }
-                # update_or_create automatically updates 'updated_at' due to auto_now=True
-            )
+        save_predictions(user, predictions)
             
         return Response(predictions, status=status.HTTP_200_OK)
 
-class PredictionHistoryView(generics.ListAPIView):
+class PredictionHistoryView(ConditionalGetMixin, generics.ListAPIView):
     permission_classes = [IsAuthenticated]
+    pagination_class = RecentlyUpdatedPagination
     
     def get_queryset(self):
         # Order by updated_at so most recently refreshed predictions are top
         return CareerPrediction.objects.filter(user=self.request.user).order_by('-updated_at')
 
+    def get_validators(self, request):
+        return queryset_validators(self.get_queryset())
+
     def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
+        page = self.paginate_queryset(self.get_queryset())
         # Custom serialization to handle missing_skills string
         data = []
-        for p in queryset:
+        for p in page:
             data.append({
                 "id": p.id,
                 "role": p.predicted_role,
@@ -166,7 +197,7 @@ class PredictionHistoryView(generics.ListAPIView):
                 "created_at": p.created_at,
                 "updated_at": p.updated_at
             })
-        return Response(data)
+        return self.get_paginated_response(data)
 
     def get_queryset(self):
         # Ensure user can only delete their own predictions
@@ -246,70 +277,82 @@ class FeedbackViewSet(viewsets.ModelViewSet):
     queryset = Feedback.objects.all()
     serializer_class = FeedbackSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = NewestFirstPagination
 
     def get_queryset(self):
         if self.request.user.is_staff:
-            return Feedback.objects.all().order_by('-created_at')
-        return Feedback.objects.filter(user=self.request.user).order_by('-created_at')
+            return Feedback.objects.select_related('user').order_by('-created_at')
+        return Feedback.objects.filter(user=self.request.user).select_related('user').order_by('-created_at')
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
-from django.db.models import Count
+from django.db import transaction
 from django.db.models.functions import TruncDate
+from .serializers import PredictionLogSerializer
+from .counters import dashboard_counters
+
+def prediction_log_rows(queryset):
+    # One JOINed query for the rows and usernames instead of a lookup per row
+    return [
+        {
+            "id": p['id'],
+            "user": p['user__username'],
+            "role": p['predicted_role'],
+            "match": p['match_percentage'],
+            "created_at": p['created_at'],
+            "is_flagged": p['is_flagged'],
+        }
+        for p in queryset.values('id', 'user__username', 'predicted_role', 'match_percentage', 'created_at', 'is_flagged')
+    ]
 
 class AdminDashboardStatsView(APIView):
+    """
+    Admin overview. Runs a fixed number of queries however much data there is:
+    totals come from the materialized counters (users/counters.py), long lists
+    are capped and paginated elsewhere. Flagged predictions are only counted
+    here; the dashboard pages through them at admin/flagged-predictions/.
+    """
     permission_classes = [permissions.IsAdminUser]
 
     def get(self, request):
-        total_users = User.objects.count()
+        # Totals and Career Prediction Trends (Top 5 roles)
+        counters = dashboard_counters(top_roles=5)
         recent_users = User.objects.order_by('-date_joined')[:5]
-        
-        # Career Prediction Trends (Top 5 roles)
-        top_roles = CareerPrediction.objects.values('predicted_role')\
-            .annotate(count=Count('predicted_role'))\
-            .order_by('-count')[:5]
 
         # Recent Feedback
-        recent_feedback = Feedback.objects.order_by('-created_at')[:5]
+        recent_feedback = Feedback.objects.select_related('user').order_by('-created_at')[:5]
 
         # Recent Predictions (System-wide Logs)
-        recent_predictions = CareerPrediction.objects.all().order_by('-created_at')[:20]
-        
-        # Simple serialization for prediction logs
-        predictions_data = []
-        for p in recent_predictions:
-            predictions_data.append({
-                "id": p.id,
-                "user": p.user.username,
-                "role": p.predicted_role,
-                "match": p.match_percentage,
-                "created_at": p.created_at,
-                "is_flagged": p.is_flagged
-            })
-
-        # Flagged Predictions (for review)
-        flagged_predictions = CareerPrediction.objects.filter(is_flagged=True).order_by('-created_at')
-        flagged_data = []
-        for p in flagged_predictions:
-            flagged_data.append({
-                "id": p.id,
-                "user": p.user.username,
-                "role": p.predicted_role,
-                "match": p.match_percentage,
-                "created_at": p.created_at
-            })
+        predictions_data = prediction_log_rows(CareerPrediction.objects.order_by('-created_at')[:20])
 
         data = {
-            "total_users": total_users,
+            "total_users": counters['total_users'],
             "recent_users": UserSerializer(recent_users, many=True).data,
-            "top_roles": top_roles,
+            "top_roles": counters['top_roles'],
             "recent_feedback": FeedbackSerializer(recent_feedback, many=True).data,
             "prediction_logs": predictions_data,
-            "flagged_predictions": flagged_data
+            "flagged_count": counters['flagged_count'],
+            "total_predictions": counters['total_predictions'],
+            "feedback_count": counters['feedback_count'],
+            "average_rating": counters['average_rating'],
         }
         return Response(data)
 
+class FlaggedPredictionListView(generics.ListAPIView):
+    """
+    Admin-only: every flagged prediction, newest first, cursor-paginated.
+    """
+    permission_classes = [permissions.IsAdminUser]
+    serializer_class = PredictionLogSerializer
+    pagination_class = FlaggedPredictionPagination
+
+    def get_queryset(self):
+        return CareerPrediction.objects.filter(is_flagged=True).select_related('user')
+
+
+import tempfile
+from .dataset import ingest_training_csv, DatasetValidationError
 
 class TrainingDataView(APIView):
     permission_classes = [permissions.IsAdminUser]
@@ -322,82 +365,174 @@ class TrainingDataView(APIView):
         if not file.name.endswith('.csv'):
             return Response({'error': 'File must be CSV'}, status=status.HTTP_400_BAD_REQUEST)
         
-        # Save file to ml/temp_career_data.csv first
-        temp_path = os.path.join(settings.BASE_DIR, 'ml', 'temp_career_data.csv')
         final_path = os.path.join(settings.BASE_DIR, 'ml', 'career_data.csv')
-        
-        os.makedirs(os.path.dirname(temp_path), exist_ok=True)
-        
+        os.makedirs(os.path.dirname(final_path), exist_ok=True)
+
+        # Stream the upload into a temp file next to the dataset, validating and
+        # normalizing row by row so large files never sit in memory
+        fd, temp_path = tempfile.mkstemp(prefix='temp_career_data_', suffix='.csv', dir=os.path.dirname(final_path))
+        os.close(fd)
+
         try:
-            with open(temp_path, 'wb+') as destination:
-                for chunk in file.chunks():
-                    destination.write(chunk)
-                    
-            # Validate by trying to load with Predictor
-            # We temporarily patch settings or Predictor to load this specific file?
-            # Or just update Predictor to accept a path arg.
-            
-            # Since Predictor hardcodes path in _train_model, we can swap files if we want to test,
-            # BUT better to modify Predictor to take path. However, to minimize changes,
-            # we can use a helper class or just check columns manually here using pandas?
-            # No, let's just inspect it.
-            
-            import pandas as pd
-            df = pd.read_csv(temp_path)
-            # Normalize headers to lowercase
-            df.columns = [c.lower() for c in df.columns]
-            
-            if 'skills' not in df.columns or 'job_role' not in df.columns:
+            report = ingest_training_csv(file, temp_path)
+            dataset_hash = report['content_hash']
+
+            # Re-uploads of the data behind the active model (or of a retrain
+            # that is already running) don't need another training run
+            if registry.serves_dataset(dataset_hash):
                 os.remove(temp_path)
-                return Response({'error': "Invalid CSV format. Required columns: 'skills', 'job_role'"}, status=status.HTTP_400_BAD_REQUEST)
-            
-            if len(df) < 5:
+                return Response({
+                    'message': 'Dataset unchanged. The active model is already trained on this data.',
+                    'report': report,
+                    'model_version': registry.active_version(),
+                    'job': None,
+                }, status=status.HTTP_200_OK)
+            pending = pending_job_for(dataset_hash)
+            if pending:
                 os.remove(temp_path)
-                return Response({'error': "Dataset too small. Please provide at least 5 records."}, status=status.HTTP_400_BAD_REQUEST)
+                return Response({
+                    'message': 'Dataset unchanged. A retrain on this data is already in progress.',
+                    'report': report,
+                    'job': TrainingJobSerializer(pending).data,
+                }, status=status.HTTP_200_OK)
 
-            # Save normalized dataframe back to temp_path to ensure headers are lowercase for Predictor
-            df.to_csv(temp_path, index=False)
+            # If valid, replace old file in one atomic step
+            os.replace(temp_path, final_path)
 
-             # If valid, replace old file
-            if os.path.exists(final_path):
-                os.remove(final_path)
-            os.rename(temp_path, final_path)
-            
-            # Retrain global model
-            from .predictor import CareerPredictor
-            CareerPredictor() # Re-init triggers retraining
-            
+            # Retrain in the background; the current model keeps serving until then
+            job = start_training_job(final_path, user=request.user, dataset_hash=dataset_hash)
+
+        except DatasetValidationError as e:
+            os.remove(temp_path)
+            return Response({'error': str(e), 'report': e.report}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
             if os.path.exists(temp_path):
                 os.remove(temp_path)
             return Response({'error': f'Failed to process file: {str(e)}'}, status=status.HTTP_400_BAD_REQUEST)
 
-        return Response({'message': 'Training data updated and model retrained successfully!'}, status=status.HTTP_200_OK)
+        return Response({
+            'message': 'Training data updated. Model retraining has started.',
+            'report': report,
+            'job': TrainingJobSerializer(job).data,
+        }, status=status.HTTP_202_ACCEPTED)
+
+class TrainingJobViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Admin-only: status and progress of background retraining and recompute jobs
+    """
+    serializer_class = TrainingJobSerializer
+    permission_classes = [permissions.IsAdminUser]
+
+    def get_queryset(self):
+        return TrainingJob.objects.all().order_by('-created_at')
+
+class PredictionRecomputeView(APIView):
+    """
+    Admin-only: refresh stored predictions for every user with the active model,
+    e.g. after uploading a new dataset. Runs as a background job; poll it at
+    admin/training-jobs/<id>/.
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    def post(self, request):
+        try:
+            chunk_size = int(request.data.get('chunk_size', RECOMPUTE_CHUNK_SIZE))
+        except (TypeError, ValueError):
+            return Response({'error': 'chunk_size must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
+        if chunk_size < 1:
+            return Response({'error': 'chunk_size must be positive'}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Checked without loading the model; the job loads it in the background
+        if not registry.active_version():
+            return Response({'error': 'No trained model available'}, status=status.HTTP_409_CONFLICT)
+
+        pending = pending_recompute_job()
+        if pending:
+            return Response({
+                'message': 'A recompute is already in progress.',
+                'job': TrainingJobSerializer(pending).data,
+            }, status=status.HTTP_202_ACCEPTED)
+
+        job = start_recompute_job(user=request.user, chunk_size=chunk_size)
+        return Response({
+            'message': 'Prediction recompute has started.',
+            'job': TrainingJobSerializer(job).data,
+        }, status=status.HTTP_202_ACCEPTED)
+
+class ModelReadinessView(APIView):
+    """
+    Readiness probe for load balancers: 200 once this worker has a trained
+    model in memory, 503 otherwise. It only reports; anyone can call it, so it
+    never loads or trains a model (use ML_WARMUP_ON_STARTUP for that).
+    """
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    def get(self, request):
+        result = registry.status()
+        code = status.HTTP_200_OK if result['model_loaded'] else status.HTTP_503_SERVICE_UNAVAILABLE
+        return Response(result, status=code)
 
 class PredictionFeedbackView(APIView):
     permission_classes = [IsAuthenticated]
     
     def post(self, request, pk):
         try:
-            prediction = CareerPrediction.objects.get(pk=pk)
-            # Toggle flag
-            prediction.is_flagged = not prediction.is_flagged
-            prediction.save()
+            # Row lock: concurrent toggles apply one after the other, and the
+            # flagged counter commits with the flag
+            with transaction.atomic():
+                prediction = CareerPrediction.objects.select_for_update().get(pk=pk)
+                # Toggle flag
+                prediction.is_flagged = not prediction.is_flagged
+                prediction.save()
             return Response({'status': 'success', 'is_flagged': prediction.is_flagged}, status=status.HTTP_200_OK)
         except CareerPrediction.DoesNotExist:
             return Response({'error': 'Prediction not found'}, status=status.HTTP_404_NOT_FOUND)
 
-from .models import SupportTicket, TicketMessage
-from .serializers import SupportTicketSerializer, TicketMessageSerializer
+from django.db.models import F, Prefetch, Sum
+from django.utils import timezone
+from .models import SupportTicket, TicketMessage, message_preview
+from .serializers import SupportTicketSerializer, SupportTicketSummarySerializer, TicketMessageSerializer
+from .pagination import TicketMessagePagination
+from .broadcast import publish_ticket_message
+
+def is_support_admin(user):
+    return user.role == 'admin' or user.is_staff
 
-class SupportTicketViewSet(viewsets.ModelViewSet):
+class SupportTicketViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     serializer_class = SupportTicketSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = RecentlyUpdatedPagination
+
+    def is_summary(self):
+        # ?view=summary: inbox rows from the denormalized fields, no messages
+        return self.action == 'list' and self.request.query_params.get('view') == 'summary'
+
+    def get_serializer_class(self):
+        if self.is_summary():
+            return SupportTicketSummarySerializer
+        return SupportTicketSerializer
 
     def get_queryset(self):
-        if self.request.user.role == 'admin' or self.request.user.is_staff:
-            return SupportTicket.objects.all().order_by('-updated_at')
-        return SupportTicket.objects.filter(user=self.request.user).order_by('-updated_at')
+        if is_support_admin(self.request.user):
+            queryset = SupportTicket.objects.all()
+        else:
+            queryset = SupportTicket.objects.filter(user=self.request.user)
+        queryset = queryset.select_related('user').order_by('-updated_at')
+        if not self.is_summary():
+            # Full mode nests every message: one extra query, not one per ticket and sender
+            queryset = queryset.prefetch_related(
+                Prefetch('messages', queryset=TicketMessage.objects.select_related('sender').order_by('created_at', 'id'))
+            )
+        return queryset
+
+    def get_validators(self, request):
+        # New messages touch the ticket's updated_at (TicketMessageView);
+        # reading them only resets the unread counters
+        queryset = self.get_queryset()
+        if self.lookup_field in self.kwargs:
+            queryset = queryset.filter(**{self.lookup_field: self.kwargs[self.lookup_field]})
+        return queryset_validators(queryset, unread_admin=Sum('unread_by_admin'), unread_user=Sum('unread_by_user'))
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
@@ -409,28 +544,66 @@ class TicketMessageView(APIView):
         try:
             ticket = SupportTicket.objects.get(pk=pk)
             # Permission check: Admin or Ticket Owner
-            if request.user != ticket.user and request.user.role != 'admin' and not request.user.is_staff:
+            if request.user != ticket.user and not is_support_admin(request.user):
                  return Response({'error': 'Unauthorized'}, status=status.HTTP_403_FORBIDDEN)
             
             message_text = request.data.get('message')
             if not message_text:
                 return Response({'error': 'Message required'}, status=status.HTTP_400_BAD_REQUEST)
 
-            is_admin = request.user.role == 'admin' or request.user.is_staff
-
-            TicketMessage.objects.create(
-                ticket=ticket,
-                sender=request.user,
-                message=message_text,
-                is_admin_reply=is_admin
-            )
-            
-            # Update ticket timestamp
-            ticket.save() 
+            is_admin = is_support_admin(request.user)
+
+            with transaction.atomic():
+                message = TicketMessage.objects.create(
+                    ticket=ticket,
+                    sender=request.user,
+                    message=message_text,
+                    is_admin_reply=is_admin
+                )
+
+                # Update ticket timestamp and inbox fields; F() so concurrent
+                # replies don't lose counts. Replying means the sender has
+                # read the thread, so their own side is cleared.
+                unread, read = ('unread_by_user', 'unread_by_admin') if is_admin else ('unread_by_admin', 'unread_by_user')
+                SupportTicket.objects.filter(pk=ticket.pk).update(
+                    updated_at=timezone.now(),
+                    last_message_at=message.created_at,
+                    last_message_preview=message_preview(message_text),
+                    message_count=F('message_count') + 1,
+                    **{unread: F(unread) + 1, read: 0},
+                )
+                # Push to open ticket/inbox streams once the row is visible
+                transaction.on_commit(lambda: publish_ticket_message(message))
             
             return Response({'status': 'Message sent'}, status=status.HTTP_201_CREATED)
         except SupportTicket.DoesNotExist:
             return Response({'error': 'Ticket not found'}, status=status.HTTP_404_NOT_FOUND)
 
+class TicketMessageListView(generics.ListAPIView):
+    """
+    A ticket's messages, newest first, cursor-paginated. Reading them marks
+    the ticket read for the viewer's side.
+    """
+    serializer_class = TicketMessageSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = TicketMessagePagination
+
+    def get_queryset(self):
+        return TicketMessage.objects.filter(ticket_id=self.ticket.pk).select_related('sender')
+
+    def list(self, request, pk):
+        try:
+            self.ticket = SupportTicket.objects.get(pk=pk)
+        except SupportTicket.DoesNotExist:
+            return Response({'error': 'Ticket not found'}, status=status.HTTP_404_NOT_FOUND)
+        is_admin = is_support_admin(request.user)
+        if request.user != self.ticket.user and not is_admin:
+            return Response({'error': 'Unauthorized'}, status=status.HTTP_403_FORBIDDEN)
+
+        response = super().list(request, pk)
+        unread = 'unread_by_admin' if is_admin else 'unread_by_user'
+        if getattr(self.ticket, unread):
+            SupportTicket.objects.filter(pk=self.ticket.pk).update(**{unread: 0})
+        return response
 
 
@@ -29,6 +29,81 @@ api.interceptors.response.use(
     }
 );
 
+// List endpoints are cursor-paginated: { next, previous, results }
+export const pageResults = (res) => res.data.results ?? res.data;
+
+// Follow `next` links until every row is loaded (small per-user lists)
+export const fetchAllPages = async (url) => {
+    let res = await api.get(url);
+    let rows = pageResults(res);
+    while (res.data.next) {
+        res = await api.get(res.data.next);
+        rows = rows.concat(res.data.results);
+    }
+    return rows;
+};
+
+// Server-Sent Events stream from the API. EventSource can't send headers, so
+// each connection is opened with a short-lived stream token (never the access
+// token) in the query string. EventSource retries dropped connections itself
+// but gives up on an error response, e.g. once that token has expired; the
+// stream then reopens with a fresh token, resuming after the last event.
+// Streams need the ASGI server; under runserver they fail with 503 and
+// callers fall back to refetching.
+const STREAM_REOPEN_MS = 3000;
+
+export const openEventStream = (path, params = {}) => {
+    const listeners = [];
+    let source = null;
+    let closed = false;
+    let lastEventId = params.last_event_id;
+
+    const connect = async () => {
+        let token;
+        try {
+            token = (await api.post("/support/stream-token/")).data.token;
+        } catch (error) {
+            console.error("Failed to open live updates", error);
+            return;
+        }
+        if (closed) return;
+
+        const url = new URL(`${api.defaults.baseURL}${path}`, window.location.origin);
+        url.searchParams.set("stream_token", token);
+        Object.entries({ ...params, last_event_id: lastEventId }).forEach(([key, value]) => {
+            if (value !== undefined && value !== null) url.searchParams.set(key, value);
+        });
+
+        const current = new EventSource(url);
+        let opened = false;
+        current.addEventListener("open", () => { opened = true; });
+        current.addEventListener("message", (e) => { lastEventId = e.lastEventId || lastEventId; });
+        listeners.forEach(([type, listener]) => current.addEventListener(type, listener));
+        current.addEventListener("error", () => {
+            // Only reopen streams that worked, so a 503 doesn't retry forever
+            if (opened && !closed && current.readyState === EventSource.CLOSED) {
+                setTimeout(connect, STREAM_REOPEN_MS);
+            }
+        });
+        source = current;
+    };
+    connect();
+
+    return {
+        addEventListener(type, listener) {
+            listeners.push([type, listener]);
+            source?.addEventListener(type, listener);
+        },
+        close() {
+            closed = true;
+            source?.close();
+        },
+        get readyState() {
+            return source ? source.readyState : EventSource.CONNECTING;
+        },
+    };
+};
+
 export const login = (credentials) => api.post("/token/", credentials);
 export const register = (userData) => api.post("/register/", userData);
 export const googleLogin = (token) => api.post("/google-login/", { token });
@@ -1,5 +1,5 @@
 import { useState, useEffect } from "react";
-import api from "../api";
+import api, { fetchAllPages } from "../api";
 
 function CertificationSection() {
     const [certifications, setCertifications] = useState([]);
@@ -19,8 +19,7 @@ function CertificationSection() {
 
     const fetchCertifications = async () => {
         try {
-            const res = await api.get("/certifications/");
-            setCertifications(res.data);
+            setCertifications(await fetchAllPages("/certifications/"));
         } catch (error) {
             console.error(error);
         }
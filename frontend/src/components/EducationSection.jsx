@@ -1,5 +1,5 @@
 import { useState, useEffect } from "react";
-import api from "../api";
+import api, { fetchAllPages } from "../api";
 
 function EducationSection() {
     const [educations, setEducations] = useState([]);
@@ -19,8 +19,7 @@ function EducationSection() {
 
     const fetchEducations = async () => {
         try {
-            const res = await api.get("/education/");
-            setEducations(res.data);
+            setEducations(await fetchAllPages("/education/"));
         } catch (error) {
             console.error(error);
         }
@@ -1,5 +1,5 @@
 import { useState, useEffect } from "react";
-import api from "../api";
+import api, { fetchAllPages } from "../api";
 
 function JobHistorySection() {
     const [jobs, setJobs] = useState([]);
@@ -18,8 +18,7 @@ function JobHistorySection() {
 
     const fetchJobs = async () => {
         try {
-            const res = await api.get("/job-history/");
-            setJobs(res.data);
+            setJobs(await fetchAllPages("/job-history/"));
         } catch (error) {
             console.error(error);
         }
@@ -1,5 +1,5 @@
 import { useState, useEffect } from "react";
-import api from "../api";
+import api, { fetchAllPages } from "../api";
 
 function SkillsSection() {
     const [skills, setSkills] = useState([]);
@@ -15,8 +15,7 @@ function SkillsSection() {
 
     const fetchSkills = async () => {
         try {
-            const res = await api.get("/skills/");
-            setSkills(res.data);
+            setSkills(await fetchAllPages("/skills/"));
         } catch (error) {
             console.error(error);
         }
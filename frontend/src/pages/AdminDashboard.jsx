@@ -1,5 +1,5 @@
 import { useState, useEffect } from "react";
-import api from "../api";
+import api, { pageResults, openEventStream } from "../api";
 import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer } from 'recharts';
 import { FaChartLine, FaUsers, FaTicketAlt, FaServer, FaCommentDots } from "react-icons/fa";
 
@@ -7,23 +7,49 @@ function AdminDashboard() {
     const [users, setUsers] = useState([]);
     const [stats, setStats] = useState(null);
     const [tickets, setTickets] = useState([]);
+    // Cursor links for the next page of users / tickets (null when all loaded)
+    const [usersNext, setUsersNext] = useState(null);
+    const [ticketsNext, setTicketsNext] = useState(null);
     const [loading, setLoading] = useState(true);
     const [activeTab, setActiveTab] = useState("overview");
 
     useEffect(() => {
         fetchData();
+
+        // Live inbox: bump the ticket row whenever a message arrives
+        const stream = openEventStream("/support/inbox/stream/");
+        stream.addEventListener("message", (e) => {
+            const msg = JSON.parse(e.data);
+            setTickets(current => current.map(t => t.id === msg.ticket ? {
+                ...t,
+                last_message_at: msg.created_at,
+                last_message_preview: msg.message,
+                updated_at: msg.created_at,
+                message_count: (t.message_count || 0) + 1,
+                unread_by_admin: msg.is_admin_reply ? 0 : (t.unread_by_admin || 0) + 1
+            } : t));
+        });
+        return () => stream.close();
     }, []);
 
     const fetchData = async () => {
         try {
-            const [usersRes, statsRes, ticketsRes] = await Promise.all([
+            const [usersRes, statsRes, ticketsRes, flaggedRes] = await Promise.all([
                 api.get("/users/"),
                 api.get("/admin/stats/"),
-                api.get("/support/tickets/")
+                api.get("/support/tickets/?view=summary"),
+                api.get("/admin/flagged-predictions/")
             ]);
-            setUsers(usersRes.data);
-            setStats(statsRes.data);
-            setTickets(ticketsRes.data);
+            setUsers(pageResults(usersRes));
+            setUsersNext(usersRes.data.next ?? null);
+            // Flagged list is paged separately; "Load more" follows flagged_next
+            setStats({
+                ...statsRes.data,
+                flagged_predictions: flaggedRes.data.results,
+                flagged_next: flaggedRes.data.next
+            });
+            setTickets(pageResults(ticketsRes));
+            setTicketsNext(ticketsRes.data.next ?? null);
         } catch (error) {
             console.error("Failed to fetch admin data", error);
         } finally {
@@ -31,6 +57,31 @@ function AdminDashboard() {
         }
     };
 
+    const loadMore = async (next, rows, setRows, setNext) => {
+        try {
+            const res = await api.get(next);
+            const seen = new Set(rows.map(r => r.id));
+            setRows([...rows, ...res.data.results.filter(r => !seen.has(r.id))]);
+            setNext(res.data.next);
+        } catch (error) {
+            console.error(error);
+        }
+    };
+
+    const handleLoadMoreFlagged = async () => {
+        try {
+            const res = await api.get(stats.flagged_next);
+            const seen = new Set(stats.flagged_predictions.map(p => p.id));
+            setStats({
+                ...stats,
+                flagged_predictions: [...stats.flagged_predictions, ...res.data.results.filter(p => !seen.has(p.id))],
+                flagged_next: res.data.next
+            });
+        } catch (error) {
+            console.error(error);
+        }
+    };
+
     const handleDeleteUser = async (id) => {
         if (window.confirm("Are you sure you want to delete this user?")) {
             try {
@@ -74,12 +125,12 @@ function AdminDashboard() {
 
         try {
             setLoading(true);
-            await api.post("/admin/upload-data/", formData, {
+            const res = await api.post("/admin/upload-data/", formData, {
                 headers: {
                     "Content-Type": "multipart/form-data",
                 },
             });
-            alert("Training data updated and model retrained!");
+            alert(res.data.message || "Training data updated and model retraining started!");
             fetchData(); // Refresh data/stats if needed
         } catch (error) {
             console.error("Upload failed", error);
@@ -96,7 +147,8 @@ function AdminDashboard() {
 
             // Check current status in prediction_logs
             const currentLog = stats.prediction_logs.find(p => p.id === id);
-            const isCurrentlyFlagged = currentLog ? currentLog.is_flagged : false; // Fallback if not in recent list
+            // Older flagged items are only in the flagged list
+            const isCurrentlyFlagged = currentLog ? currentLog.is_flagged : stats.flagged_predictions.some(p => p.id === id);
 
             // Update prediction_logs state
             const updatedLogs = stats.prediction_logs.map(p =>
@@ -104,6 +156,7 @@ function AdminDashboard() {
             );
 
             let updatedFlaggedList = [...stats.flagged_predictions];
+            let flaggedCount = stats.flagged_count;
 
             if (!isCurrentlyFlagged) {
                 // It wasn't flagged, so now it IS flagged. Add to flagged list if not already there.
@@ -112,15 +165,18 @@ function AdminDashboard() {
                 if (newItem && !updatedFlaggedList.find(f => f.id === id)) {
                     updatedFlaggedList.unshift(newItem);
                 }
+                flaggedCount += 1;
             } else {
                 // It WAS flagged, so now unflag. Remove from flagged list.
                 updatedFlaggedList = updatedFlaggedList.filter(p => p.id !== id);
+                flaggedCount -= 1;
             }
 
             setStats({
                 ...stats,
                 prediction_logs: updatedLogs,
-                flagged_predictions: updatedFlaggedList
+                flagged_predictions: updatedFlaggedList,
+                flagged_count: flaggedCount
             });
         } catch (error) {
             console.error(error);
@@ -146,8 +202,10 @@ function AdminDashboard() {
         if (window.confirm("Permanently delete this prediction log?")) {
             try {
                 await api.delete(`/prediction-delete/${id}/`);
+                const wasFlagged = stats.flagged_predictions.some(p => p.id === id);
                 setStats({
                     ...stats,
+                    flagged_count: stats.flagged_count - (wasFlagged ? 1 : 0),
                     prediction_logs: stats.prediction_logs.filter(p => p.id !== id),
                     flagged_predictions: stats.flagged_predictions.filter(p => p.id !== id)
                 });
@@ -297,7 +355,7 @@ function AdminDashboard() {
                                         <div className="bg-white p-6 rounded-xl shadow-sm border border-gray-200 hover:shadow-md transition">
                                             <h3 className="text-gray-500 text-sm font-medium uppercase tracking-wider">Flagged Predictions</h3>
                                             <div className="flex items-end justify-between mt-2">
-                                                <p className="text-4xl font-bold text-red-600">{stats?.flagged_predictions?.length || 0}</p>
+                                                <p className="text-4xl font-bold text-red-600">{stats?.flagged_count ?? 0}</p>
                                                 <div className="p-2 bg-red-50 text-red-600 rounded-lg">
                                                     <FaTicketAlt size={24} />
                                                 </div>
@@ -417,6 +475,11 @@ function AdminDashboard() {
                                             </tbody>
                                         </table>
                                     </div>
+                                    {usersNext && (
+                                        <button onClick={() => loadMore(usersNext, users, setUsers, setUsersNext)} className="mt-4 text-sm text-indigo-600 font-medium hover:underline">
+                                            Load more users
+                                        </button>
+                                    )}
                                 </div>
                             )}
 
@@ -439,7 +502,17 @@ function AdminDashboard() {
                                                 {tickets.map(ticket => (
                                                     <tr key={ticket.id} className="hover:bg-gray-50">
                                                         <td className="px-6 py-4 text-gray-900 font-medium">{ticket.user_username}</td>
-                                                        <td className="px-6 py-4 text-sm max-w-xs truncate">{ticket.subject}</td>
+                                                        <td className="px-6 py-4 text-sm max-w-xs">
+                                                            <div className="truncate">
+                                                                {ticket.subject}
+                                                                {ticket.unread_by_admin > 0 && (
+                                                                    <span className="ml-2 text-[10px] bg-red-100 text-red-700 rounded-full px-2 py-0.5">{ticket.unread_by_admin} new</span>
+                                                                )}
+                                                            </div>
+                                                            {ticket.last_message_preview && (
+                                                                <div className="text-xs text-gray-400 truncate">{ticket.last_message_preview}</div>
+                                                            )}
+                                                        </td>
                                                         <td className="px-6 py-4">
                                                             <span className={`px-2 py-1 rounded text-xs font-bold ${ticket.is_resolved ? 'bg-green-100 text-green-800' : 'bg-yellow-100 text-yellow-800'}`}>
                                                                 {ticket.is_resolved ? 'Resolved' : 'Open'}
@@ -458,6 +531,11 @@ function AdminDashboard() {
                                             </tbody>
                                         </table>
                                     </div>
+                                    {ticketsNext && (
+                                        <button onClick={() => loadMore(ticketsNext, tickets, setTickets, setTicketsNext)} className="mt-4 text-sm text-indigo-600 font-medium hover:underline">
+                                            Load more tickets
+                                        </button>
+                                    )}
                                 </div>
                             )}
 
@@ -520,6 +598,11 @@ function AdminDashboard() {
                                                     </tbody>
                                                 </table>
                                             </div>
+                                            {stats.flagged_next && (
+                                                <button onClick={handleLoadMoreFlagged} className="mt-3 text-sm text-red-700 hover:underline">
+                                                    Load more ({stats.flagged_predictions.length} of {stats.flagged_count})
+                                                </button>
+                                            )}
                                         </div>
                                     )}
 
@@ -1,7 +1,7 @@
 import { useContext, useEffect, useState } from "react";
 import { AuthContext } from "../context/AuthContext";
 import { Link } from "react-router-dom";
-import api from "../api";
+import api, { fetchAllPages } from "../api";
 import { LineChart, Line, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer } from 'recharts';
 import Skeleton from "../components/Skeleton";
 
@@ -27,7 +27,7 @@ function Dashboard() {
             // which might not be in the token or might be stale
             const [predRes, histRes, profileRes] = await Promise.all([
                 api.get("/predict-career/"),
-                api.get("/prediction-history/"),
+                fetchAllPages("/prediction-history/"),
                 api.get("/profile/")
             ]);
 
@@ -37,10 +37,10 @@ function Dashboard() {
                 setPredictions([]);
             }
 
-            if (Array.isArray(histRes.data)) {
+            if (Array.isArray(histRes)) {
                 // Process history for graph (e.g., average match score over time)
                 // Or just plot the top role's match percentage
-                const processedHistory = histRes.data
+                const processedHistory = histRes
                     .sort((a, b) => new Date(a.created_at) - new Date(b.created_at))
                     .map(item => ({
                         date: new Date(item.created_at).toLocaleDateString(),
@@ -1,5 +1,5 @@
 import { useState, useEffect } from "react";
-import api from "../api";
+import api, { fetchAllPages } from "../api";
 import { Link } from "react-router-dom";
 import { FaArrowLeft, FaTrash } from "react-icons/fa";
 
@@ -13,8 +13,7 @@ function PredictionHistory() {
 
     const fetchHistory = async () => {
         try {
-            const res = await api.get("/prediction-history/");
-            setHistory(res.data);
+            setHistory(await fetchAllPages("/prediction-history/"));
         } catch (error) {
             console.error("Failed to fetch history", error);
         } finally {
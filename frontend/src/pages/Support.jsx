@@ -1,5 +1,5 @@
 import { useState, useEffect, useRef } from 'react';
-import api from '../api';
+import api, { fetchAllPages, openEventStream } from '../api';
 import { useNavigate } from 'react-router-dom';
 
 function Support() {
@@ -9,6 +9,9 @@ function Support() {
     const [newMessage, setNewMessage] = useState("");
     const [loading, setLoading] = useState(true);
     const messagesEndRef = useRef(null);
+    const streamRef = useRef(null);
+    // Id of the ticket on screen, so late responses for another one are dropped
+    const activeTicketRef = useRef(null);
     const navigate = useNavigate();
 
     useEffect(() => {
@@ -16,12 +19,47 @@ function Support() {
     }, []);
 
     useEffect(() => {
+        activeTicketRef.current = selectedTicket?.id ?? null;
+        // Switching tickets (or leaving the page) cancels an open still
+        // waiting on the network, so it can't attach a stream afterwards
+        const conversation = { cancelled: false };
         if (selectedTicket) {
-            // Load messages for this ticket from the selected ticket object (or refetch if needed)
-            // The serializer includes 'messages' array
-            setMessages(selectedTicket.messages || []);
+            openConversation(selectedTicket.id, conversation);
         }
-    }, [selectedTicket]);
+        return () => {
+            conversation.cancelled = true;
+            streamRef.current?.close();
+            streamRef.current = null;
+        };
+    }, [selectedTicket?.id]);
+
+    // Load the history, then stream new messages from after the newest one
+    const openConversation = async (ticketId, conversation) => {
+        const lastId = await fetchMessages(ticketId);
+        if (conversation.cancelled) return;
+        const stream = openEventStream(`/support/tickets/${ticketId}/stream/`, { last_event_id: lastId });
+        stream.addEventListener("message", (e) => {
+            const msg = JSON.parse(e.data);
+            setMessages(current => current.some(m => m.id === msg.id) ? current : [...current, msg]);
+        });
+        streamRef.current?.close();
+        streamRef.current = stream;
+    };
+
+    // Messages come newest first from their own paginated endpoint; reading
+    // them also clears the ticket's unread count on the server
+    const fetchMessages = async (ticketId) => {
+        try {
+            const rows = await fetchAllPages(`/support/tickets/${ticketId}/messages/`);
+            setTickets(current => current.map(t => t.id === ticketId ? { ...t, unread_by_user: 0 } : t));
+            if (activeTicketRef.current !== ticketId) return undefined;
+            setMessages([...rows].reverse());
+            return rows.length > 0 ? rows[0].id : 0;
+        } catch (error) {
+            console.error("Failed to fetch messages", error);
+            return undefined;
+        }
+    };
 
     useEffect(() => {
         scrollToBottom();
@@ -33,11 +71,12 @@ function Support() {
 
     const fetchTickets = async () => {
         try {
-            const res = await api.get('/support/tickets/');
-            setTickets(res.data);
-            if (res.data.length > 0) {
+            // Summary rows: ticket headers with last message and unread count
+            const rows = await fetchAllPages('/support/tickets/?view=summary');
+            setTickets(rows);
+            if (rows.length > 0) {
                 // Auto-select the most recent ticket
-                setSelectedTicket(res.data[0]);
+                setSelectedTicket(rows[0]);
             }
             setLoading(false);
         } catch (error) {
@@ -80,12 +119,10 @@ function Support() {
                 created_at: new Date().toISOString()
             };
 
-            // Refetch to be safe and get consistent data
-            const ticketRes = await api.get(`/support/tickets/${selectedTicket.id}/`);
-            // NOTE: The Detail View might need to be implemented or we just use list.
-            // Wait, ModelViewSet provides Retrieve.
-
-            setMessages(ticketRes.data.messages);
+            // A live stream delivers the new message; otherwise refetch
+            if (streamRef.current?.readyState !== EventSource.OPEN) {
+                await fetchMessages(selectedTicket.id);
+            }
             setNewMessage("");
         } catch (error) {
             alert("Failed to send message");
@@ -120,7 +157,15 @@ function Support() {
                                     onClick={() => setSelectedTicket(ticket)}
                                     className={`p-4 border-b border-gray-100 cursor-pointer transition hover:bg-gray-100 ${selectedTicket?.id === ticket.id ? 'bg-white border-l-4 border-l-indigo-500 shadow-sm' : ''}`}
                                 >
-                                    <h3 className="font-medium text-gray-800 text-sm truncate">{ticket.subject}</h3>
+                                    <div className="flex justify-between items-center gap-2">
+                                        <h3 className="font-medium text-gray-800 text-sm truncate">{ticket.subject}</h3>
+                                        {ticket.unread_by_user > 0 && (
+                                            <span className="text-[10px] bg-indigo-600 text-white rounded-full px-2 py-0.5">{ticket.unread_by_user}</span>
+                                        )}
+                                    </div>
+                                    {ticket.last_message_preview && (
+                                        <p className="text-xs text-gray-500 truncate mt-0.5">{ticket.last_message_preview}</p>
+                                    )}
                                     <div className="flex justify-between mt-1">
                                         <span className={`text-xs px-2 py-0.5 rounded-full ${ticket.is_resolved ? 'bg-green-100 text-green-700' : 'bg-yellow-100 text-yellow-700'}`}>
                                             {ticket.is_resolved ? 'Resolved' : 'Open'}